@@ -0,0 +1,9 @@
+"""Benchmarks of Flask MVC on large synthetic applications.
+
+Run them from the repository root::
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json
+
+See ``benchmarks/README.md`` for what is measured.
+"""
@@ -0,0 +1,52 @@
+"""Cold boot measurement, run in a fresh interpreter by the suite.
+
+Usage: ``python -m benchmarks.boot DIRECTORY PACKAGE [--memory]``. Prints a JSON
+object with the boot time and the routes count. Tracing memory slows the boot
+down, so it is measured in its own run, with ``--memory``, which also records
+the boot phases.
+"""
+
+import json
+import resource
+import sys
+import time
+import tracemalloc
+
+
+def measure(directory: str, package: str, memory: bool = False) -> dict:
+    """Boot the application once, from cold imports.
+
+    Args:
+        directory: The directory holding the package.
+        package: The package of the application.
+        memory: Whether to trace the memory allocated while booting.
+
+    Returns:
+        The boot time in seconds and the number of routes. With memory, the peak
+        memory traced while booting, the maximum resident set size of the process
+        and the time of each boot phase too.
+    """
+    sys.path.insert(0, directory)
+    from flask import Flask
+
+    from flask_mvc import FlaskMVC
+
+    app = Flask(package)
+    app.config["FLASK_MVC_PROFILE_BOOT"] = memory
+
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    mvc = FlaskMVC(app, path=package)
+    result = {"seconds": time.perf_counter() - started, "routes": len(mvc.routes)}
+
+    if memory:
+        result["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+        result["max_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result["phases"] = mvc.boot_profile["phases"]
+        tracemalloc.stop()
+    return result
+
+
+if __name__ == "__main__":
+    print(json.dumps(measure(sys.argv[1], sys.argv[2], "--memory" in sys.argv[3:])))
@@ -0,0 +1,321 @@
+"""The benchmark suite: boot, dispatch and method override on synthetic apps.
+
+For each size, a synthetic application is generated (see ``synthetic``) and:
+
+- ``boot``: booted from cold imports in fresh interpreters (``cold_seconds``,
+  the median of the repeats), once more with memory tracing
+  (``peak_traced_bytes``, ``max_rss_kib`` and the boot ``phases``), and booted
+  again in-process once its modules are imported (``warm_seconds``).
+- ``dispatch``: requests to a ``show`` action are sent straight to the WSGI
+  application, without and with before/after callbacks, and to a plain Flask
+  application with the same URL rules (``flask_us``), in microseconds per
+  request, the best of the repeats.
+- ``method_override``: the same ``update`` action reached with a PUT request,
+  and with POST requests overridden by a urlencoded field, a multipart field
+  or the ``X-HTTP-Method-Override`` header.
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import version
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from .synthetic import SyntheticApp, generate
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def per_request(wsgi_app, environ: Callable[[], dict], requests: int, repeat: int):
+    """Return the best time per request over the repeats, in microseconds.
+
+    Args:
+        wsgi_app: The WSGI application.
+        environ: Returns the WSGI environ of a new request.
+        requests: The number of requests of each repeat.
+        repeat: The number of repeats.
+    """
+
+    def start_response(status, headers, exc_info=None):
+        pass
+
+    def send():
+        body = wsgi_app(environ(), start_response)
+        for _ in body:
+            pass
+        if hasattr(body, "close"):
+            body.close()
+
+    # Warm up the caches (route matching, imports, templates) first
+    for _ in range(min(requests, 100)):
+        send()
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(requests):
+            send()
+        best = min(best, (time.perf_counter() - started) / requests)
+    return best * 1e6
+
+
+def request(method: str, path: str, body: bytes = b"", **headers) -> Callable:
+    """Return a factory of WSGI environs for the same request.
+
+    Args:
+        method: The HTTP method.
+        path: The path.
+        body: The request body.
+        **headers: CGI-style variables, e.g. CONTENT_TYPE or HTTP_ACCEPT.
+    """
+    from werkzeug.test import EnvironBuilder
+
+    base = EnvironBuilder(path=path, method=method).get_environ()
+    base.update(headers)
+    base["CONTENT_LENGTH"] = str(len(body))
+
+    def environ():
+        current = dict(base)
+        current["wsgi.input"] = io.BytesIO(body)
+        return current
+
+    return environ
+
+
+def cold_boot(app: SyntheticApp, memory: bool = False) -> dict:
+    """Boot an application in a fresh interpreter, see ``benchmarks.boot``."""
+    command = [sys.executable, "-m", "benchmarks.boot", str(app.directory), app.package]
+    if memory:
+        command.append("--memory")
+    output = subprocess.run(
+        command, cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def bench_boot(app: SyntheticApp, repeat: int):
+    from flask import Flask
+
+    from flask_mvc import FlaskMVC
+
+    cold = [cold_boot(app)["seconds"] for _ in range(repeat)]
+    traced = cold_boot(app, memory=True)
+
+    warm = []
+    for _ in range(repeat):
+        flask_app = Flask(app.package)
+        started = time.perf_counter()
+        mvc = FlaskMVC(flask_app, path=app.package)
+        warm.append(time.perf_counter() - started)
+
+    result = {
+        "cold_seconds": statistics.median(cold),
+        "warm_seconds": statistics.median(warm),
+        "peak_traced_bytes": traced["peak_traced_bytes"],
+        "max_rss_kib": traced["max_rss_kib"],
+        "phases": traced["phases"],
+    }
+    return result, flask_app, mvc
+
+
+def baseline_app(routes):
+    """Return a plain Flask application with the URL rules of the routes."""
+    from flask import Flask
+
+    app = Flask("baseline")
+
+    def view(**kwargs):
+        return "ok"
+
+    for route in routes:
+        app.add_url_rule(route.path, route.endpoint, view, methods=route.methods)
+    return app
+
+
+def bench_dispatch(app: SyntheticApp, flask_app, mvc, requests: int, repeat: int):
+    baseline = baseline_app(mvc.routes)
+    plain = request("GET", app.plain_path)
+    callbacks = request("GET", app.callbacks_path)
+
+    result = {
+        "flask_us": per_request(baseline.wsgi_app, plain, requests, repeat),
+        "plain_us": per_request(flask_app.wsgi_app, plain, requests, repeat),
+        "callbacks_us": per_request(flask_app.wsgi_app, callbacks, requests, repeat),
+    }
+    result["overhead_us"] = result["plain_us"] - result["flask_us"]
+    return result
+
+
+def bench_method_override(app: SyntheticApp, flask_app, requests: int, repeat: int):
+    path = app.plain_path
+    field = b"title=" + b"x" * 64
+    multipart = (
+        b'--b\r\nContent-Disposition: form-data; name="_method"\r\n\r\nPUT\r\n'
+        b'--b\r\nContent-Disposition: form-data; name="title"\r\n\r\n'
+        + b"x" * 64
+        + b"\r\n--b--\r\n"
+    )
+    urlencoded = "application/x-www-form-urlencoded"
+    environs = {
+        "put_us": request("PUT", path, field, CONTENT_TYPE=urlencoded),
+        "urlencoded_us": request(
+            "POST", path, b"_method=PUT&" + field, CONTENT_TYPE=urlencoded
+        ),
+        "multipart_us": request(
+            "POST", path, multipart, CONTENT_TYPE="multipart/form-data; boundary=b"
+        ),
+        "header_us": request(
+            "POST",
+            path,
+            field,
+            CONTENT_TYPE=urlencoded,
+            HTTP_X_HTTP_METHOD_OVERRIDE="PUT",
+        ),
+    }
+    return {
+        name: per_request(flask_app.wsgi_app, environ, requests, repeat)
+        for name, environ in environs.items()
+    }
+
+
+def run(sizes, requests: int, repeat: int, log=print) -> dict:
+    """Run the suite.
+
+    Args:
+        sizes: The numbers of routes of the synthetic applications.
+        requests: The number of requests of each dispatch measurement.
+        repeat: The number of repeats of each measurement.
+        log: Receives progress messages.
+
+    Returns:
+        The environment, the settings and the results of each size.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="flask_mvc_bench_") as directory:
+        sys.path.insert(0, directory)
+        try:
+            for size in sizes:
+                log(f"{size} routes...")
+                app = generate(directory, size)
+                boot, flask_app, mvc = bench_boot(app, repeat)
+                results.append(
+                    {
+                        "size": size,
+                        "routes": len(mvc.routes),
+                        "controllers": len(app.controllers),
+                        "boot": boot,
+                        "dispatch": bench_dispatch(
+                            app, flask_app, mvc, requests, repeat
+                        ),
+                        "method_override": bench_method_override(
+                            app, flask_app, requests, repeat
+                        ),
+                    }
+                )
+        finally:
+            sys.path.remove(directory)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "flask": version("flask"),
+            "flask_mvc": _flask_mvc_version(),
+        },
+        "settings": {"sizes": list(sizes), "requests": requests, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """List the measurements slower than the baseline beyond the tolerance.
+
+    Only sizes measured in both runs are compared.
+
+    Args:
+        current: The results of this run.
+        baseline: The results of a previous run.
+        tolerance: The accepted slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        A description of each regression.
+    """
+    previous = {result["size"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get(result["size"])
+        if before is None:
+            continue
+        for section in ("boot", "dispatch", "method_override"):
+            for name, value in result[section].items():
+                old = before.get(section, {}).get(name)
+                if not isinstance(value, (int, float)) or not isinstance(
+                    old, (int, float)
+                ):
+                    continue
+                if old > 0 and value > old * (1 + tolerance):
+                    regressions.append(
+                        f"{result['size']} routes: {section}.{name} "
+                        f"{old:.6g} -> {value:.6g} (+{(value / old - 1):.0%})"
+                    )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Numbers of routes of the synthetic applications",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Requests per measurement"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Repeats per measurement")
+    parser.add_argument("--output", "-o", help="Write the JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Accepted slowdown against --compare (default: 0.2 for 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.requests, args.repeat, log=_log)
+    data = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(data + "\n")
+    else:
+        print(data)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            _log(f"regression: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def _flask_mvc_version() -> str:
+    from flask_mvc.__version__ import __version__
+
+    return __version__
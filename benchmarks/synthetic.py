@@ -0,0 +1,113 @@
+"""Generation of synthetic Flask MVC applications of any size.
+
+An application is a package written to disk, as the ones Flask MVC loads: a
+``routes.py`` declaring the routes with ``Router.namespace`` and ``Router.all``,
+and one module per controller in ``controllers/``. Every controller has the
+seven actions of ``Router.all``; every other one also declares before and after
+request callbacks, so dispatch can be measured with and without callbacks.
+"""
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+ACTIONS_PER_CONTROLLER = 7
+
+CONTROLLER = """class {class_name}:
+{callbacks}
+    def index(self):
+        return "index"
+
+    def new(self):
+        return "new"
+
+    def create(self):
+        return "created", 201
+
+    def show(self, id):
+        return id
+
+    def edit(self, id):
+        return id
+
+    def update(self, id):
+        return id
+
+    def delete(self, id):
+        return id
+
+    def load(self):
+        self.loaded = True
+
+    def stamp(self, response):
+        response.headers["X-Stamp"] = "1"
+        return response
+"""
+
+CALLBACKS = """    before_request = dict(callback="load", actions="show update")
+    after_request = dict(callback="stamp", actions="show update")
+"""
+
+
+@dataclass
+class SyntheticApp:
+    """A generated application.
+
+    Attributes:
+        package: The dotted name of the package, to give to FlaskMVC as ``path``.
+        directory: The directory to add to ``sys.path`` to import the package.
+        controllers: The controller names.
+        plain_path: The path of a ``show`` action without callbacks.
+        callbacks_path: The path of a ``show`` action with callbacks.
+    """
+
+    package: str
+    directory: Path
+    controllers: List[str]
+    plain_path: str
+    callbacks_path: str
+
+
+def generate(directory, routes: int, namespace_size: int = 10) -> SyntheticApp:
+    """Write an application with about the given number of routes.
+
+    Args:
+        directory: Where the package is written.
+        routes: The number of routes, rounded up to a multiple of the actions of a
+            controller, with at least two controllers.
+        namespace_size: The number of controllers in each namespace.
+
+    Returns:
+        The generated application.
+    """
+    count = max(2, math.ceil(routes / ACTIONS_PER_CONTROLLER))
+    package = f"synthetic_{routes}"
+    root = Path(directory) / package
+    (root / "controllers").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "controllers" / "__init__.py").write_text("")
+
+    controllers = [f"resource{index}" for index in range(count)]
+    lines = ["from flask_mvc import Router", ""]
+    for index, name in enumerate(controllers):
+        callbacks = CALLBACKS if index % 2 else ""
+        (root / "controllers" / f"{name}_controller.py").write_text(
+            CONTROLLER.format(
+                class_name=f"{name.title()}Controller", callbacks=callbacks
+            )
+        )
+
+        if index % namespace_size == 0:
+            namespace = index // namespace_size
+            lines.append(f'ns{namespace} = Router.namespace("/ns{namespace}")')
+        lines.append(f'ns{index // namespace_size}.all("{name}")')
+    (root / "routes.py").write_text("\n".join(lines) + "\n")
+
+    return SyntheticApp(
+        package=package,
+        directory=Path(directory),
+        controllers=controllers,
+        plain_path="/ns0/resource0/1",
+        callbacks_path="/ns0/resource1/1",
+    )
@@ -1,3 +1,4 @@
 from .flask_mvc import FlaskMVC, Router
+from .helpers.html.stream_render_helper import stream_render
 
-__all__ = ["FlaskMVC", "Router"]
+__all__ = ["FlaskMVC", "Router", "stream_render"]
@@ -4,12 +4,19 @@ This module provides command-line tools for scaffolding MVC components
 following Flask and Python best practices.
 """
 
+import json
 import logging
-from typing import Optional
+import os
+import subprocess  # nosec B404
+import sys
+from typing import Any, Dict, Optional
 
 import click
+from flask import current_app
 from flask.cli import with_appcontext
 
+from .core import load_test
+from .core.boot_profiler import PROFILE_BOOT_ENV
 from .core.config import CLIConfig
 from .core.exceptions import (
     ControllerGenerationError,
@@ -107,6 +114,308 @@ def controller(name: str, path: str, force: bool) -> None:
         raise click.Abort() from e
 
 
+@mvc.group()
+def routes():
+    """Manage the route manifest."""
+    pass
+
+
+@routes.command("compile")
+@click.option(
+    "--output",
+    "-o",
+    default=None,
+    help="Path of the manifest file (defaults to the manifest given to FlaskMVC)",
+)
+@with_appcontext
+def compile_routes(output: Optional[str]) -> None:
+    """Compile the routes into a manifest file.
+
+    The manifest records the resolved routes, endpoints, methods and callback
+    bindings, so FlaskMVC(app, manifest=...) can boot without evaluating routes.py.
+
+    Examples:
+        \b
+        flask mvc routes compile
+        flask mvc routes compile --output build/routes.manifest.json
+    """
+    try:
+        manifest_file = current_app.extensions["flask_mvc"].compile_manifest(output)
+    except Exception as e:
+        logger.exception(f"Route manifest compilation failed: {e}")
+        click.echo(click.style(f"✗ Error: {e}", fg=CLIConfig.ERROR_COLOR), err=True)
+        raise click.Abort() from e
+
+    click.echo(
+        click.style(
+            f"✓ Route manifest written to {manifest_file}",
+            fg=CLIConfig.SUCCESS_COLOR,
+        )
+    )
+
+
+@mvc.group()
+def views():
+    """Manage the views."""
+    pass
+
+
+@views.command("compile")
+@with_appcontext
+def compile_views() -> None:
+    """Compile every template under the views folder.
+
+    Fails when a template does not compile, so broken templates stop the build.
+    With FLASK_MVC_TEMPLATE_BYTECODE_CACHE set, the compiled templates are
+    written to the bytecode cache shared by the workers, which then skip
+    compiling them on their first requests.
+
+    Examples:
+        \b
+        flask mvc views compile
+    """
+    report = current_app.extensions["flask_mvc"].compile_views()
+
+    for name, error in report["errors"].items():
+        click.echo(click.style(f"✗ {name}: {error}", fg=CLIConfig.ERROR_COLOR), err=True)
+    if report["errors"]:
+        click.echo(
+            click.style(
+                f"✗ Error: {len(report['errors'])} template(s) failed to compile",
+                fg=CLIConfig.ERROR_COLOR,
+            ),
+            err=True,
+        )
+        raise click.Abort()
+
+    click.echo(
+        click.style(
+            f"✓ Compiled {len(report['templates'])} template(s)",
+            fg=CLIConfig.SUCCESS_COLOR,
+        )
+    )
+    if report["bytecode_cache"] is None:
+        click.echo(
+            click.style(
+                "Set FLASK_MVC_TEMPLATE_BYTECODE_CACHE to share them with the workers",
+                fg=CLIConfig.WARNING_COLOR,
+            )
+        )
+
+
+@mvc.command("profile-boot")
+@click.option("--json", "as_json", is_flag=True, help="Print the profile as JSON")
+@with_appcontext
+def profile_boot(as_json: bool) -> None:
+    """Show where FlaskMVC.init_app spends its time.
+
+    Prints the duration of each boot phase, and the import, instantiation and
+    binding time of each controller, slowest first, with the memory allocated
+    by its import. Unless boot profiling is already enabled, the application is
+    booted again in a fresh interpreter, so imports are not cached.
+
+    Examples:
+        \b
+        flask mvc profile-boot
+        flask mvc profile-boot --json
+    """
+    profile = current_app.extensions["flask_mvc"].boot_profile
+    if profile is None:
+        if os.environ.get(PROFILE_BOOT_ENV):
+            click.echo(
+                click.style(
+                    "✗ Error: the application did not record a boot profile",
+                    fg=CLIConfig.ERROR_COLOR,
+                ),
+                err=True,
+            )
+            raise click.Abort()
+        sys.exit(_rerun_with_boot_profiling())
+
+    if as_json:
+        click.echo(json.dumps(profile, indent=2))
+        return
+
+    _echo_boot_profile(profile)
+
+
+@mvc.command("bench")
+@click.option(
+    "--requests", "-n", default=100, show_default=True, help="Requests per endpoint"
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    default=1,
+    show_default=True,
+    help="Threads sending the requests",
+)
+@click.option(
+    "--method",
+    "-m",
+    "methods",
+    multiple=True,
+    default=("GET",),
+    show_default=True,
+    help="HTTP method to send, repeat for several",
+)
+@click.option(
+    "--endpoint",
+    "-e",
+    "endpoints",
+    multiple=True,
+    help="Endpoint to send requests to, such as messages.show or messages.*",
+)
+@click.option(
+    "--param",
+    "-p",
+    "params",
+    multiple=True,
+    help="Value of a URL parameter, such as id=42",
+)
+@click.option(
+    "--server", is_flag=True, help="Serve the application from a local HTTP server"
+)
+@click.option("--url", default=None, help="Send the requests to a running server")
+@click.option("--json", "as_json", is_flag=True, help="Print the results as JSON")
+@with_appcontext
+def bench(
+    requests: int,
+    concurrency: int,
+    methods: tuple,
+    endpoints: tuple,
+    params: tuple,
+    server: bool,
+    url: Optional[str],
+    as_json: bool,
+) -> None:
+    """Load test the routes of the route table.
+
+    Sends requests to each route, filling its URL parameters from
+    FLASK_MVC_BENCH_FIXTURES and --param (1 by default), and reports the
+    throughput and the p50, p95 and p99 latencies of each endpoint. Requests go
+    through the test client, or over HTTP with --server or --url. Fails when a
+    request gets a server error.
+
+    Examples:
+        \b
+        flask mvc bench
+        flask mvc bench -n 1000 -c 8 --endpoint "messages.*" --param id=42
+        flask mvc bench --server --json
+        flask mvc bench --url http://127.0.0.1:5000 --method GET --method POST
+    """
+    if server and url:
+        raise click.UsageError("--server and --url cannot be used together")
+
+    try:
+        values = dict(param.split("=", 1) for param in params)
+    except ValueError as e:
+        raise click.BadParameter("expected name=value", param_hint="--param") from e
+
+    app = current_app._get_current_object()
+    try:
+        client = load_test.HTTPClient(url) if url else load_test.InProcessClient(app)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--url") from e
+
+    fixtures = load_test.fixtures_from(app.config, values)
+    targets = load_test.targets(
+        app.extensions["flask_mvc"].routes, methods, endpoints, fixtures
+    )
+    if not targets:
+        click.echo(
+            click.style(
+                "✗ Error: no route matches the endpoints and methods",
+                fg=CLIConfig.ERROR_COLOR,
+            ),
+            err=True,
+        )
+        raise click.Abort()
+
+    if server:
+        with load_test.serve(app) as base_url:
+            report = load_test.run(
+                load_test.HTTPClient(base_url), targets, requests, concurrency
+            )
+    else:
+        report = load_test.run(client, targets, requests, concurrency)
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+    else:
+        _echo_bench_report(report)
+
+    errors = sum(result["errors"] for result in report)
+    if errors:
+        click.echo(
+            click.style(
+                f"✗ Error: {errors} request(s) failed", fg=CLIConfig.ERROR_COLOR
+            ),
+            err=True,
+        )
+        raise click.Abort()
+
+
+def _echo_bench_report(report) -> None:
+    """Print the results of a load test as a table."""
+    click.echo(
+        f"  {'endpoint':<32} {'method':<7} {'requests':>8} {'errors':>6} "
+        f"{'req/s':>10} {'p50':>10} {'p95':>10} {'p99':>10}"
+    )
+    for result in report:
+        latencies = [f"{result[name]:.2f} ms" for name in ("p50_ms", "p95_ms", "p99_ms")]
+        click.echo(
+            f"  {result['endpoint']:<32} {result['method']:<7} "
+            f"{result['requests']:>8} {result['errors']:>6} "
+            f"{result['throughput']:>10.1f} {latencies[0]:>10} {latencies[1]:>10} "
+            f"{latencies[2]:>10}"
+        )
+
+
+def _rerun_with_boot_profiling() -> int:
+    """Run the current flask command again, with boot profiling enabled."""
+    env = dict(os.environ, **{PROFILE_BOOT_ENV: "1"})
+    # The arguments are those of the current process, run by the same interpreter
+    command = [sys.executable, "-m", "flask", *sys.argv[1:]]
+    return subprocess.run(command, env=env).returncode  # nosec B603
+
+
+def _echo_boot_profile(profile: Dict[str, Any]) -> None:
+    """Print a boot profile as a table."""
+    phases = dict(profile["phases"])
+    total = phases.pop("total", sum(phases.values()))
+
+    click.echo(
+        click.style(
+            f"Boot profile (total {total * 1000:.1f} ms)",
+            fg=CLIConfig.INFO_COLOR,
+            bold=True,
+        )
+    )
+    for name, seconds in phases.items():
+        click.echo(f"  {name:<40} {seconds * 1000:>10.1f} ms")
+
+    controllers = sorted(
+        profile["controllers"].items(), key=lambda item: item[1]["total"], reverse=True
+    )
+    click.echo(click.style("\nControllers (slowest first)", fg=CLIConfig.INFO_COLOR))
+    click.echo(
+        f"  {'controller':<24} {'import':>10} {'instantiate':>12} {'callbacks':>10} "
+        f"{'actions':>10} {'total':>10} {'memory':>10}"
+    )
+    for name, steps in controllers:
+        durations = [
+            f"{steps.get(step, 0.0) * 1000:.1f} ms"
+            for step in ("import", "instantiate", "callbacks", "actions", "total")
+        ]
+        memory = steps.get("memory")
+        memory = "-" if memory is None else f"{memory / 1024:.1f} KiB"
+        click.echo(
+            f"  {name:<24} {durations[0]:>10} {durations[1]:>12} {durations[2]:>10} "
+            f"{durations[3]:>10} {durations[4]:>10} {memory:>10}"
+        )
+
+
 def init_app(app) -> None:
     """Initialize CLI commands with Flask app.
 
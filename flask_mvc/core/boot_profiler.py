@@ -0,0 +1,118 @@
+"""Boot profiling for Flask MVC.
+
+When enabled with the ``FLASK_MVC_PROFILE_BOOT`` option (or environment
+variable), ``FlaskMVC.init_app`` times each of its phases, and each controller
+import, instantiation and callback registration. The memory allocated while
+importing each controller module is measured with ``tracemalloc``.
+"""
+
+import os
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Any, Dict, Iterator, Mapping
+
+PROFILE_BOOT_ENV = "FLASK_MVC_PROFILE_BOOT"
+
+
+class BootProfiler:
+    """Records the time spent in each boot phase and controller."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the profiler.
+
+        Args:
+            enabled: Whether to record anything. A disabled profiler adds no overhead.
+        """
+        self.enabled = enabled
+        self.phases: Dict[str, float] = {}
+        self.controllers: Dict[str, Dict[str, float]] = {}
+        self._started = None
+        self._tracing = False
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "BootProfiler":
+        """Build the profiler of an application.
+
+        Args:
+            config: The application config
+
+        Returns:
+            A profiler, enabled by the ``FLASK_MVC_PROFILE_BOOT`` option or
+            environment variable
+        """
+        from_env = os.environ.get(PROFILE_BOOT_ENV, "").lower() in ("1", "true", "yes")
+        return cls(bool(config.get("FLASK_MVC_PROFILE_BOOT")) or from_env)
+
+    def start(self) -> None:
+        """Start the boot clock and memory tracing."""
+        if not self.enabled:
+            return
+
+        self._started = perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    def stop(self) -> None:
+        """Stop the boot clock, and memory tracing if the profiler started it."""
+        if not self.enabled or self._started is None:
+            return
+
+        self.phases["total"] = perf_counter() - self._started
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def phase(self, name: str):
+        """Time a boot phase.
+
+        Args:
+            name: Name of the phase
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(self.phases, name)
+
+    def controller(self, name: str, step: str, memory: bool = False):
+        """Time a step of a controller's registration.
+
+        Args:
+            name: Name of the controller
+            step: Name of the step, e.g. "import" or "instantiate"
+            memory: Whether to also measure the memory allocated by the step
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(self.controllers.setdefault(name, {}), step, memory)
+
+    def report(self) -> Dict[str, Any]:
+        """Return the recorded timings.
+
+        Returns:
+            A dict with the duration of each phase in seconds (and their "total"),
+            and for each controller the duration of each step, their "total" and
+            the "memory" allocated by its import, in bytes
+        """
+        controllers = {}
+        for name, steps in self.controllers.items():
+            durations = {
+                step: value for step, value in steps.items() if step != "memory"
+            }
+            controllers[name] = dict(steps, total=sum(durations.values()))
+
+        return {"phases": dict(self.phases), "controllers": controllers}
+
+    @contextmanager
+    def _timed(
+        self, timings: Dict[str, float], name: str, memory: bool = False
+    ) -> Iterator[None]:
+        tracing = memory and tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if tracing else 0
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            timings[name] = timings.get(name, 0.0) + perf_counter() - started
+            if tracing:
+                timings["memory"] = tracemalloc.get_traced_memory()[0] - allocated
@@ -0,0 +1,209 @@
+"""Response cache backends for Flask MVC.
+
+Controllers declare the actions whose responses are cached::
+
+    class MessagesController:
+        cache = dict(actions="index show", ttl=30, vary="Accept")
+
+Responses are stored in a ``CacheBackend``. ``MemoryCache`` keeps them in the
+process, with LRU and TTL eviction. ``ClientCache`` stores them in a cache
+shared by every worker, through any client with the ``get``/``set``/``delete``/
+``incr`` methods of redis-py.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from flask import request
+
+DEFAULT_TTL = 60
+
+CACHE_EXTENSION = "flask_mvc.cache"
+
+
+def generation_key(controller_name: str) -> str:
+    """Return the key of the counter invalidating the cached responses of a controller.
+
+    The counter is part of every cache key of the controller, so incrementing it
+    makes every response cached before unreachable, until they expire.
+
+    Args:
+        controller_name: Name of the controller
+    """
+    return f"flask_mvc:generation:{controller_name}"
+
+
+def request_digest(view_args: Dict[str, Any], vary: Iterable[str] = ()) -> str:
+    """Return a digest identifying the current request for its endpoint.
+
+    Args:
+        view_args: The arguments of the view function
+        vary: Names of the request headers the response depends on
+
+    Returns:
+        A digest of the view arguments, query string and vary header values
+    """
+    headers = [request.headers.get(header, "") for header in vary]
+    return hashlib.sha256(
+        repr((sorted(view_args.items()), request.query_string, headers)).encode()
+    ).hexdigest()
+
+
+class CacheBackend:
+    """Base class of response cache backends."""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under a key, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: The cache key
+            value: The value, a tuple of the response status, headers and body
+            ttl: Seconds before the value expires. It never expires when None.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove the value stored under a key."""
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """Increment the counter stored under a key, starting from 0.
+
+        Returns:
+            The incremented value
+        """
+        value = (self.get(key) or 0) + 1
+        self.set(key, value)
+        return value
+
+
+class MemoryCache(CacheBackend):
+    """An in-process cache, evicting the least recently used values beyond its size.
+
+    Counters are kept apart and never evicted: a counter starting again from 0
+    would make the responses cached under its former values reachable again.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of values kept
+        """
+        self.max_size = max_size
+        self._values: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._counters:
+                return self._counters[key]
+
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._values[key]
+                return None
+
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._values[key] = (value, expires)
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+            self._counters.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class ClientCache(CacheBackend):
+    """A cache shared by worker processes, through a redis-py compatible client.
+
+    Responses are serialized to JSON, so any client storing strings or bytes
+    can be used, including a local stand-in in tests.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: Client with ``get(key)``, ``set(key, value, ex=seconds)``,
+                ``delete(key)`` and ``incr(key)`` methods
+        """
+        self.client = client
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self.client.get(key)
+        if data is None:
+            return None
+
+        value = json.loads(data)
+        if isinstance(value, list):
+            status, headers, body = value
+            return status, [tuple(header) for header in headers], body.encode("latin-1")
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if isinstance(value, tuple):
+            status, headers, body = value
+            value = [status, headers, body.decode("latin-1")]
+
+        ex = None if ttl is None else max(1, int(ttl))
+        self.client.set(key, json.dumps(value), ex=ex)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(key))
+
+
+def get_cache(app) -> CacheBackend:
+    """Return the response cache of an application.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        The ``FLASK_MVC_CACHE_BACKEND`` option, wrapped in a ``ClientCache`` when it
+        is a client rather than a backend, or an in-process ``MemoryCache`` holding
+        up to ``FLASK_MVC_CACHE_SIZE`` responses
+    """
+    cache = app.extensions.get(CACHE_EXTENSION)
+    if cache is None:
+        backend = app.config.get("FLASK_MVC_CACHE_BACKEND")
+        if backend is None:
+            cache = MemoryCache(app.config.get("FLASK_MVC_CACHE_SIZE", 1024))
+        elif isinstance(backend, CacheBackend):
+            cache = backend
+        else:
+            cache = ClientCache(backend)
+        app.extensions[CACHE_EXTENSION] = cache
+    return cache
@@ -1,4 +1,4 @@
-"""Configuration for Flask MVC CLI."""
+"""Configuration for Flask MVC."""
 
 import os
 from pathlib import Path
@@ -62,3 +62,69 @@ class CLIConfig:
             File encoding string
         """
         return os.getenv(f"{cls.ENV_PREFIX}FILE_ENCODING", cls.FILE_ENCODING)
+
+
+class MVCConfig:
+    """Application configuration defaults for Flask MVC.
+
+    Every option is read from ``app.config`` and can be set before
+    ``FlaskMVC.init_app`` runs.
+    """
+
+    DEFAULTS: Dict[str, Any] = {
+        # Controller lifecycle: "singleton", "per_request" or "pool"
+        "FLASK_MVC_CONTROLLER_LIFECYCLE": "singleton",
+        "FLASK_MVC_CONTROLLER_POOL_SIZE": 8,
+        # Import controllers on the first hit of one of their endpoints
+        "FLASK_MVC_LAZY_CONTROLLERS": False,
+        # Async actions and callbacks: "flask" or "shared_loop"
+        "FLASK_MVC_ASYNC_MODE": "flask",
+        # Time each phase of FlaskMVC.init_app, also enabled by the environment variable
+        "FLASK_MVC_PROFILE_BOOT": False,
+        # Per-action request metrics, served in the Prometheus format at the endpoint
+        # (None to not serve them). Worker processes share their metrics through the
+        # directory, which must be emptied when the server starts.
+        "FLASK_MVC_METRICS": False,
+        "FLASK_MVC_METRICS_ENDPOINT": "/metrics",
+        "FLASK_MVC_METRICS_DIR": None,
+        "FLASK_MVC_METRICS_FLUSH_INTERVAL": 1.0,
+        # Run callbacks and actions in spans of the tracer (OpenTelemetry compatible,
+        # defaults to the built-in one), and send the Server-Timing header with the
+        # tracing headers (defaults to debug mode only)
+        "FLASK_MVC_TRACING": False,
+        "FLASK_MVC_TRACER": None,
+        "FLASK_MVC_TRACING_HEADERS": None,
+        # Send a Server-Timing header breaking down the phases of each action request
+        "FLASK_MVC_SERVER_TIMING": False,
+        # Backend of the responses cached by the controllers' cache attribute: None for
+        # an in-process LRU cache of FLASK_MVC_CACHE_SIZE responses, a CacheBackend, or
+        # a redis-py compatible client shared by the workers
+        "FLASK_MVC_CACHE_BACKEND": None,
+        "FLASK_MVC_CACHE_SIZE": 1024,
+        # Directory of the compiled templates shared by the workers, relative to the
+        # application root (None to compile templates in each worker), or a Jinja
+        # BytecodeCache
+        "FLASK_MVC_TEMPLATE_BYTECODE_CACHE": None,
+        # Characters buffered by stream_render before sending a chunk (0 to send
+        # every piece rendered by Jinja)
+        "FLASK_MVC_STREAM_CHUNK_SIZE": 8192,
+        # JSON provider: "auto" (orjson or msgspec when installed), "orjson",
+        # "msgspec", "default", a JSONProvider subclass, or None to keep Flask's
+        "FLASK_MVC_JSON_PROVIDER": "auto",
+        # Render views/<controller>/<action>.html when an action returns a dict or
+        # None (controllers can override it with an implicit_render attribute)
+        "FLASK_MVC_IMPLICIT_RENDER": False,
+        # Values of the URL parameters of the routes load tested by flask mvc bench:
+        # a mapping of parameter names to values or a callable(route, name)
+        "FLASK_MVC_BENCH_FIXTURES": None,
+    }
+
+    @classmethod
+    def init_app(cls, app) -> None:
+        """Set the default value of every Flask MVC option not configured yet.
+
+        Args:
+            app: Flask application instance
+        """
+        for key, value in cls.DEFAULTS.items():
+            app.config.setdefault(key, value)
@@ -0,0 +1,168 @@
+"""Controller lifecycles for Flask MVC.
+
+A lifecycle decides which controller instance serves a request. The default
+``singleton`` lifecycle shares one instance between every request, while
+``per_request`` and ``pool`` give each request its own instance so controllers
+can keep per-request state (e.g. attributes set by callbacks) safely under
+threaded workers.
+"""
+
+import queue
+from typing import Any, Dict, Optional
+
+from flask import g
+
+from .exceptions import ConfigurationError
+
+_CONTROLLERS = "_mvc_controllers"
+
+
+class ControllerLifecycle:
+    """Base class of controller lifecycles."""
+
+    # Whether every request is served by the same instance
+    shared = False
+
+    def __init__(self, name: str, controller_class: type) -> None:
+        """Initialize the lifecycle.
+
+        Args:
+            name: Name of the controller
+            controller_class: The controller class
+        """
+        self.name = name
+        self.controller_class = controller_class
+
+    def instance(self) -> Any:
+        """Return the controller instance serving the current request."""
+        raise NotImplementedError
+
+    def register(self, blueprint) -> None:
+        """Register the hooks needed by the lifecycle on the controller's blueprint."""
+        pass
+
+
+class SingletonLifecycle(ControllerLifecycle):
+    """Shares a single controller instance between every request."""
+
+    shared = True
+
+    def __init__(self, name: str, controller_class: type) -> None:
+        super().__init__(name, controller_class)
+        self.controller = controller_class()
+
+    def instance(self) -> Any:
+        """Return the shared controller instance."""
+        return self.controller
+
+
+class PerRequestLifecycle(ControllerLifecycle):
+    """Creates a new controller instance for every request."""
+
+    def instance(self) -> Any:
+        """Return the controller instance of the current request, creating it once."""
+        controllers = g.setdefault(_CONTROLLERS, {})
+        controller = controllers.get(self.name)
+        if controller is None:
+            controller = controllers[self.name] = self.controller_class()
+        return controller
+
+
+class PooledLifecycle(ControllerLifecycle):
+    """Checks controller instances out of a bounded pool for each request.
+
+    Pooled controllers must define a ``reset()`` method, called on checkout,
+    which clears whatever a previous request left on the instance, lists and
+    dicts changed in place included. When the pool is empty a new instance is
+    created, and instances returned to a full pool are discarded.
+    """
+
+    def __init__(self, name: str, controller_class: type, size: int) -> None:
+        """Initialize the lifecycle.
+
+        Args:
+            name: Name of the controller
+            controller_class: The controller class
+            size: Maximum number of idle instances kept in the pool
+
+        Raises:
+            ConfigurationError: If the controller does not define ``reset()``
+        """
+        if not callable(getattr(controller_class, "reset", None)):
+            raise ConfigurationError(
+                f"The pooled controller '{name}' must define a reset() method "
+                "clearing the state left by the previous request, or use the "
+                "per_request lifecycle"
+            )
+        super().__init__(name, controller_class)
+        self._pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=size)
+
+    def instance(self) -> Any:
+        """Return the controller instance checked out for the current request."""
+        controllers = g.setdefault(_CONTROLLERS, {})
+        controller = controllers.get(self.name)
+        if controller is None:
+            controller = controllers[self.name] = self._checkout()
+        return controller
+
+    def register(self, blueprint) -> None:
+        """Return the checked out instance to the pool when the request ends."""
+        blueprint.teardown_request(self.release)
+
+    def release(self, exc: Optional[BaseException] = None) -> None:
+        """Return the instance checked out by the current request to the pool."""
+        controller = g.get(_CONTROLLERS, {}).pop(self.name, None)
+        if controller is not None:
+            try:
+                self._pool.put_nowait(controller)
+            except queue.Full:
+                pass
+
+    def _checkout(self) -> Any:
+        try:
+            controller = self._pool.get_nowait()
+        except queue.Empty:
+            return self.controller_class()
+
+        controller.reset()
+        return controller
+
+
+LIFECYCLES = {
+    "singleton": SingletonLifecycle,
+    "per_request": PerRequestLifecycle,
+    "pool": PooledLifecycle,
+}
+
+
+def build_lifecycle(name: str, controller_class: type, config: Dict[str, Any]):
+    """Build the lifecycle of a controller.
+
+    The mode is read from the controller's ``lifecycle`` attribute, falling back
+    to the ``FLASK_MVC_CONTROLLER_LIFECYCLE`` option.
+
+    Args:
+        name: Name of the controller
+        controller_class: The controller class
+        config: The application configuration
+
+    Returns:
+        The controller lifecycle
+
+    Raises:
+        ConfigurationError: If the lifecycle mode is unknown
+    """
+    mode = getattr(
+        controller_class, "lifecycle", config["FLASK_MVC_CONTROLLER_LIFECYCLE"]
+    )
+    if mode not in LIFECYCLES:
+        raise ConfigurationError(
+            f"Unknown controller lifecycle '{mode}' for '{name}'. "
+            f"Use one of: {', '.join(LIFECYCLES)}"
+        )
+
+    if mode == "pool":
+        return PooledLifecycle(
+            name, controller_class, config["FLASK_MVC_CONTROLLER_POOL_SIZE"]
+        )
+    return LIFECYCLES[mode](name, controller_class)
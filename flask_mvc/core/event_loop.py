@@ -0,0 +1,124 @@
+"""Async support for controller actions and callbacks.
+
+Coroutine functions are detected when controllers are registered and wrapped
+into synchronous callables according to the ``FLASK_MVC_ASYNC_MODE`` option:
+
+- ``flask`` (default): Flask's own async support, which requires the
+  ``flask[async]`` extra and starts an event loop for each call.
+- ``shared_loop``: every coroutine runs on one event loop per process, kept
+  in a background thread, so no loop is started per request.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import os
+import threading
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Coroutine, Optional
+
+from .exceptions import ConfigurationError
+
+ASYNC_MODES = ("flask", "shared_loop")
+
+
+class SharedEventLoop:
+    """An event loop running forever in a background thread of the process."""
+
+    _instance: Optional["SharedEventLoop"] = None
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Start the event loop thread."""
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self._run_forever, name="flask-mvc-event-loop", daemon=True
+        )
+        self.thread.start()
+
+    @classmethod
+    def get(cls) -> "SharedEventLoop":
+        """Return the loop of the current process, starting it on first use.
+
+        The loop is started again in forked processes, whose copy of the loop
+        thread is not running.
+
+        Returns:
+            The shared event loop
+        """
+        instance = cls._instance
+        if instance is None or instance.pid != os.getpid():
+            with cls._lock:
+                if cls._instance is None or cls._instance.pid != os.getpid():
+                    cls._instance = cls()
+                instance = cls._instance
+        return instance
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """Run a coroutine on the loop and wait for its result.
+
+        The coroutine runs in a copy of the caller's context, so Flask's
+        ``request``, ``g`` and ``current_app`` remain available inside it.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            The value returned by the coroutine
+        """
+        future: Future = Future()
+
+        def start() -> None:
+            task = self.loop.create_task(coroutine)
+            task.add_done_callback(lambda task: self._resolve(task, future))
+
+        self.loop.call_soon_threadsafe(start, context=contextvars.copy_context())
+        return future.result()
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @staticmethod
+    def _resolve(task: asyncio.Task, future: Future) -> None:
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+
+def ensure_sync(app, function: Callable) -> Callable:
+    """Return a synchronous version of a controller action or callback.
+
+    Args:
+        app: Flask application instance
+        function: The action or callback, which may be a coroutine function
+
+    Returns:
+        The function itself when it is synchronous, or a wrapper running it
+        according to the ``FLASK_MVC_ASYNC_MODE`` option
+
+    Raises:
+        ConfigurationError: If the async mode is unknown
+    """
+    if not inspect.iscoroutinefunction(function):
+        return function
+
+    mode = app.config["FLASK_MVC_ASYNC_MODE"]
+    if mode not in ASYNC_MODES:
+        raise ConfigurationError(
+            f"Unknown async mode '{mode}'. Use one of: {', '.join(ASYNC_MODES)}"
+        )
+
+    if mode == "flask":
+        return app.ensure_sync(function)
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return SharedEventLoop.get().run(function(*args, **kwargs))
+
+    return wrapper
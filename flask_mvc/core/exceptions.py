@@ -23,3 +23,22 @@ class InvalidControllerNameError(FlaskMVCError):
     """Exception raised when controller name is invalid."""
 
     pass
+
+
+class ConfigurationError(FlaskMVCError):
+    """Exception raised when Flask MVC is configured with invalid options."""
+
+    pass
+
+
+class ManifestError(FlaskMVCError):
+    """Exception raised when a route manifest cannot be read."""
+
+    pass
+
+
+class InvalidMethodError(FlaskMVCError, KeyError):
+    """Exception raised when a form method override gets an unsupported method."""
+
+    def __str__(self):
+        return str(self.args[0])
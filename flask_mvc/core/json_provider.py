@@ -0,0 +1,244 @@
+"""Fast JSON providers for Flask MVC.
+
+Dicts and lists returned by actions, and ``jsonify``, are serialized by the JSON
+provider of the application. The ``FLASK_MVC_JSON_PROVIDER`` option selects it:
+
+- ``auto`` (default): ``orjson`` when installed, else ``msgspec`` when installed,
+  else Flask's own provider. An application that already set its own provider
+  keeps it.
+- ``orjson``, ``msgspec`` or ``default``: that provider, failing when the
+  library is missing.
+- A ``JSONProvider`` subclass.
+- None: leave the provider of the application alone.
+
+Both fast providers keep the options of Flask's provider (``sort_keys``,
+``compact``, ``default``, ``ensure_ascii``) and fall back to it for
+``json.dumps`` keyword arguments they do not support. They also serialize
+objects with a ``to_dict()`` method, such as models. Their output holds the
+same values as Flask's, not always the same text: ``dumps`` is compact, NaN and
+infinities become ``null`` and large floats are written as ``1e16`` rather
+than ``1e+16``. msgspec also writes datetimes in the ISO 8601 format and
+serializes dict subclasses from their stored items (a ``MultiDict`` gives
+lists).
+"""
+
+import re
+from typing import Any, Dict, Optional, Type
+
+from flask.json.provider import DefaultJSONProvider, JSONProvider, _default
+
+from .exceptions import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def serializable(obj: Any) -> Any:
+    """Convert an object the JSON libraries do not know to a serializable one.
+
+    Models are converted with their ``to_dict()`` method, subclasses of the
+    builtin types as the json module sees them (e.g. a ``MultiDict`` through its
+    ``items()``), anything else as by Flask's provider.
+    """
+    if isinstance(obj, dict):
+        return dict(obj.items())
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    for builtin in (int, float, list):
+        if isinstance(obj, builtin):
+            return builtin(obj)
+
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return _default(obj)
+
+
+def escape_non_ascii(data: bytes) -> bytes:
+    """Escape the characters beyond ASCII of UTF-8 JSON, as ``ensure_ascii`` does.
+
+    Args:
+        data: The JSON document, encoded as UTF-8
+
+    Returns:
+        The document with ``\\uXXXX`` escapes, surrogate pairs beyond the BMP
+    """
+    if data.isascii():
+        return data
+
+    def escape(match):
+        code = ord(match.group())
+        if code < 0x10000:
+            return f"\\u{code:04x}"
+        code -= 0x10000
+        return f"\\u{0xD800 | code >> 10:04x}\\u{0xDC00 | code & 0x3FF:04x}"
+
+    return NON_ASCII.sub(escape, data.decode()).encode()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Base class of the providers serializing with a faster JSON library.
+
+    Responses are encoded straight to bytes. ``json.dumps`` keyword arguments,
+    other than the separators of compact responses, are handled by Flask's
+    provider. Objects with a ``to_dict()`` method, such as models, are
+    serialized with it, and ``ensure_ascii`` is applied to the output.
+    """
+
+    default = staticmethod(serializable)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._dumps(obj, kwargs).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return self.decode(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._dumps(obj, {}) + b"\n", mimetype=self.mimetype
+        )
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize data as JSON bytes, with the options of the provider."""
+        raise NotImplementedError
+
+    def decode(self, s: Any) -> Any:
+        """Deserialize JSON text or bytes."""
+        raise NotImplementedError
+
+    def _dumps(self, obj: Any, kwargs: Dict[str, Any]) -> bytes:
+        if kwargs.keys() - {"separators"}:
+            return super().dumps(obj, **kwargs).encode()
+        data = self.encode(obj)
+        return escape_non_ascii(data) if self.ensure_ascii else data
+
+
+class OrjsonProvider(FastJSONProvider):
+    """JSON provider serializing with orjson.
+
+    Datetimes are passed to ``default``, so they keep the HTTP date format of
+    Flask's provider.
+    """
+
+    def encode(self, obj: Any) -> bytes:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the json module handles
+            return DefaultJSONProvider.dumps(self, obj, separators=(",", ":")).encode()
+
+    def decode(self, s: Any) -> Any:
+        return orjson.loads(s)
+
+
+class MsgspecProvider(FastJSONProvider):
+    """JSON provider serializing with msgspec.
+
+    msgspec serializes datetimes itself, in the ISO 8601 format.
+    """
+
+    def __init__(self, app) -> None:
+        super().__init__(app)
+        self._encoders: Dict[bool, Any] = {}
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        sort_keys = bool(self.sort_keys)
+        encoder = self._encoders.get(sort_keys)
+        if encoder is None:
+            encoder = self._encoders[sort_keys] = msgspec.json.Encoder(
+                enc_hook=self.default, order="sorted" if sort_keys else None
+            )
+        return encoder.encode(obj)
+
+    def decode(self, s: Any) -> Any:
+        return self._decoder.decode(s)
+
+
+PROVIDERS = {
+    "orjson": (OrjsonProvider, lambda: orjson is not None),
+    "msgspec": (MsgspecProvider, lambda: msgspec is not None),
+    "default": (DefaultJSONProvider, lambda: True),
+}
+
+
+def json_provider_class(option: Any) -> Optional[Type[JSONProvider]]:
+    """Return the JSON provider class selected by ``FLASK_MVC_JSON_PROVIDER``.
+
+    Args:
+        option: The value of the option
+
+    Returns:
+        The provider class, or None to keep the provider of the application
+
+    Raises:
+        ConfigurationError: When the option is unknown or its library is missing
+    """
+    if option is None:
+        return None
+    if isinstance(option, type) and issubclass(option, JSONProvider):
+        return option
+
+    if option == "auto":
+        for provider_class, available in PROVIDERS.values():
+            if available():
+                return provider_class
+
+    if option not in PROVIDERS:
+        raise ConfigurationError(
+            f"Invalid FLASK_MVC_JSON_PROVIDER {option!r}, expected one of "
+            f"auto, {', '.join(PROVIDERS)}, None or a JSONProvider subclass"
+        )
+
+    provider_class, available = PROVIDERS[option]
+    if not available():
+        raise ConfigurationError(
+            f"FLASK_MVC_JSON_PROVIDER is {option!r} but {option} is not installed"
+        )
+    return provider_class
+
+
+def init_app(app) -> None:
+    """Install the JSON provider selected by ``FLASK_MVC_JSON_PROVIDER``.
+
+    The options set on the current provider (``sort_keys``, ``compact``...) are
+    carried over to the new one.
+
+    Args:
+        app: Flask application instance
+    """
+    option = app.config["FLASK_MVC_JSON_PROVIDER"]
+    provider_class = json_provider_class(option)
+    if provider_class is None or type(app.json) is provider_class:
+        return
+    # With "auto", keep a provider the application chose itself
+    if option == "auto" and type(app.json) is not DefaultJSONProvider:
+        return
+
+    provider = provider_class(app)
+    for name in ("default", "ensure_ascii", "sort_keys", "compact", "mimetype"):
+        if name in vars(app.json) and hasattr(provider, name):
+            setattr(provider, name, getattr(app.json, name))
+    app.json = provider
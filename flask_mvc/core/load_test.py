@@ -0,0 +1,326 @@
+"""Load testing of the routes of a Flask MVC application.
+
+``flask mvc bench`` sends requests to every route of the route table and
+reports the throughput and latency percentiles of each endpoint. Requests are
+sent in-process through the Werkzeug test client, or over HTTP to a server:
+one spawned in a background thread, or one already running.
+
+The URL parameters of the routes (``<id>``) are filled by a fixture provider,
+the ``FLASK_MVC_BENCH_FIXTURES`` option: a mapping of parameter names to
+values, or a callable receiving the route and the parameter name and
+returning the value (None to fall back to the defaults). Without a fixture,
+parameters are filled with ``1``.
+"""
+
+import fnmatch
+import math
+import re
+import threading
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Union,
+)
+from urllib.parse import quote, urlsplit
+
+from werkzeug.serving import make_server
+
+# Parameters of route paths, e.g. <id> or <int(min=1):id>
+PARAMETER = re.compile(r"<(?:(?P<converter>\w+)(?:\([^)]*\))?:)?(?P<name>\w+)>")
+
+DEFAULT_FIXTURES = {
+    "float": "1.0",
+    "uuid": "00000000-0000-0000-0000-000000000001",
+}
+
+# A mapping of parameter names to values, or a callable(route, name)
+Fixtures = Union[Mapping[str, Any], Callable[[Any, str], Any], None]
+
+
+@dataclass(frozen=True)
+class Target:
+    """A request sent by the load test.
+
+    Attributes:
+        endpoint: The endpoint of the route, "controller.action"
+        method: The HTTP method
+        path: The path, with its parameters filled
+    """
+
+    endpoint: str
+    method: str
+    path: str
+
+
+def fill_path(route, fixtures: Fixtures = None) -> str:
+    """Fill the parameters of the path of a route.
+
+    Args:
+        route: The route
+        fixtures: A mapping of parameter names to values, or a callable
+            receiving the route and the parameter name
+
+    Returns:
+        The path, with every parameter replaced by its URL-quoted value
+    """
+
+    def value(match):
+        name = match.group("name")
+        if callable(fixtures):
+            filled = fixtures(route, name)
+        elif fixtures is not None:
+            filled = fixtures.get(name)
+        else:
+            filled = None
+        if filled is None:
+            filled = DEFAULT_FIXTURES.get(match.group("converter"), "1")
+        safe = "/" if match.group("converter") == "path" else ""
+        return quote(str(filled), safe=safe)
+
+    return PARAMETER.sub(value, route.path)
+
+
+def targets(
+    routes: Iterable,
+    methods: Sequence[str] = ("GET",),
+    endpoints: Sequence[str] = (),
+    fixtures: Fixtures = None,
+) -> List[Target]:
+    """List the requests to send to the routes.
+
+    Args:
+        routes: The routes of the route table
+        methods: The HTTP methods to send, others are skipped
+        endpoints: Patterns of the endpoints to send requests to, such as
+            ``messages.*`` (every endpoint when empty)
+        fixtures: The fixture provider filling the parameters, see ``fill_path``
+
+    Returns:
+        One target per route and method, in the order of the route table
+    """
+    methods = {method.upper() for method in methods}
+    found = []
+    for route in routes:
+        if endpoints and not any(
+            fnmatch.fnmatchcase(route.endpoint, pattern) for pattern in endpoints
+        ):
+            continue
+        path = fill_path(route, fixtures)
+        for method in route.methods:
+            if method in methods:
+                found.append(Target(route.endpoint, method, path))
+    return found
+
+
+class InProcessClient:
+    """Sends the requests through the Werkzeug test client of the application."""
+
+    def __init__(self, app) -> None:
+        """Initialize the client.
+
+        Args:
+            app: Flask application instance
+        """
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str) -> int:
+        """Send a request and read its response.
+
+        Returns:
+            The status code of the response
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method)
+        try:
+            response.get_data()
+            return response.status_code
+        finally:
+            response.close()
+
+
+class HTTPClient:
+    """Sends the requests over HTTP to a running server."""
+
+    def __init__(self, base_url: str, timeout: float = 30) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: The URL of the server, e.g. ``http://127.0.0.1:5000``
+            timeout: The timeout of each request, in seconds
+
+        Raises:
+            ValueError: When the URL is not an http or https URL
+        """
+        if urlsplit(base_url).scheme not in ("http", "https"):
+            raise ValueError(f"expected an http or https URL, got {base_url!r}")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def request(self, method: str, path: str) -> int:
+        """Send a request and read its response.
+
+        Returns:
+            The status code of the response
+        """
+        request = urllib.request.Request(self.base_url + path, method=method)
+        try:
+            # The scheme of the URL is checked when the client is created
+            with urllib.request.urlopen(  # nosec B310
+                request, timeout=self.timeout
+            ) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            error.read()
+            return error.code
+
+
+@contextmanager
+def serve(app, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve the application from a background thread.
+
+    Args:
+        app: Flask application instance
+        host: The address to listen on
+        port: The port to listen on, any free port by default
+
+    Yields:
+        The URL of the server
+    """
+    server = make_server(host, port, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def percentile(latencies: Sequence[float], fraction: float) -> float:
+    """Return a percentile of sorted latencies, by the nearest-rank method.
+
+    Args:
+        latencies: The latencies, sorted
+        fraction: The percentile, e.g. 0.95
+    """
+    if not latencies:
+        return 0.0
+    rank = max(1, math.ceil(len(latencies) * fraction))
+    return latencies[rank - 1]
+
+
+def run(
+    client,
+    targets: Iterable[Target],
+    requests: int = 100,
+    concurrency: int = 1,
+    warmup: int = 1,
+) -> List[Dict[str, Any]]:
+    """Send the requests of each target and measure them.
+
+    Targets are measured one after the other, each by ``concurrency`` threads
+    sending ``requests`` requests in all.
+
+    Args:
+        client: An ``InProcessClient`` or an ``HTTPClient``
+        targets: The requests to send
+        requests: The number of requests sent to each target
+        concurrency: The number of threads sending them
+        warmup: The number of requests sent to each target before measuring
+
+    Returns:
+        For each target, its endpoint, method and path, the number of requests,
+        of errors (server errors and failed requests), the count of each status
+        code (0 for failed requests), the throughput in requests per second and
+        the mean, p50, p95 and p99 latencies in milliseconds
+    """
+    concurrency = max(1, min(concurrency, requests))
+    shares = [
+        requests // concurrency + (index < requests % concurrency)
+        for index in range(concurrency)
+    ]
+
+    def send(target: Target) -> tuple:
+        started = perf_counter()
+        try:
+            status = client.request(target.method, target.path)
+        except Exception:
+            status = 0
+        return status, perf_counter() - started
+
+    report = []
+    with ThreadPoolExecutor(concurrency) as pool:
+        for target in targets:
+            for _ in range(warmup):
+                send(target)
+
+            started = perf_counter()
+            results = pool.map(
+                lambda share: [send(target) for _ in range(share)], shares
+            )
+            samples = [sample for result in results for sample in result]
+            elapsed = perf_counter() - started
+            report.append(_summary(target, samples, elapsed))
+    return report
+
+
+def _summary(target: Target, samples: List[tuple], elapsed: float) -> Dict[str, Any]:
+    statuses = Counter(status for status, _ in samples)
+    latencies = sorted(latency * 1000 for _, latency in samples)
+    return {
+        "endpoint": target.endpoint,
+        "method": target.method,
+        "path": target.path,
+        "requests": len(samples),
+        "errors": sum(
+            count for status, count in statuses.items() if status == 0 or status >= 500
+        ),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput": len(samples) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+def fixtures_from(config, params: Dict[str, str]) -> Fixtures:
+    """Build the fixture provider of the load test.
+
+    Args:
+        config: The application config, holding ``FLASK_MVC_BENCH_FIXTURES``
+        params: Values given on the command line, which take precedence
+
+    Returns:
+        The fixture provider, see ``fill_path``
+    """
+    configured = config.get("FLASK_MVC_BENCH_FIXTURES")
+    if not params:
+        return configured
+
+    def provider(route, name):
+        if name in params:
+            return params[name]
+        if callable(configured):
+            return configured(route, name)
+        return configured.get(name) if configured is not None else None
+
+    return provider
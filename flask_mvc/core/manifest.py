@@ -0,0 +1,217 @@
+"""Route manifest for Flask MVC.
+
+A manifest records the resolved routes of an application, along with the
+callbacks and lifecycle declared by each controller, so the application can
+boot without evaluating the route DSL. The source files the manifest was
+built from are recorded too, relative to the application package so the
+manifest can be built in one directory and deployed to another, and a manifest
+whose sources changed is stale.
+"""
+
+import hashlib
+import json
+import os
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..__version__ import __version__
+from .exceptions import ManifestError
+
+MANIFEST_VERSION = 2
+
+CALLBACK_HOOKS = ("before_request", "after_request")
+
+
+def module_file(module_name: str) -> Optional[str]:
+    """Return the source file of a module, without importing the module itself.
+
+    Args:
+        module_name: Dotted name of the module
+
+    Returns:
+        Path of the source file, or None if the module has none
+    """
+    spec = find_spec(module_name)
+    return spec.origin if spec is not None and spec.has_location else None
+
+
+def package_directory(package_name: str) -> str:
+    """Return the directory of a package, the base of the source paths of a manifest.
+
+    Args:
+        package_name: Dotted name of the package
+
+    Returns:
+        The directory, or the current directory if the package has none
+    """
+    spec = find_spec(package_name)
+    locations = list(spec.submodule_search_locations or []) if spec else []
+    return locations[0] if locations else os.curdir
+
+
+def file_signature(file_path: str) -> Dict[str, Any]:
+    """Return the signature used to detect changes of a source file.
+
+    Args:
+        file_path: Path of the file
+
+    Returns:
+        The modification time, size and SHA-256 digest of the file
+    """
+    stat = os.stat(file_path)
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(Path(file_path).read_bytes()).hexdigest(),
+    }
+
+
+class RouteManifest:
+    """A versioned snapshot of the routes and controller bindings of an application."""
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """Initialize the manifest.
+
+        Args:
+            data: The manifest content
+        """
+        self.data = data
+
+    @classmethod
+    def build(
+        cls, path: str, routes: Iterable, controllers: Dict[str, type]
+    ) -> "RouteManifest":
+        """Build the manifest of an application.
+
+        Args:
+            path: The package holding the routes module and the controllers
+            routes: The resolved routes
+            controllers: The class of each controller, by controller name
+
+        Returns:
+            The manifest
+        """
+        sources = [f"{path}.routes"]
+        bindings = {}
+
+        for name, controller_class in controllers.items():
+            sources.append(controller_class.__module__)
+            bindings[name] = {
+                "callbacks": {
+                    hook: {
+                        "callback": getattr(controller_class, hook)["callback"],
+                        "actions": getattr(controller_class, hook)["actions"].split(),
+                    }
+                    for hook in CALLBACK_HOOKS
+                    if hasattr(controller_class, hook)
+                },
+                "lifecycle": getattr(controller_class, "lifecycle", None),
+            }
+
+        files = filter(None, (module_file(module) for module in sources))
+        base = package_directory(path)
+
+        return cls(
+            {
+                "version": MANIFEST_VERSION,
+                "flask_mvc": __version__,
+                "path": path,
+                "sources": {
+                    Path(os.path.relpath(file, base)).as_posix(): file_signature(file)
+                    for file in files
+                },
+                "routes": [
+                    {
+                        "methods": list(route.methods),
+                        "path": route.path,
+                        "controller": route.controller,
+                        "action": route.action,
+                        "endpoint": route.endpoint,
+                    }
+                    for route in routes
+                ],
+                "controllers": bindings,
+            }
+        )
+
+    @classmethod
+    def load(cls, manifest_path: str) -> "RouteManifest":
+        """Read a manifest file.
+
+        Args:
+            manifest_path: Path of the manifest file
+
+        Returns:
+            The manifest
+
+        Raises:
+            ManifestError: If the file cannot be read or is not a manifest
+        """
+        try:
+            data = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise ManifestError(f"Failed to read manifest {manifest_path}: {e}") from e
+
+        if not isinstance(data, dict) or "routes" not in data:
+            raise ManifestError(f"{manifest_path} is not a route manifest")
+        return cls(data)
+
+    def write(self, manifest_path: str) -> None:
+        """Write the manifest to a file.
+
+        Args:
+            manifest_path: Path of the manifest file
+        """
+        Path(manifest_path).write_text(
+            json.dumps(self.data, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+    def is_fresh(self, path: str) -> bool:
+        """Check whether the manifest still describes the application.
+
+        Source files are found relative to the directory of the package, and
+        compared by modification time and size first, and by content only when
+        those differ, so an untouched checkout is verified without reading any
+        file.
+
+        Args:
+            path: The package holding the routes module and the controllers
+
+        Returns:
+            True if the manifest is up to date, False if it is stale
+        """
+        if (
+            self.data.get("version") != MANIFEST_VERSION
+            or self.data.get("flask_mvc") != __version__
+            or self.data.get("path") != path
+        ):
+            return False
+
+        base = package_directory(path)
+        for source, signature in self.data.get("sources", {}).items():
+            file = os.path.join(base, source)
+            try:
+                stat = os.stat(file)
+            except OSError:
+                return False
+
+            if (stat.st_mtime_ns, stat.st_size) == (
+                signature["mtime_ns"],
+                signature["size"],
+            ):
+                continue
+            if file_signature(file)["sha256"] != signature["sha256"]:
+                return False
+
+        return True
+
+    @property
+    def routes(self):
+        """list: The routes recorded in the manifest, as dicts."""
+        return self.data["routes"]
+
+    @property
+    def controllers(self):
+        """dict: The callbacks and lifecycle declared by each controller."""
+        return self.data.get("controllers", {})
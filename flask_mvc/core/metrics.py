@@ -0,0 +1,384 @@
+"""Per-action request metrics for Flask MVC.
+
+Each thread records into its own shard of the registry, so recording a request
+takes no lock. When a thread (or greenlet) ends, its shard is folded into the
+totals of the ended threads. Shards are summed when the metrics are collected,
+and rendered in the Prometheus text exposition format.
+
+With several worker processes (e.g. gunicorn), each worker periodically writes
+its snapshot to a file in a shared directory, and collecting merges the
+snapshots of every worker.
+"""
+
+import glob
+import json
+import os
+import threading
+import weakref
+from bisect import bisect_left
+from time import monotonic
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CALLBACK_PHASES = ("before_request", "after_request")
+
+
+class Histogram:
+    """A cumulative-on-render histogram of durations."""
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Upper bounds of the buckets, in seconds, in increasing order
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a duration.
+
+        Args:
+            value: The duration, in seconds
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def add(self, other: "Histogram") -> None:
+        """Add the durations recorded by another histogram with the same buckets."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+
+
+class ActionStats:
+    """The metrics of one controller action, in one shard."""
+
+    __slots__ = ("in_flight", "statuses", "duration", "action", "callbacks")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            buckets: Upper bounds of the histogram buckets, in seconds
+        """
+        self.in_flight = 0
+        self.statuses: Dict[str, int] = {}
+        self.duration = Histogram(buckets)
+        self.action = Histogram(buckets)
+        self.callbacks = dict.fromkeys(CALLBACK_PHASES, 0.0)
+
+    def add(self, other: "ActionStats") -> None:
+        """Add the metrics recorded by another shard."""
+        self.in_flight += other.in_flight
+        for status_class, count in other.statuses.items():
+            self.statuses[status_class] = self.statuses.get(status_class, 0) + count
+        self.duration.add(other.duration)
+        self.action.add(other.action)
+        for phase, seconds in other.callbacks.items():
+            self.callbacks[phase] += seconds
+
+
+class ShardOwner:
+    """Held by the thread-local of a thread, collected when the thread ends."""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: Dict[Tuple[str, str], ActionStats]) -> None:
+        self.shard = shard
+
+
+class MetricsRegistry:
+    """Request metrics of every controller action of an application."""
+
+    def __init__(
+        self,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        directory: Optional[str] = None,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            buckets: Upper bounds of the histogram buckets, in seconds
+            directory: Directory shared by the worker processes, for multiprocess
+                aggregation. Metrics of the current process only when None.
+            flush_interval: Minimum time between two writes of the process snapshot,
+                in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._shards: Dict[int, Dict[Tuple[str, str], ActionStats]] = {}
+        self._ended: Dict[Tuple[str, str], ActionStats] = {}
+        self._shards_lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._flushed = monotonic()
+
+    def stats(self, controller: str, action: str) -> ActionStats:
+        """Return the metrics of an action in the shard of the current thread.
+
+        Args:
+            controller: Name of the controller
+            action: Name of the action
+
+        Returns:
+            The metrics, only ever written by the current thread
+        """
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            owner = self._local.owner = ShardOwner({})
+            with self._shards_lock:
+                self._shards[id(owner.shard)] = owner.shard
+            # The callback must not reference the owner, only its shard
+            finalizer = weakref.finalize(owner, self._fold, owner.shard)
+            finalizer.atexit = False
+
+        shard = owner.shard
+        stats = shard.get((controller, action))
+        if stats is None:
+            stats = shard[(controller, action)] = ActionStats(self.buckets)
+        return stats
+
+    def _fold(self, shard: Dict[Tuple[str, str], ActionStats]) -> None:
+        """Fold the shard of an ended thread into the totals of the ended threads."""
+        with self._shards_lock:
+            del self._shards[id(shard)]
+            for key, stats in shard.items():
+                ended = self._ended.get(key)
+                if ended is None:
+                    self._ended[key] = stats
+                else:
+                    ended.add(stats)
+
+    def started(self, controller: str, action: str) -> None:
+        """Record that a request to an action started."""
+        self.stats(controller, action).in_flight += 1
+
+    def finished(
+        self,
+        controller: str,
+        action: str,
+        status: int,
+        duration: float,
+        phases: Dict[str, float],
+    ) -> None:
+        """Record a finished request to an action.
+
+        Args:
+            controller: Name of the controller
+            action: Name of the action
+            status: Status code of the response
+            duration: Duration of the request, in seconds
+            phases: Time spent in the action and in each callback phase, in seconds
+        """
+        stats = self.stats(controller, action)
+        stats.in_flight -= 1
+
+        status_class = f"{status // 100}xx"
+        stats.statuses[status_class] = stats.statuses.get(status_class, 0) + 1
+        stats.duration.observe(duration)
+        stats.action.observe(phases.get("action", 0.0))
+        for phase in CALLBACK_PHASES:
+            stats.callbacks[phase] += phases.get(phase, 0.0)
+
+        if (
+            self.directory is not None
+            and monotonic() - self._flushed >= self.flush_interval
+        ):
+            self.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Sum the shards of the current process.
+
+        Returns:
+            The metrics of each action, by "controller.action" endpoint
+        """
+        actions: Dict[str, Dict[str, Any]] = {}
+        # Under the lock, so that a shard being folded is not counted twice
+        with self._shards_lock:
+            for shard in [self._ended, *self._shards.values()]:
+                for (controller, action), stats in list(shard.items()):
+                    merge(
+                        actions,
+                        f"{controller}.{action}",
+                        {
+                            "controller": controller,
+                            "action": action,
+                            "in_flight": stats.in_flight,
+                            "statuses": dict(stats.statuses),
+                            "duration": [
+                                list(stats.duration.counts),
+                                stats.duration.sum,
+                            ],
+                            "action_duration": [
+                                list(stats.action.counts),
+                                stats.action.sum,
+                            ],
+                            "callbacks": dict(stats.callbacks),
+                        },
+                    )
+
+        return {"pid": os.getpid(), "buckets": list(self.buckets), "actions": actions}
+
+    def flush(self) -> None:
+        """Write the snapshot of the current process to the shared directory."""
+        if self.directory is None or not self._flush_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._flushed = monotonic()
+            path = os.path.join(self.directory, f"metrics-{os.getpid()}.json")
+            temporary = f"{path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(self.snapshot(), file)
+            os.replace(temporary, path)
+        finally:
+            self._flush_lock.release()
+
+    def collect(self) -> Dict[str, Any]:
+        """Return the metrics of the application.
+
+        Returns:
+            The snapshot of the current process, merged with the snapshots of the
+            other worker processes when a shared directory is configured
+        """
+        snapshot = self.snapshot()
+        if self.directory is None:
+            return snapshot
+
+        self.flush()
+        actions: Dict[str, Dict[str, Any]] = {}
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    worker = json.load(file)
+            except (OSError, ValueError):
+                continue
+
+            if worker.get("buckets") != snapshot["buckets"]:
+                continue
+            alive = _is_alive(worker["pid"])
+            for endpoint, values in worker["actions"].items():
+                if not alive:
+                    values = dict(values, in_flight=0)
+                merge(actions, endpoint, values)
+
+        return dict(snapshot, actions=actions)
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        return render_prometheus(self.collect())
+
+
+def merge(
+    actions: Dict[str, Dict[str, Any]], endpoint: str, values: Dict[str, Any]
+) -> None:
+    """Add the metrics of an action to a snapshot.
+
+    Args:
+        actions: The metrics of each action of the snapshot
+        endpoint: The "controller.action" endpoint
+        values: The metrics to add
+    """
+    current = actions.get(endpoint)
+    if current is None:
+        actions[endpoint] = json.loads(json.dumps(values))
+        return
+
+    current["in_flight"] += values["in_flight"]
+    for status_class, count in values["statuses"].items():
+        current["statuses"][status_class] = (
+            current["statuses"].get(status_class, 0) + count
+        )
+    for histogram in ("duration", "action_duration"):
+        counts, total = values[histogram]
+        current[histogram][0] = [a + b for a, b in zip(current[histogram][0], counts)]
+        current[histogram][1] += total
+    for phase, seconds in values["callbacks"].items():
+        current["callbacks"][phase] = current["callbacks"].get(phase, 0.0) + seconds
+
+
+def render_prometheus(snapshot: Dict[str, Any]) -> str:
+    """Render a snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: The metrics, as returned by ``MetricsRegistry.collect``
+
+    Returns:
+        The exposition text
+    """
+    buckets = snapshot["buckets"]
+    actions = sorted(
+        snapshot["actions"].values(), key=lambda a: (a["controller"], a["action"])
+    )
+    lines = []
+
+    def labels(values, **extra):
+        pairs = {
+            "controller": values["controller"],
+            "action": values["action"],
+            **extra,
+        }
+        return ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs.items())
+
+    def metric(name, kind, description):
+        lines.extend((f"# HELP {name} {description}", f"# TYPE {name} {kind}"))
+
+    def sample(name, values, value, **extra):
+        lines.append(f"{name}{{{labels(values, **extra)}}} {value}")
+
+    name = "flask_mvc_requests_total"
+    metric(name, "counter", "Requests served by a controller action.")
+    for values in actions:
+        for status_class, count in sorted(values["statuses"].items()):
+            sample(name, values, count, status=status_class)
+
+    name = "flask_mvc_requests_in_flight"
+    metric(name, "gauge", "Requests being served by a controller action.")
+    for values in actions:
+        sample(name, values, values["in_flight"])
+
+    for histogram, description in (
+        ("request_duration_seconds", "Duration of the requests, callbacks included."),
+        ("action_duration_seconds", "Duration of the actions, callbacks excluded."),
+    ):
+        key = "duration" if histogram.startswith("request") else "action_duration"
+        name = f"flask_mvc_{histogram}"
+        metric(name, "histogram", description)
+        for values in actions:
+            counts, total = values[key]
+            cumulative = 0
+            for bound, count in zip([*buckets, "+Inf"], counts):
+                cumulative += count
+                sample(f"{name}_bucket", values, cumulative, le=bound)
+            sample(f"{name}_sum", values, total)
+            sample(f"{name}_count", values, cumulative)
+
+    name = "flask_mvc_callback_seconds_total"
+    metric(name, "counter", "Time spent in the callbacks of a controller action.")
+    for values in actions:
+        for phase, seconds in sorted(values["callbacks"].items()):
+            sample(name, values, seconds, hook=phase)
+
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
@@ -0,0 +1,145 @@
+"""Server-Timing response header for the phases Flask MVC controls.
+
+With ``FLASK_MVC_SERVER_TIMING`` enabled, responses of controller actions get
+a ``Server-Timing`` header with the time spent rewriting the method override,
+in before callbacks, in the action, rendering templates and in after
+callbacks. Controllers add their own entries with ``timing`` or ``record``::
+
+    from flask_mvc.core.server_timing import timing
+
+    with timing("db", "Load messages"):
+        messages = Message.query.all()
+"""
+
+import re
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, Optional
+
+from .timeline import RequestTimeline, current_timeline
+
+ENVIRON_PREFIX = "flask_mvc.timing."
+
+# Header entry of each built-in phase, in the order they happen
+PHASES = {
+    "method_override": "method-override",
+    "before_request": "before-callbacks",
+    "action": "action",
+    "render": "render",
+    "after_request": "after-callbacks",
+}
+
+_INVALID_NAME_CHARACTERS = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+
+
+def is_enabled(app) -> bool:
+    """Check whether responses get a Server-Timing header.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        True with ``FLASK_MVC_SERVER_TIMING``, or with tracing headers, which are
+        sent in debug mode unless ``FLASK_MVC_TRACING_HEADERS`` says otherwise
+    """
+    config = app.config
+    if config.get("FLASK_MVC_SERVER_TIMING"):
+        return True
+    if config.get("FLASK_MVC_TRACING"):
+        headers = config.get("FLASK_MVC_TRACING_HEADERS")
+        return app.debug if headers is None else bool(headers)
+    return False
+
+
+def record(name: str, seconds: float, description: Optional[str] = None) -> None:
+    """Add a named timing to the Server-Timing header of the current request.
+
+    Timings recorded several times under the same name are summed. Nothing is
+    recorded outside of instrumented requests.
+
+    Args:
+        name: Name of the timing, e.g. "db"
+        seconds: Duration of the timing
+        description: Description shown by browser devtools
+    """
+    timeline = current_timeline()
+    if timeline is None:
+        return
+
+    timeline.add(name, seconds)
+    if description is not None:
+        timeline.descriptions[name] = description
+
+
+@contextmanager
+def timing(name: str, description: Optional[str] = None) -> Iterator[None]:
+    """Time a block of code into the Server-Timing header of the current request.
+
+    Args:
+        name: Name of the timing, e.g. "db"
+        description: Description shown by browser devtools
+    """
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        record(name, perf_counter() - started, description)
+
+
+def header(timeline: RequestTimeline) -> str:
+    """Build the Server-Timing header of a request.
+
+    Args:
+        timeline: The timeline of the request
+
+    Returns:
+        The built-in phases that ran, the custom timings and the total duration,
+        in milliseconds
+    """
+    entries = []
+    for phase, name in PHASES.items():
+        if phase in timeline.phases:
+            entries.append(_entry(name, timeline.phases[phase]))
+
+    for name, seconds in timeline.phases.items():
+        if name not in PHASES:
+            entries.append(_entry(name, seconds, timeline.descriptions.get(name)))
+
+    entries.append(_entry("total", timeline.elapsed()))
+    return ", ".join(entries)
+
+
+def _entry(name: str, seconds: float, description: Optional[str] = None) -> str:
+    entry = f"{_INVALID_NAME_CHARACTERS.sub('-', name)};dur={seconds * 1000:.3f}"
+    if description:
+        escaped = description.replace("\\", "\\\\").replace('"', '\\"')
+        entry += f';desc="{escaped}"'
+    return entry
+
+
+class MethodOverrideTimer:
+    """Times a WSGI middleware, from its call until it calls the application it wraps.
+
+    The duration is left in the WSGI environ, where the instrumentation picks it up
+    once the request reaches Flask.
+    """
+
+    def __init__(self, wsgi_app, middleware_class, phase: str = "method_override"):
+        """Wrap a WSGI application in a timed middleware.
+
+        Args:
+            wsgi_app: The WSGI application
+            middleware_class: The middleware to time, called with the application
+            phase: Name of the phase the middleware belongs to
+        """
+        self.key = f"{ENVIRON_PREFIX}{phase}"
+        self.wsgi_app = wsgi_app
+        self.middleware = middleware_class(self._call_application)
+
+    def __call__(self, environ, start_response):
+        environ[self.key] = perf_counter()
+        return self.middleware(environ, start_response)
+
+    def _call_application(self, environ, start_response):
+        environ[self.key] = perf_counter() - environ[self.key]
+        return self.wsgi_app(environ, start_response)
@@ -0,0 +1,132 @@
+"""Per-request timing of the phases Flask MVC controls.
+
+When instrumentation is enabled, every request to a controller endpoint gets a
+``RequestTimeline`` on ``flask.g``, and the callbacks and actions bound by the
+middlewares add the time they take to it, along with their spans when tracing
+is enabled. Metrics are recorded from the timeline once the request is torn
+down.
+"""
+
+from functools import update_wrapper
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from flask import g, has_app_context
+
+TIMELINE_ATTRIBUTE = "_mvc_timeline"
+
+INSTRUMENTATION_OPTIONS = (
+    "FLASK_MVC_METRICS",
+    "FLASK_MVC_TRACING",
+    "FLASK_MVC_SERVER_TIMING",
+)
+
+
+class RequestTimeline:
+    """The time spent in each phase of a request."""
+
+    __slots__ = (
+        "controller",
+        "action",
+        "started",
+        "phases",
+        "descriptions",
+        "spans",
+        "status",
+    )
+
+    def __init__(self, controller: str, action: str) -> None:
+        """Start the timeline of a request.
+
+        Args:
+            controller: Name of the controller serving the request
+            action: Name of the action serving the request
+        """
+        self.controller = controller
+        self.action = action
+        self.started = perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.descriptions: Dict[str, str] = {}
+        self.spans: List[Any] = []
+        self.status: Optional[int] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase.
+
+        Args:
+            phase: Name of the phase, e.g. "action" or "before_request"
+            seconds: Time spent in the phase
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        """Return the time elapsed since the request started, in seconds."""
+        return perf_counter() - self.started
+
+    def summary(self) -> Dict[str, float]:
+        """Return the time spent in callbacks versus the action, in seconds.
+
+        Returns:
+            The "callbacks" and "action" durations, and the "total" duration of
+            the request so far
+        """
+        return {
+            "callbacks": self.phases.get("before_request", 0.0)
+            + self.phases.get("after_request", 0.0),
+            "action": self.phases.get("action", 0.0),
+            "total": self.elapsed(),
+        }
+
+
+def is_instrumented(config: Mapping[str, Any]) -> bool:
+    """Check whether any option needing request timelines is enabled.
+
+    Args:
+        config: The application config
+
+    Returns:
+        True if callbacks and actions must be timed
+    """
+    return any(config.get(option) for option in INSTRUMENTATION_OPTIONS)
+
+
+def current_timeline() -> Optional[RequestTimeline]:
+    """Return the timeline of the current request, if it has one."""
+    if not has_app_context():
+        return None
+    return g.get(TIMELINE_ATTRIBUTE)
+
+
+def timed(
+    function: Callable,
+    phase: str,
+    tracer: Optional[Any] = None,
+    span_name: Optional[str] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Callable:
+    """Wrap a callback or action so its duration is added to the request timeline.
+
+    Args:
+        function: The callback or view function
+        phase: Name of the phase the function belongs to
+        tracer: Tracer running each call in a span, if tracing is enabled
+        span_name: Name of the span
+        attributes: Attributes of the span
+
+    Returns:
+        The wrapped function
+    """
+
+    def wrapper(*args, **kwargs):
+        started = perf_counter()
+        try:
+            if tracer is None:
+                return function(*args, **kwargs)
+            with tracer.start_as_current_span(span_name, attributes=attributes):
+                return function(*args, **kwargs)
+        finally:
+            timeline = g.get(TIMELINE_ATTRIBUTE)
+            if timeline is not None:
+                timeline.add(phase, perf_counter() - started)
+
+    return update_wrapper(wrapper, function)
@@ -0,0 +1,148 @@
+"""Tracing of controller callbacks and actions.
+
+With ``FLASK_MVC_TRACING`` enabled, each callback and action runs in a span
+named after its controller, e.g. ``callbacks.before_set_page`` or
+``messages.index``. Spans are started with ``start_as_current_span``, the
+OpenTelemetry tracer API, so an OpenTelemetry tracer can be set as the
+``FLASK_MVC_TRACER`` option. Otherwise the built-in ``Tracer`` is used, which
+has no dependency, records the spans of a request on its timeline and hands
+each finished span to the listeners added to it.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .timeline import current_timeline
+
+TRACER_EXTENSION = "flask_mvc.tracer"
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "flask_mvc_current_span", default=None
+)
+
+
+class Span:
+    """A timed operation, with the subset of the OpenTelemetry span API in use."""
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional["Span"] = None,
+    ) -> None:
+        """Start the span.
+
+        Args:
+            name: Name of the span
+            attributes: Attributes describing the operation
+            parent: The span this one is nested in
+        """
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.status = "UNSET"
+        self.events: List[Dict[str, Any]] = []
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+
+    @property
+    def duration(self) -> float:
+        """float: Duration of the span in seconds, or until now if it is not ended."""
+        return ((self.end_time or time.time_ns()) - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def set_status(self, status: Any, description: Optional[str] = None) -> None:
+        """Set the status of the span, e.g. "OK" or "ERROR"."""
+        self.status = status
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised during the span."""
+        self.events.append(
+            {
+                "name": "exception",
+                "exception.type": type(exception).__name__,
+                "exception.message": str(exception),
+            }
+        )
+
+    def is_recording(self) -> bool:
+        """Check whether the span is still running."""
+        return self.end_time is None
+
+    def end(self) -> None:
+        """End the span."""
+        if self.end_time is None:
+            self.end_time = time.time_ns()
+
+
+class Tracer:
+    """A dependency-free tracer, compatible with the OpenTelemetry tracer API."""
+
+    def __init__(self) -> None:
+        """Initialize the tracer, without listeners."""
+        self.listeners: List[Callable[[Span], None]] = []
+
+    def add_listener(self, listener: Callable[[Span], None]) -> None:
+        """Call a function with each span once it ends.
+
+        Args:
+            listener: Function receiving the ended span, e.g. to export it
+        """
+        self.listeners.append(listener)
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Iterator[Span]:
+        """Run a block of code in a new span, nested in the current one.
+
+        Args:
+            name: Name of the span
+            attributes: Attributes describing the operation
+
+        Yields:
+            The span. Exceptions raised by the block are recorded on it.
+        """
+        span = Span(name, attributes, _current_span.get())
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            span.set_status("ERROR", str(e))
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+            timeline = current_timeline()
+            if timeline is not None:
+                timeline.spans.append(span)
+            for listener in self.listeners:
+                listener(span)
+
+
+def get_tracer(app) -> Optional[Any]:
+    """Return the tracer of an application.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        None if ``FLASK_MVC_TRACING`` is off, else the ``FLASK_MVC_TRACER``
+        option or the built-in tracer of the application
+    """
+    if not app.config.get("FLASK_MVC_TRACING"):
+        return None
+
+    tracer = app.config.get("FLASK_MVC_TRACER")
+    if tracer is None:
+        tracer = app.extensions.get(TRACER_EXTENSION)
+        if tracer is None:
+            tracer = app.extensions[TRACER_EXTENSION] = Tracer()
+    return tracer
@@ -0,0 +1,47 @@
+"""Splitting the values returned by views into their parts, and back."""
+
+from typing import Any, Optional, Tuple
+
+from werkzeug.datastructures import Headers
+
+
+def unpack(result: Any) -> Tuple[Any, Optional[Any], Optional[Any]]:
+    """Split the value returned by a view into its body, status and headers.
+
+    Args:
+        result: The body, or a (body, status), (body, headers) or
+            (body, status, headers) tuple, as accepted by Flask
+
+    Returns:
+        The body, status and headers, None for the missing ones
+    """
+    if not isinstance(result, tuple):
+        return result, None, None
+    if len(result) == 3:
+        return result
+    if len(result) == 2:
+        body, extra = result
+        if isinstance(extra, (Headers, dict, tuple, list)):
+            return body, None, extra
+        return body, extra, None
+    return result, None, None
+
+
+def pack(body: Any, status: Optional[Any], headers: Optional[Any]) -> Any:
+    """Build back the value returned by a view from its parts.
+
+    Args:
+        body: The body
+        status: The status, or None
+        headers: The headers, or None
+
+    Returns:
+        A value Flask turns into a response
+    """
+    if status is None and headers is None:
+        return body
+    if headers is None:
+        return body, status
+    if status is None:
+        return body, headers
+    return body, status, headers
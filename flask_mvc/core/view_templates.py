@@ -0,0 +1,109 @@
+"""Templates of controller actions, resolved once per endpoint.
+
+Actions rendered by convention use the ``<controller>/<action>.html`` template
+of the views folder. ``ViewTemplates`` resolves that template the first time an
+endpoint needs it (or when ``FlaskMVC.warmup`` runs) and keeps the compiled
+``Template``, so later requests skip the name building and the loader search.
+With ``TEMPLATES_AUTO_RELOAD`` (e.g. in debug mode), templates are looked up on
+every render instead, so edits are picked up.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from flask import Flask
+from flask.signals import before_render_template, template_rendered
+from jinja2 import Template, TemplateNotFound
+
+VIEW_TEMPLATES_EXTENSION = "flask_mvc.view_templates"
+
+# Cached for endpoints without a template
+_MISSING = object()
+
+
+def template_name(endpoint: str) -> str:
+    """Return the conventional template of an endpoint, "controller.action".
+
+    Args:
+        endpoint: The endpoint, in the "controller.action" format
+
+    Returns:
+        The template name, "controller/action.html"
+    """
+    controller, _, action = endpoint.rpartition(".")
+    return f"{controller}/{action}.html"
+
+
+class ViewTemplates:
+    """The conventional templates of the endpoints of an application."""
+
+    def __init__(self, app: Flask) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            app: Flask application instance
+        """
+        self.app = app
+        self._templates: Dict[str, Any] = {}
+
+    def get(self, endpoint: str) -> Optional[Template]:
+        """Return the template of an endpoint, or None when it has none.
+
+        Args:
+            endpoint: The endpoint, in the "controller.action" format
+        """
+        if self.app.jinja_env.auto_reload:
+            return self._load(endpoint)
+
+        template = self._templates.get(endpoint)
+        if template is None:
+            template = self._load(endpoint)
+            self._templates[endpoint] = _MISSING if template is None else template
+        return None if template is _MISSING else template
+
+    def preload(self, endpoints: Iterable[str]) -> None:
+        """Resolve the templates of endpoints ahead of their first request.
+
+        Args:
+            endpoints: The endpoints, in the "controller.action" format
+        """
+        for endpoint in endpoints:
+            self.get(endpoint)
+
+    def render(self, template: Template, context: Dict[str, Any]) -> str:
+        """Render a template as ``render_template`` does.
+
+        Args:
+            template: The template
+            context: The variables of the template
+
+        Returns:
+            The rendered template
+        """
+        app = self.app
+        app.update_template_context(context)
+        before_render_template.send(
+            app, _async_wrapper=app.ensure_sync, template=template, context=context
+        )
+        rendered = template.render(context)
+        template_rendered.send(
+            app, _async_wrapper=app.ensure_sync, template=template, context=context
+        )
+        return rendered
+
+    def _load(self, endpoint: str) -> Optional[Template]:
+        try:
+            return self.app.jinja_env.get_template(template_name(endpoint))
+        except TemplateNotFound:
+            return None
+
+
+def get_view_templates(app: Flask) -> ViewTemplates:
+    """Return the view templates of an application, creating them on first use.
+
+    Args:
+        app: Flask application instance
+    """
+    templates = app.extensions.get(VIEW_TEMPLATES_EXTENSION)
+    if templates is None:
+        templates = app.extensions[VIEW_TEMPLATES_EXTENSION] = ViewTemplates(app)
+    return templates
@@ -1,43 +1,347 @@
+import gc
+import os
+from functools import partial
+from types import MappingProxyType
+
 from flask import Flask
-from method_override.wsgi_method_override import MethodOverrideMiddleware
+from jinja2 import (
+    BytecodeCache,
+    FileSystemBytecodeCache,
+    TemplateError,
+    TemplateSyntaxError,
+)
+from jinja2.utils import LRUCache
 
 from . import cli
-from .helpers.html.input_method_helper import InputMethodHelper
+from .core import json_provider
+from .core.boot_profiler import BootProfiler
+from .core.cache import generation_key, get_cache
+from .core.config import MVCConfig
+from .core.exceptions import ManifestError
+from .core.manifest import RouteManifest
+from .core.server_timing import MethodOverrideTimer
+from .core.server_timing import is_enabled as server_timing_enabled
+from .core.tracing import get_tracer
+from .core.view_templates import get_view_templates
+from .helpers.html.fragment_cache_helper import FragmentCacheExtension
+from .helpers.html.input_method_helper import input_hidden_method
 from .middlewares.blueprint_middleware import BlueprintMiddleware
+from .middlewares.controller_middleware import import_controller
+from .middlewares.http.method_override_middleware import MethodOverrideMiddleware
+from .middlewares.http.route_table import Route, RouteTable
 from .middlewares.http.router_middleware import RouterMiddleware as Router
+from .middlewares.instrumentation_middleware import InstrumentationMiddleware
+
+DEFAULT_MANIFEST = "routes.manifest.json"
+
+# Shared by every render, the helpers are not rebuilt per template
+TEMPLATE_HELPERS = MappingProxyType({"method": input_hidden_method})
+
+
+def inject_template_helpers():
+    return TEMPLATE_HELPERS
 
 
 class FlaskMVC:
-    def __init__(self, app: Flask = None, path="app"):
+    def __init__(self, app: Flask = None, path="app", manifest=None):
+        """Initialize the extension.
+
+        Args:
+            app: Flask application instance
+            path: The package holding the routes module, controllers and views
+            manifest: Path of a route manifest (see ``flask mvc routes compile``),
+                relative to the application root. When it is up to date, routes and
+                controller bindings are read from it instead of evaluating routes.py.
+        """
+        self.router = Router()
+        self.routes = None
+        self.controllers = {}
+        self.bindings = {}
+        self.manifest = manifest
+        self.profiler = BootProfiler()
+        self.instrumentation = None
+        self.app = None
+        self.path = None
+
         if app is not None:
             self.init_app(app, path)
 
     def init_app(self, app: Flask = None, path="app"):
         self.perform(app, path)
 
+    @property
+    def metrics(self):
+        """MetricsRegistry: The request metrics, or None if FLASK_MVC_METRICS is off."""
+        return self.instrumentation.metrics if self.instrumentation else None
+
+    @property
+    def tracer(self):
+        """The tracer of callbacks and actions, or None if FLASK_MVC_TRACING is off."""
+        return get_tracer(self.app)
+
+    def invalidate_cache(self, controller_name):
+        """Invalidate every cached response of a controller.
+
+        Create, update and delete actions invalidate the responses of their own
+        controller; this is for changes made elsewhere, e.g. by a background job.
+
+        Args:
+            controller_name: Name of the controller
+        """
+        get_cache(self.app).incr(generation_key(controller_name))
+
+    @property
+    def boot_profile(self):
+        """dict: The boot timings recorded by init_app, or None if profiling is off.
+
+        See ``BootProfiler.report`` for the layout of the dict.
+        """
+        return self.profiler.report() if self.profiler.enabled else None
+
+    def compile_manifest(self, output=None):
+        """Write the route manifest of the application.
+
+        The routes are evaluated from routes.py, even when the application was
+        booted from a manifest, and every controller is imported to record the
+        callbacks it declares.
+
+        Args:
+            output: Path of the manifest file. Defaults to the manifest given to
+                FlaskMVC, or to routes.manifest.json in the application root.
+
+        Returns:
+            The path of the written manifest
+        """
+        routes = RouteTable(
+            dict.fromkeys(
+                (*Router.module_routes(f"{self.path}.routes"), *self.router.routes)
+            )
+        )
+        controllers = {
+            name: import_controller(self.path, name) for name in routes.controllers
+        }
+
+        output = output or self._manifest_path(self.app)
+        RouteManifest.build(self.path, routes, controllers).write(output)
+        return output
+
+    def warmup(self, controllers=None, templates=True, freeze=False):
+        """Do ahead of time the work that workers would otherwise do on first requests.
+
+        Meant to be called before forking workers, e.g. from gunicorn's preload
+        hook, so forked workers share the loaded controllers, compiled templates
+        and routing indexes copy-on-write.
+
+        Args:
+            controllers: Names of the controllers to load. Defaults to every controller.
+            templates: Whether to compile every template under the views folder,
+                and resolve the template of each action of the controllers.
+            freeze: Whether to call ``gc.freeze()`` once done, so the garbage
+                collector does not touch (and copy) the warmed up objects.
+
+        Returns:
+            A dict with the names of the loaded controllers and compiled templates
+        """
+        names = list(self.controllers) if controllers is None else list(controllers)
+        for name in names:
+            self.controllers[name].load()
+
+        compiled = []
+        if templates:
+            compiled = self._compile_templates(self.app)
+            get_view_templates(self.app).preload(
+                route.endpoint
+                for name in names
+                for route in self.routes.controllers.get(name, ())
+            )
+        self.app.url_map.update()
+
+        if freeze:
+            gc.collect()
+            gc.freeze()
+
+        return {"controllers": names, "templates": compiled}
+
+    def compile_views(self):
+        """Compile every template under the views folder, ahead of deploy.
+
+        With ``FLASK_MVC_TEMPLATE_BYTECODE_CACHE`` set, the compiled templates are
+        written to the bytecode cache, where workers load them instead of compiling
+        them on first use.
+
+        Returns:
+            A dict with the names of the compiled templates, the error of each
+            template that failed to compile and the bytecode cache, if any
+        """
+        errors = {}
+        compiled = self._compile_templates(self.app, errors)
+        return {
+            "templates": compiled,
+            "errors": errors,
+            "bytecode_cache": self.app.jinja_env.bytecode_cache,
+        }
+
     def perform(self, app: Flask, path: str):
-        self._configure_template_folder(app)
-        self._configure_method_override_middleware(app)
-        self._configure_blueprint_middleware(app, path)
-        self._inject_object_in_jinja_template(app)
-        self._configure_cli_commands(app)
+        self.app = app
+        self.path = path
+        MVCConfig.init_app(app)
+
+        profiler = self.profiler = BootProfiler.from_config(app.config)
+        profiler.start()
+        try:
+            with profiler.phase("configure_template_folder"):
+                self._configure_template_folder(app)
+            with profiler.phase("configure_json_provider"):
+                json_provider.init_app(app)
+            with profiler.phase("load_routes"):
+                self._load_routes(app, path)
+            with profiler.phase("configure_method_override_middleware"):
+                self._configure_method_override_middleware(app)
+            with profiler.phase("register_controllers"):
+                self._configure_blueprint_middleware(app, path)
+            with profiler.phase("configure_instrumentation"):
+                self._configure_instrumentation_middleware(app)
+            with profiler.phase("inject_template_helpers"):
+                self._inject_object_in_jinja_template(app)
+            with profiler.phase("configure_cli_commands"):
+                self._configure_cli_commands(app)
+        finally:
+            profiler.stop()
 
     def _configure_template_folder(self, app):
         app.template_folder = "views"
 
+        bytecode_cache = app.config["FLASK_MVC_TEMPLATE_BYTECODE_CACHE"]
+        if bytecode_cache is None:
+            return
+        if not isinstance(bytecode_cache, BytecodeCache):
+            directory = os.path.join(app.root_path, bytecode_cache)
+            os.makedirs(directory, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(directory)
+
+        app.jinja_options = {**app.jinja_options, "bytecode_cache": bytecode_cache}
+        if "jinja_env" in app.__dict__:
+            app.jinja_env.bytecode_cache = bytecode_cache
+
     def _configure_method_override_middleware(self, app):
-        app.wsgi_app = MethodOverrideMiddleware(app.wsgi_app)
+        middleware = partial(
+            MethodOverrideMiddleware,
+            routes=self.routes,
+            converters=app.url_map.converters,
+        )
+        if server_timing_enabled(app):
+            app.wsgi_app = MethodOverrideTimer(app.wsgi_app, middleware)
+        else:
+            app.wsgi_app = middleware(app.wsgi_app)
+
+    def _load_routes(self, app, path):
+        """Load the routes defined by users and freeze them into a route table."""
+        manifest = self._read_manifest(app, path)
+        if manifest is None:
+            routes = Router.module_routes(f"{path}.routes")
+        else:
+            routes = tuple(
+                Route(
+                    route["methods"],
+                    route["path"],
+                    route["controller"],
+                    route["action"],
+                )
+                for route in manifest.routes
+            )
+            self.bindings = manifest.controllers
+
+        self.routes = RouteTable(dict.fromkeys((*routes, *self.router.routes)))
+        app.extensions["flask_mvc"] = self
+
+    def _manifest_path(self, app):
+        return os.path.join(app.root_path, self.manifest or DEFAULT_MANIFEST)
+
+    def _read_manifest(self, app, path):
+        """Read the route manifest, if one is configured and up to date."""
+        if self.manifest is None:
+            return None
+
+        manifest_path = self._manifest_path(app)
+        if not os.path.exists(manifest_path):
+            return None
+
+        try:
+            manifest = RouteManifest.load(manifest_path)
+        except ManifestError as e:
+            app.logger.warning(f"Ignoring route manifest: {e}")
+            return None
+
+        if not manifest.is_fresh(path):
+            app.logger.warning(
+                f"Route manifest {manifest_path} is stale, evaluating routes instead. "
+                "Run 'flask mvc routes compile' to update it."
+            )
+            return None
+        return manifest
 
     def _configure_blueprint_middleware(self, app, path):
-        BlueprintMiddleware(app, path).register()
+        blueprints = BlueprintMiddleware(
+            app, path, self.routes, self.bindings, self.profiler
+        )
+        blueprints.register()
+        self.controllers = blueprints.controllers
+
+    def _configure_instrumentation_middleware(self, app):
+        self.instrumentation = InstrumentationMiddleware(app, self.routes)
+        self.instrumentation.register()
 
     def _inject_object_in_jinja_template(self, app):
-        @app.context_processor
-        def inject_stage_and_region():
-            return {
-                "method": InputMethodHelper().input_hidden_method,
-            }
+        app.context_processor(inject_template_helpers)
+
+        extensions = list(app.jinja_options.get("extensions", ()))
+        app.jinja_options = {
+            **app.jinja_options,
+            "extensions": [*extensions, FragmentCacheExtension],
+        }
+        if "jinja_env" in app.__dict__:
+            app.jinja_env.add_extension(FragmentCacheExtension)
+
+    def _compile_templates(self, app, errors=None):
+        """Compile every template under the views folder into the Jinja cache.
+
+        Args:
+            app: The Flask application.
+            errors: A dict collecting the error of each template that fails to
+                compile, by template name. When None, errors are raised.
+
+        Returns:
+            The names of the compiled templates
+        """
+        if app.jinja_loader is None:
+            return []
+
+        names = app.jinja_loader.list_templates()
+
+        # Keep every compiled template, a smaller LRU cache would evict some of them
+        cache = app.jinja_env.cache
+        if isinstance(cache, LRUCache) and cache.capacity < len(names):
+            app.jinja_env.cache = LRUCache(len(names))
+
+        compiled = []
+        for name in names:
+            try:
+                app.jinja_env.get_template(name)
+            except TemplateError as error:
+                if errors is None:
+                    raise
+                errors[name] = _template_error(error)
+            else:
+                compiled.append(name)
+        return compiled
 
     def _configure_cli_commands(self, app):
         """Register CLI commands with the Flask app."""
         cli.init_app(app)
+
+
+def _template_error(error):
+    """Describe a template error, with its line for syntax errors."""
+    if isinstance(error, TemplateSyntaxError):
+        return f"line {error.lineno}: {error.message}"
+    return f"{type(error).__name__}: {error}"
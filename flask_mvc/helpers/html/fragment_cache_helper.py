@@ -0,0 +1,78 @@
+from flask import current_app, has_request_context, request
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from ...core.cache import DEFAULT_TTL, generation_key, get_cache
+
+
+class FragmentCacheExtension(Extension):
+    """
+    A Jinja extension caching the output of template fragments.
+
+    Usage in a template:
+
+        {% cache "sidebar", 300 %}
+            ... expensive markup ...
+        {% endcache %}
+
+    The fragment is stored in the response cache of the application (see
+    ``flask_mvc.core.cache.get_cache``): an in-process LRU cache by default, or the
+    backend shared by the workers set with ``FLASK_MVC_CACHE_BACKEND``. Keys are
+    scoped to the endpoint of the current request, "controller.action", and to the
+    cache generation of its controller, so ``FlaskMVC.invalidate_cache`` and the
+    controller's create, update and delete actions also expire its fragments.
+
+    Methods:
+    - parse: Parses the cache block into a call to _cache.
+    - _cache: Returns the cached fragment, rendering and storing it when missing.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        """
+        Parses a ``{% cache key, ttl %}...{% endcache %}`` block.
+
+        Args:
+        - parser (Parser): The Jinja parser, positioned on the cache tag.
+
+        Returns:
+        - CallBlock: A node calling _cache with the key, the TTL and the block body.
+        """
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(DEFAULT_TTL))
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_cache", args), [], [], body
+        ).set_lineno(lineno)
+
+    def _cache(self, key, ttl, caller):
+        """
+        Returns the cached fragment, rendering and storing it when missing.
+
+        Args:
+        - key: The key of the fragment, unique within the endpoint.
+        - ttl (float): Seconds before the fragment expires. It never expires when None.
+        - caller (function): Renders the body of the block.
+
+        Returns:
+        - Markup: The fragment, already escaped when rendered.
+        """
+        backend = get_cache(current_app)
+        endpoint = request.endpoint if has_request_context() else None
+        controller = endpoint.rpartition(".")[0] if endpoint else None
+
+        generation = backend.get(generation_key(controller)) if controller else None
+        fragment_key = f"flask_mvc:fragment:{endpoint}:{generation or 0}:{key}"
+
+        fragment = backend.get(fragment_key)
+        if fragment is None:
+            fragment = caller()
+            backend.set(fragment_key, str(fragment), ttl)
+        return Markup(fragment)  #  nosec: B704
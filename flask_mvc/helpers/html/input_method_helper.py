@@ -1,11 +1,64 @@
+from types import MappingProxyType
+
 import markupsafe
 
+from ...core.exceptions import InvalidMethodError
+
+OVERRIDE_METHODS = ("PUT", "PATCH", "DELETE")
+
+
+def _input_html(input_method):
+    """
+    Generates a hidden HTML input element with proper escaping.
+
+    Args:
+    - input_method (str): The HTTP method to be used (e.g., 'put', 'delete').
+
+    Returns:
+    - str: A safe HTML string for a hidden input element with the specified method.
+    """
+    return f"<input type='hidden' name='_method' value={input_method.upper()}>"
+
+
+# Rendered once: templates get the same Markup objects on every call
+HIDDEN_METHOD_INPUTS = MappingProxyType(
+    {
+        method: markupsafe.Markup(_input_html(method))  #  nosec: B704
+        for method in OVERRIDE_METHODS
+    }
+)
+
+
+def input_hidden_method(input_method):
+    """
+    Returns the hidden input overriding the method of a form.
+
+    Args:
+    - input_method (str): The method, case insensitive ('put', 'patch' or 'delete').
+
+    Returns:
+    - Markup: A markupsafe.Markup object containing the hidden input.
+              This object is safe to render directly in templates.
+
+    Raises:
+    - InvalidMethodError: When the method cannot be sent through a form override.
+    """
+    try:
+        return HIDDEN_METHOD_INPUTS[input_method.upper()]
+    except (AttributeError, KeyError):
+        raise InvalidMethodError(
+            f"Unknown method {input_method!r} for a form method override, "
+            f"expected one of {', '.join(OVERRIDE_METHODS)}"
+        ) from None
+
 
 class InputMethodHelper:
     """
     A middleware class for handling HTML-related operations, specifically for creating hidden input fields
     with specific methods (like PUT and DELETE) that are not natively supported by HTML forms.
 
+    The inputs are rendered once, in the module level HIDDEN_METHOD_INPUTS table.
+
     Methods:
     - _input_html: Private method to generate HTML input element.
     - _put: Private method to generate a hidden input field for the PUT method.
@@ -18,18 +71,13 @@ class InputMethodHelper:
         Determines the appropriate HTML string to return based on the given method string.
 
         Args:
-        - string (str): The method string (e.g., 'put', 'delete').
+        - string (str): The method string (e.g., 'put', 'patch', 'delete').
 
         Returns:
         - Markup: A markupsafe.Markup object containing the appropriate HTML string.
                   This object is safe to render directly in templates.
         """
-        result = {
-            "put": self._put(),
-            "delete": self._delete(),
-        }[input_method.lower()]
-
-        return markupsafe.Markup(result)  #  nosec: B704
+        return input_hidden_method(input_method)
 
     def _input_html(self, input_method):
         """
@@ -41,7 +89,7 @@ class InputMethodHelper:
         Returns:
         - str: A safe HTML string for a hidden input element with the specified method.
         """
-        return f"<input type='hidden' name='_method' value={input_method.upper()}>"
+        return _input_html(input_method)
 
     def _put(self):
         """
@@ -50,7 +98,7 @@ class InputMethodHelper:
         Returns:
         - str: An HTML string for a hidden input element for the PUT method.
         """
-        return self._input_html("put")
+        return HIDDEN_METHOD_INPUTS["PUT"]
 
     def _delete(self):
         """
@@ -59,4 +107,4 @@ class InputMethodHelper:
         Returns:
         - str: An HTML string for a hidden input element for the DELETE method.
         """
-        return self._input_html("delete")
+        return HIDDEN_METHOD_INPUTS["DELETE"]
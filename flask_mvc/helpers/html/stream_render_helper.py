@@ -0,0 +1,74 @@
+from flask import current_app, stream_with_context
+from flask.signals import before_render_template, template_rendered
+
+
+def stream_render(
+    template_name_or_list, chunk_size=None, status=None, headers=None, **context
+):
+    """
+    Renders a template from the views folder as a streamed response.
+
+    The template is rendered with Jinja's ``generate()`` while the response is sent,
+    so the beginning of the page leaves before the end is rendered and the whole page
+    is never held in memory. The request context stays available to the template
+    through ``stream_with_context``. Callbacks and middlewares run before the body is
+    rendered, so after_request callbacks only see the status and headers.
+
+    Args:
+    - template_name_or_list (str or list): The template name, or a list of names of
+      which the first existing one is rendered.
+    - chunk_size (int, optional): Number of characters buffered before a chunk is
+      sent. 0 sends every piece Jinja renders as it comes. Defaults to the
+      FLASK_MVC_STREAM_CHUNK_SIZE option.
+    - status (int, optional): The response status. Defaults to 200.
+    - headers (dict, optional): Headers added to the response.
+    - **context: The variables of the template.
+
+    Returns:
+    - Response: A streamed text/html response.
+    """
+    app = current_app._get_current_object()
+    template = app.jinja_env.get_or_select_template(template_name_or_list)
+    app.update_template_context(context)
+    if chunk_size is None:
+        chunk_size = app.config.get("FLASK_MVC_STREAM_CHUNK_SIZE", 8192)
+
+    def generate():
+        before_render_template.send(
+            app, _async_wrapper=app.ensure_sync, template=template, context=context
+        )
+        yield from _chunks(template.generate(context), chunk_size)
+        template_rendered.send(
+            app, _async_wrapper=app.ensure_sync, template=template, context=context
+        )
+
+    return app.response_class(
+        stream_with_context(generate()),
+        status=status,
+        headers=headers,
+        mimetype="text/html",
+    )
+
+
+def _chunks(pieces, chunk_size):
+    """
+    Groups the pieces rendered by Jinja into chunks of at least chunk_size characters.
+
+    Args:
+    - pieces (iterator): The strings rendered by Jinja.
+    - chunk_size (int): The minimum number of characters of a chunk, but the last.
+
+    Returns:
+    - iterator: The chunks to send.
+    """
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
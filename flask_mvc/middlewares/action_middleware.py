@@ -0,0 +1,68 @@
+from functools import update_wrapper
+
+from ..core.event_loop import ensure_sync
+from ..core.timeline import is_instrumented, timed
+from ..core.tracing import get_tracer
+
+
+class ActionMiddleware:
+    def __init__(self, app, controller_name: str, lifecycle, layers=()) -> None:
+        """
+        Initializes the ActionMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the actions are being registered.
+        controller_name (str): The name of the controller that owns the actions.
+        lifecycle: The controller lifecycle, which provides the instance serving a request.
+        layers (iterable, optional): Middlewares wrapping each view, innermost first, with
+            a ``wrap(action, view)`` method, e.g. CacheMiddleware.
+        """
+        self.app = app
+        self.controller_name = controller_name
+        self.lifecycle = lifecycle
+        self.layers = tuple(layers)
+
+    def view(self, action):
+        """
+        Builds the view function Flask dispatches to for the given action.
+
+        Singleton controllers use the bound method directly. Other lifecycles resolve
+        the controller instance of the current request on every call. Async actions
+        are detected here and wrapped according to the FLASK_MVC_ASYNC_MODE option.
+        When instrumentation is enabled, the view adds its duration to the request
+        timeline, and with tracing it runs in a "controller.action" span.
+
+        Parameters:
+        action (str): The name of the action.
+
+        Returns:
+        function: The view function.
+        """
+        view = self._view(action)
+        for layer in self.layers:
+            view = layer.wrap(action, view)
+
+        if is_instrumented(self.app.config):
+            return timed(
+                view,
+                "action",
+                get_tracer(self.app),
+                f"{self.controller_name}.{action}",
+                {
+                    "flask_mvc.controller": self.controller_name,
+                    "flask_mvc.action": action,
+                },
+            )
+        return view
+
+    def _view(self, action):
+        if self.lifecycle.shared:
+            return ensure_sync(self.app, getattr(self.lifecycle.instance(), action))
+
+        lifecycle = self.lifecycle
+        function = ensure_sync(self.app, getattr(lifecycle.controller_class, action))
+
+        def view(**kwargs):
+            return function(lifecycle.instance(), **kwargs)
+
+        return update_wrapper(view, function)
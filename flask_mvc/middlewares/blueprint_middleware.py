@@ -1,37 +1,48 @@
-from importlib import import_module
-
 from flask import Flask
 from flask.blueprints import Blueprint
 
-from .callback_middleware import CallbackMiddleware
-from .http.router_middleware import RouterMiddleware as Router
+from .controller_middleware import ControllerMiddleware
+from .http.route_table import RouteTable
 
 
 class BlueprintMiddleware:
-    def __init__(self, app: Flask, path: str) -> None:
+    def __init__(
+        self,
+        app: Flask,
+        path: str,
+        routes: RouteTable,
+        bindings=None,
+        profiler=None,
+    ) -> None:
         self.app = app
         self.path = path
-
-        # load routes defined from users
-        import_module(f"{self.path}.routes")
+        self.routes = routes
+        self.bindings = bindings or {}
+        self.profiler = profiler
+        self.controllers = {}
 
     def register(self):
-        for route in Router._method_route().items():
+        for route in self.routes.controllers.items():
             controller_name = route[0]
             blueprint = Blueprint(controller_name, controller_name)
 
-            obj = import_module(f"{self.path}.controllers.{controller_name}_controller")
-            view_func = getattr(obj, f"{controller_name.title()}Controller")
-            instance_controller = view_func()
-
-            CallbackMiddleware(self.app, controller_name, instance_controller).register()
+            controller = ControllerMiddleware(
+                self.app,
+                self.path,
+                controller_name,
+                route[1],
+                self.bindings.get(controller_name),
+                self.profiler,
+            )
+            controller.register(blueprint)
+            self.controllers[controller_name] = controller
 
             for resource in route[1]:
                 blueprint.add_url_rule(
                     rule=resource.path,
                     endpoint=resource.action,
-                    view_func=getattr(instance_controller, resource.action),
-                    methods=resource.method,
+                    view_func=controller.view(resource.action),
+                    methods=resource.methods,
                 )
 
             self.app.register_blueprint(blueprint)
@@ -0,0 +1,143 @@
+from functools import update_wrapper
+
+from flask import Flask, current_app, request
+
+from ..core.cache import DEFAULT_TTL, generation_key, get_cache, request_digest
+from .negotiation_middleware import negotiates
+
+
+class CacheMiddleware:
+    """
+    Caches the responses of the actions declared by a controller's ``cache`` attribute.
+
+    Cached responses are served in place of the action, after the before_request
+    callbacks ran, so callbacks guarding the action (e.g. authentication) still apply.
+    Successful create, update and delete actions of the controller invalidate every
+    cached response of the controller. The responses of actions negotiated with
+    ``respond_to`` are cached for each Accept header.
+    """
+
+    INVALIDATING_ACTIONS = ("create", "update", "delete")
+
+    def __init__(self, app: Flask, controller_name: str, controller_class) -> None:
+        """
+        Initializes the CacheMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the actions are being registered.
+        controller_name (str): The name of the controller that owns the actions.
+        controller_class (type): The controller class, which may declare
+            ``cache = dict(actions="index show", ttl=30, vary="Accept")``.
+        """
+        self.app = app
+        self.controller_name = controller_name
+        self.controller_class = controller_class
+        self.declaration = getattr(controller_class, "cache", None)
+        self.backend = get_cache(app) if self.enabled else None
+
+    @property
+    def enabled(self):
+        """bool: Whether the controller declares cached actions."""
+        return isinstance(self.declaration, dict) and "actions" in self.declaration
+
+    def wrap(self, action, view):
+        """
+        Wraps the view function of an action.
+
+        Parameters:
+        action (str): The name of the action.
+        view (function): The view function of the action.
+
+        Returns:
+        function: A view serving cached responses for cached actions, a view
+            invalidating the cache for create, update and delete actions, or the view
+            itself.
+        """
+        if not self.enabled:
+            return view
+        if action in self.declaration["actions"].split():
+            vary = vary_headers(self.declaration, self.controller_class, action)
+            return self._cached(view, vary)
+        if action in self.INVALIDATING_ACTIONS:
+            return self._invalidating(view)
+        return view
+
+    def invalidate(self):
+        """Invalidates every cached response of the controller."""
+        self.backend.incr(generation_key(self.controller_name))
+
+    def key(self, view_args, vary=()):
+        """
+        Builds the cache key of the current request.
+
+        Parameters:
+        view_args (dict): The arguments of the view function.
+        vary (list): The names of the request headers the response depends on.
+
+        Returns:
+        str: A key made of the endpoint, the cache generation of the controller, and a
+            digest of the view arguments, query string and vary headers.
+        """
+        generation = self.backend.get(generation_key(self.controller_name)) or 0
+        digest = request_digest(view_args, vary)
+        return f"flask_mvc:cache:{request.endpoint}:{generation}:{digest}"
+
+    def _cached(self, view, vary):
+        backend = self.backend
+        ttl = self.declaration.get("ttl", DEFAULT_TTL)
+
+        def cached(**kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(**kwargs)
+
+            key = self.key(kwargs, vary)
+            entry = backend.get(key)
+            if entry is not None:
+                status, headers, body = entry
+                return current_app.response_class(body, status=status, headers=headers)
+
+            response = current_app.make_response(view(**kwargs))
+            for header in vary:
+                response.vary.add(header)
+
+            if (
+                response.status_code == 200
+                and not response.is_streamed
+                and "Set-Cookie" not in response.headers
+            ):
+                backend.set(
+                    key,
+                    (response.status_code, list(response.headers), response.get_data()),
+                    ttl,
+                )
+            return response
+
+        return update_wrapper(cached, view)
+
+    def _invalidating(self, view):
+        def invalidating(**kwargs):
+            response = current_app.make_response(view(**kwargs))
+            if response.status_code < 400:
+                self.invalidate()
+            return response
+
+        return update_wrapper(invalidating, view)
+
+
+def vary_headers(declaration, controller_class, action):
+    """
+    Returns the request headers the responses of an action depend on: those of the
+    ``vary`` of a declaration, and Accept for actions negotiated with ``respond_to``.
+
+    Parameters:
+    declaration (dict): The declaration, e.g. ``dict(actions="index", vary="Cookie")``.
+    controller_class (type): The controller class.
+    action (str): The name of the action.
+
+    Returns:
+    list: The names of the headers.
+    """
+    vary = declaration.get("vary", "").replace(",", " ").split()
+    if negotiates(controller_class, action) and "accept" not in map(str.lower, vary):
+        vary.append("Accept")
+    return vary
@@ -1,8 +1,67 @@
 from flask import Flask, request
 
+from ..core.event_loop import ensure_sync
+from ..core.timeline import is_instrumented, timed
+from ..core.tracing import get_tracer
+
+
+class CallbackDispatcher:
+    """
+    Dispatches controller callbacks by endpoint.
+
+    The dispatcher keeps a mapping of ``controller.action`` endpoints to the hooks
+    already bound for them, so each request performs a single dictionary lookup
+    and runs only its own callbacks.
+    """
+
+    def __init__(self, scaffold) -> None:
+        """
+        Initializes the CallbackDispatcher and registers its hooks on the scaffold.
+
+        Parameters:
+        scaffold (Flask or Blueprint): Where the dispatcher hooks are registered. When it
+            is the controller's blueprint, Flask itself skips the hooks for requests
+            to other blueprints.
+        """
+        self.hooks = {"before_request": {}, "after_request": {}}
+
+        scaffold.before_request(self.before_request)
+        scaffold.after_request(self.after_request)
+
+    def add(self, hook_name, endpoint, hook_method):
+        """
+        Binds a hook method to an endpoint.
+
+        Parameters:
+        hook_name (str): Either "before_request" or "after_request".
+        endpoint (str): The endpoint, in the "controller.action" format.
+        hook_method (function): The bound method to execute for the endpoint.
+        """
+        self.hooks[hook_name].setdefault(endpoint, []).append(hook_method)
+
+    def before_request(self):
+        """Runs the before_request hooks bound to the current endpoint."""
+        for hook_method in self.hooks["before_request"].get(request.endpoint, ()):
+            hook_method()
+
+    def after_request(self, response):
+        """Runs the after_request hooks bound to the current endpoint."""
+        for hook_method in self.hooks["after_request"].get(request.endpoint, ()):
+            hook_method(response)
+        return response
+
 
 class CallbackMiddleware:
-    def __init__(self, app: Flask, controller_name: str, controller) -> None:
+    HOOKS = ("before_request", "after_request")
+
+    def __init__(
+        self,
+        app: Flask,
+        controller_name: str,
+        controller,
+        blueprint=None,
+        lifecycle=None,
+    ) -> None:
         """
         Initializes the CallbackMiddleware instance.
 
@@ -10,33 +69,83 @@ class CallbackMiddleware:
         app (Flask): The Flask application where the middleware is being registered.
         controller_name (str): The name of the controller where the hooks are defined.
         controller: The controller instance where the hooks are defined.
+        blueprint (Blueprint, optional): The controller's blueprint, where the hooks are
+            registered. Defaults to registering them on the application.
+        lifecycle (ControllerLifecycle, optional): The controller lifecycle. When it does
+            not share one instance between requests, hooks run on the instance serving
+            the current request and ``controller`` may be the controller class.
         """
         self.app = app
         self.controller_name = controller_name
         self.controller = controller
+        self.blueprint = blueprint
+        self.lifecycle = lifecycle
+        self.dispatcher = None
 
     def register(self):
         """
-        Registers before_request and after_request hooks to the Flask application.
+        Registers the controller's before_request and after_request hooks on its blueprint.
         The before_request hook is executed before the request is processed.
         The after_request hook is executed after the request is processed.
 
-        The hooks are retrieved using the get_hook_method function and executed using the execute_hook function.
+        The hooks are retrieved once using the get_hook_method function and indexed by
+        endpoint in a dispatcher. Controllers without callbacks register nothing. When
+        instrumentation is enabled, each hook adds its duration to the request timeline,
+        and with tracing it runs in a "controller.callback" span.
         """
-
-        def before_request_hook():
-            hook_method, actions = self.get_hook_method("before_request")
+        for hook_name in self.HOOKS:
+            hook_method, actions = self.get_hook_method(hook_name)
             if hook_method:
-                self.execute_hook(hook_method, actions)
+                callback = hook_method.__name__
+                hook_method = self._bind(hook_method)
+                if is_instrumented(self.app.config):
+                    hook_method = timed(
+                        hook_method,
+                        hook_name,
+                        get_tracer(self.app),
+                        f"{self.controller_name}.{callback}",
+                        {
+                            "flask_mvc.controller": self.controller_name,
+                            "flask_mvc.hook": hook_name,
+                            "flask_mvc.callback": callback,
+                        },
+                    )
+                for action in actions:
+                    endpoint = f"{self.controller_name}.{action}"
+                    self._dispatcher().add(hook_name, endpoint, hook_method)
+
+    def _bind(self, hook_method):
+        """
+        Binds a hook method to the controller instance serving each request.
 
-        def after_request_hook(response):
-            hook_method, actions = self.get_hook_method("after_request")
-            if hook_method:
-                self.execute_hook(hook_method, actions, response)
-            return response
+        Parameters:
+        hook_method (function): The hook method retrieved from the controller.
 
-        self.app.before_request_funcs.setdefault(None, []).append(before_request_hook)
-        self.app.after_request_funcs.setdefault(None, []).append(after_request_hook)
+        Returns:
+        function: The hook method itself for shared instances, or a function calling it
+            on the instance provided by the lifecycle. Async hooks are made synchronous.
+        """
+        if self.lifecycle is None or self.lifecycle.shared:
+            return ensure_sync(self.app, hook_method)
+
+        lifecycle = self.lifecycle
+        function = ensure_sync(self.app, getattr(hook_method, "__func__", hook_method))
+
+        def hook(*args):
+            return function(lifecycle.instance(), *args)
+
+        return hook
+
+    def _dispatcher(self):
+        """
+        Returns the controller's dispatcher, registering it on first use.
+
+        Returns:
+        CallbackDispatcher: The dispatcher bound to the blueprint, or to the application.
+        """
+        if self.dispatcher is None:
+            self.dispatcher = CallbackDispatcher(self.blueprint or self.app)
+        return self.dispatcher
 
     def get_hook_method(self, hook_name):
         """
@@ -58,24 +167,6 @@ class CallbackMiddleware:
 
         return False, False
 
-    def execute_hook(self, hook_method, actions, response=None):
-        """
-        Executes the specified hook method for each action in the provided list of actions
-        if the current request endpoint matches the controller and action name.
-
-        Parameters:
-        hook_method (function): The hook method to be executed.
-        actions (list): A list of action names.
-        response (flask.Response, optional): The response object to be passed to the hook method. Defaults to None.
-        """
-        for action in actions:
-            endpoint = f"{self.controller_name}.{action}"
-            if request.endpoint == endpoint:
-                if response is None:
-                    hook_method()
-                else:
-                    hook_method(response)
-
     def actions(self, values):
         """
         Splits the actions string from the given values dictionary into a list of individual actions.
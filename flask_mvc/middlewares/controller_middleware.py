@@ -0,0 +1,221 @@
+import threading
+from importlib import import_module
+
+from flask import Flask
+
+from ..core.boot_profiler import BootProfiler
+from ..core.controller_lifecycle import build_lifecycle
+from .action_middleware import ActionMiddleware
+from .cache_middleware import CacheMiddleware
+from .callback_middleware import CallbackMiddleware
+from .etag_middleware import EtagMiddleware
+from .implicit_render_middleware import ImplicitRenderMiddleware
+from .negotiation_middleware import NegotiationMiddleware
+from .single_flight_middleware import SingleFlightMiddleware
+
+
+def import_controller(path: str, controller_name: str):
+    """
+    Imports a controller class.
+
+    Parameters:
+    path (str): The package holding the "controllers" package.
+    controller_name (str): The name of the controller, e.g. "messages".
+
+    Returns:
+    type: The controller class, e.g. MessagesController.
+    """
+    module = import_module(f"{path}.controllers.{controller_name}_controller")
+    return getattr(module, f"{controller_name.title()}Controller")
+
+
+class DeferredScaffold:
+    """
+    Records the hooks registered by a controller loaded after its blueprint was registered.
+
+    Flask does not accept new hooks on a registered blueprint, so lazy controllers
+    register them here and ControllerMiddleware runs them from its own blueprint hooks.
+    """
+
+    def __init__(self) -> None:
+        self.before_request_funcs = []
+        self.after_request_funcs = []
+        self.teardown_request_funcs = []
+
+    def before_request(self, f):
+        self.before_request_funcs.append(f)
+        return f
+
+    def after_request(self, f):
+        self.after_request_funcs.append(f)
+        return f
+
+    def teardown_request(self, f):
+        self.teardown_request_funcs.append(f)
+        return f
+
+
+class ControllerMiddleware:
+    def __init__(
+        self,
+        app: Flask,
+        path: str,
+        controller_name: str,
+        routes,
+        bindings=None,
+        profiler=None,
+    ) -> None:
+        """
+        Initializes the ControllerMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the controller is being registered.
+        path (str): The package holding the "controllers" package.
+        controller_name (str): The name of the controller.
+        routes (tuple): The routes of the controller.
+        bindings (dict, optional): The callbacks and lifecycle declared by the controller,
+            as recorded in a route manifest.
+        profiler (BootProfiler, optional): Records the time spent importing, instantiating
+            and binding the controller.
+        """
+        self.app = app
+        self.path = path
+        self.controller_name = controller_name
+        self.routes = routes
+        self.bindings = bindings
+        self.profiler = profiler or BootProfiler()
+        self.lazy = app.config["FLASK_MVC_LAZY_CONTROLLERS"]
+        self.loaded = False
+        self.lifecycle = None
+        self.cache = None
+        self.views = {}
+        self._scaffold = None
+        self._lock = threading.Lock()
+
+    def register(self, blueprint):
+        """
+        Prepares the controller's blueprint, before it is registered on the application.
+
+        Eager controllers are imported and bound right away. Lazy controllers register
+        lightweight hooks on the blueprint instead, and are imported and bound the first
+        time one of their endpoints is hit. Those hooks are skipped when a route manifest
+        records that the controller needs none.
+
+        Parameters:
+        blueprint (Blueprint): The controller's blueprint.
+        """
+        if not self.lazy:
+            self._scaffold = blueprint
+            self.load()
+            return
+
+        self._scaffold = DeferredScaffold()
+        if not self._needs_hooks():
+            return
+
+        blueprint.before_request(self.before_request)
+        blueprint.after_request(self.after_request)
+        blueprint.teardown_request(self.teardown_request)
+
+    def load(self):
+        """
+        Imports the controller module and binds the controller's lifecycle, callbacks
+        and actions. Loading happens once, even when several threads hit the controller
+        at the same time.
+
+        Returns:
+        ControllerMiddleware: The loaded controller.
+        """
+        if self.loaded:
+            return self
+
+        with self._lock:
+            if not self.loaded:
+                self._bind(self._import())
+                self.loaded = True
+
+        return self
+
+    def view(self, action):
+        """
+        Returns the view function to register for the given action.
+
+        Parameters:
+        action (str): The name of the action.
+
+        Returns:
+        function: The action's view function, or for lazy controllers a proxy that loads
+            the controller and then replaces itself with the action's view function.
+        """
+        if self.loaded:
+            return self.views[action]
+
+        endpoint = f"{self.controller_name}.{action}"
+
+        def proxy(**kwargs):
+            view_func = self.load().views[action]
+            self.app.view_functions[endpoint] = view_func
+            return view_func(**kwargs)
+
+        proxy.__name__ = action
+        return proxy
+
+    def before_request(self):
+        """Loads a lazy controller and runs its before_request hooks."""
+        for func in self.load()._scaffold.before_request_funcs:
+            rv = func()
+            if rv is not None:
+                return rv
+
+    def after_request(self, response):
+        """Runs the after_request hooks of a lazy controller."""
+        for func in reversed(self._scaffold.after_request_funcs):
+            response = func(response)
+        return response
+
+    def teardown_request(self, exc):
+        """Runs the teardown_request hooks of a lazy controller."""
+        for func in reversed(self._scaffold.teardown_request_funcs):
+            func(exc)
+
+    def _import(self):
+        with self.profiler.controller(self.controller_name, "import", memory=True):
+            return import_controller(self.path, self.controller_name)
+
+    def _needs_hooks(self):
+        if self.bindings is None:
+            return True
+
+        lifecycle = (
+            self.bindings["lifecycle"]
+            or self.app.config["FLASK_MVC_CONTROLLER_LIFECYCLE"]
+        )
+        return bool(self.bindings["callbacks"]) or lifecycle == "pool"
+
+    def _bind(self, controller_class):
+        name = self.controller_name
+
+        with self.profiler.controller(name, "instantiate"):
+            lifecycle = build_lifecycle(name, controller_class, self.app.config)
+            lifecycle.register(self._scaffold)
+            controller = lifecycle.instance() if lifecycle.shared else controller_class
+
+        with self.profiler.controller(name, "callbacks"):
+            CallbackMiddleware(
+                self.app, name, controller, self._scaffold, lifecycle
+            ).register()
+
+        with self.profiler.controller(name, "actions"):
+            self.cache = CacheMiddleware(self.app, name, controller_class)
+            layers = [
+                NegotiationMiddleware(self.app, name, controller_class),
+                ImplicitRenderMiddleware(self.app, name, controller_class, lifecycle),
+                SingleFlightMiddleware(self.app, name, controller_class),
+                self.cache,
+                EtagMiddleware(self.app, name, controller_class, lifecycle),
+            ]
+            actions = ActionMiddleware(self.app, name, lifecycle, layers)
+            self.views = {
+                route.action: actions.view(route.action) for route in self.routes
+            }
+        self.lifecycle = lifecycle
@@ -0,0 +1,117 @@
+import hashlib
+from datetime import datetime
+from functools import update_wrapper
+
+from flask import Flask, current_app, request
+from werkzeug.http import is_resource_modified
+
+from ..core.event_loop import ensure_sync
+
+
+class EtagMiddleware:
+    """
+    Adds weak ETags to the responses of the actions declared by a controller's ``etag``
+    attribute, and answers conditional GET requests with 304 Not Modified.
+
+    By default the ETag is a hash of the response body, so the action still runs but
+    unchanged responses are not sent again. When the declaration names a ``version``
+    method, it is called with the view arguments instead and its result is the ETag
+    (or the Last-Modified date, for a datetime): conditional requests are answered
+    before the action runs and renders anything.
+    """
+
+    DEFAULT_ACTIONS = "index show"
+
+    def __init__(
+        self, app: Flask, controller_name: str, controller_class, lifecycle
+    ) -> None:
+        """
+        Initializes the EtagMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the actions are being registered.
+        controller_name (str): The name of the controller that owns the actions.
+        controller_class (type): The controller class, which may declare
+            ``etag = True`` or ``etag = dict(actions="index show", version="version")``.
+        lifecycle (ControllerLifecycle): Provides the instance whose version method is
+            called.
+        """
+        self.app = app
+        self.controller_name = controller_name
+        self.lifecycle = lifecycle
+
+        declaration = getattr(controller_class, "etag", None)
+        if declaration is True:
+            declaration = {}
+        self.declaration = declaration if isinstance(declaration, dict) else None
+
+    def wrap(self, action, view):
+        """
+        Wraps the view function of an action.
+
+        Parameters:
+        action (str): The name of the action.
+        view (function): The view function of the action.
+
+        Returns:
+        function: A view handling conditional requests for declared actions, or the
+            view itself.
+        """
+        if self.declaration is None:
+            return view
+        if action not in self.declaration.get("actions", self.DEFAULT_ACTIONS).split():
+            return view
+
+        version = self.declaration.get("version")
+        if version is None:
+            return self._hashed(view)
+        return self._versioned(view, version)
+
+    def _hashed(self, view):
+        def hashed(**kwargs):
+            response = current_app.make_response(view(**kwargs))
+            if (
+                request.method in ("GET", "HEAD")
+                and response.status_code == 200
+                and not response.is_streamed
+                and "ETag" not in response.headers
+            ):
+                response.set_etag(_digest(response.get_data()), weak=True)
+                response.make_conditional(request)
+            return response
+
+        return update_wrapper(hashed, view)
+
+    def _versioned(self, view, method_name):
+        lifecycle = self.lifecycle
+        method = ensure_sync(self.app, getattr(lifecycle.controller_class, method_name))
+
+        def versioned(**kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(**kwargs)
+
+            version = method(lifecycle.instance(), **kwargs)
+            last_modified = version if isinstance(version, datetime) else None
+            if last_modified is not None:
+                version = last_modified.isoformat()
+            etag = _digest(str(version).encode())
+
+            if not is_resource_modified(
+                request.environ, etag=etag, last_modified=last_modified
+            ):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(**kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            return response
+
+        return update_wrapper(versioned, view)
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -0,0 +1,214 @@
+from functools import lru_cache
+from urllib.parse import unquote_plus
+
+from werkzeug.http import parse_options_header
+from werkzeug.routing import Map, Rule
+from werkzeug.sansio.multipart import (
+    NEED_DATA,
+    Data,
+    Epilogue,
+    Field,
+    File,
+    MultipartDecoder,
+)
+
+OVERRIDE_METHODS = frozenset({"PUT", "PATCH", "DELETE"})
+
+URLENCODED = "application/x-www-form-urlencoded"
+
+MULTIPART = "multipart/form-data"
+
+
+class ReplayStream:
+    """
+    Request body stream returning the bytes already read from the original stream
+    before reading the rest of it, which is not copied.
+    """
+
+    def __init__(self, head: bytes, stream) -> None:
+        self.head = head
+        self.stream = stream
+
+    def read(self, size=-1):
+        if not self.head:
+            return self.stream.read(size)
+        if size is None or size < 0:
+            data, self.head = self.head + self.stream.read(), b""
+            return data
+
+        data, self.head = self.head[:size], self.head[size:]
+        if len(data) < size:
+            data += self.stream.read(size - len(data))
+        return data
+
+    def readline(self, size=-1):
+        if not self.head:
+            return self.stream.readline(size)
+
+        end = self.head.find(b"\n") + 1 or len(self.head)
+        if size is not None and 0 <= size < end:
+            end = size
+        line, self.head = self.head[:end], self.head[end:]
+
+        unlimited = size is None or size < 0
+        if not self.head and not line.endswith(b"\n") and (unlimited or end < size):
+            line += self.stream.readline(-1 if unlimited else size - end)
+        return line
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+
+class MethodOverrideMiddleware:
+    """
+    WSGI middleware letting HTML forms send PUT, PATCH and DELETE requests.
+
+    Only POST requests to paths with a PUT, PATCH or DELETE route in the route table
+    are rewritten, to one of the methods of these routes. The method is read from the
+    ``X-HTTP-Method-Override`` header or from the ``_method`` field of urlencoded and
+    multipart forms. The body is only read until the field is found (multipart forms
+    until their first file, so the field must come before file inputs), the bytes read
+    are replayed to the application and the rest of the body is left untouched. Bodies
+    without a Content-Length, such as chunked uploads, are never read.
+    """
+
+    def __init__(
+        self,
+        app,
+        routes=(),
+        override_param: str = "_method",
+        header: str = "X-HTTP-Method-Override",
+        chunk_size: int = 4096,
+        converters=None,
+    ) -> None:
+        """
+        Initializes the MethodOverrideMiddleware instance.
+
+        Args:
+            app: The WSGI application to wrap.
+            routes (iterable): The routes of the route table.
+            override_param (str): The form field holding the method.
+            header (str): The header holding the method.
+            chunk_size (int): The number of bytes read at once looking for the field.
+            converters (dict): The URL converters of the application, used by the
+                paths of the routes.
+        """
+        self.app = app
+        self.override_param = override_param
+        self.environ_key = "HTTP_" + header.upper().replace("-", "_")
+        self.chunk_size = chunk_size
+
+        rules = []
+        for route in routes:
+            methods = OVERRIDE_METHODS.intersection(route.methods)
+            if methods:
+                rules.append(Rule(route.path, methods=methods))
+        self.adapter = Map(rules, converters=converters).bind("")
+        self.allowed_methods = lru_cache(maxsize=1024)(self._allowed_methods)
+
+    def __call__(self, environ, start_response):
+        if environ.get("REQUEST_METHOD") == "POST":
+            allowed = self.allowed_methods(environ.get("PATH_INFO") or "/")
+            if allowed:
+                self._override(environ, allowed)
+        return self.app(environ, start_response)
+
+    def _allowed_methods(self, path):
+        """Returns the methods a POST request to the path can be rewritten to."""
+        return OVERRIDE_METHODS.intersection(self.adapter.allowed_methods(path))
+
+    def _override(self, environ, allowed):
+        method = environ.get(self.environ_key, "").strip().upper()
+        if not method:
+            method = self._form_method(environ)
+        if method not in allowed:
+            return
+
+        environ["REQUEST_METHOD"] = method
+        if method == "DELETE":
+            environ["CONTENT_LENGTH"] = "0"
+            environ.pop("CONTENT_TYPE", None)
+
+    def _form_method(self, environ):
+        """Reads the method field from the body, keeping the body readable."""
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return None
+
+        mimetype, options = parse_options_header(environ.get("CONTENT_TYPE"))
+        boundary = options.get("boundary", "").encode("latin-1")
+        if length <= 0 or not (
+            mimetype == URLENCODED or (mimetype == MULTIPART and boundary)
+        ):
+            return None
+
+        stream = environ["wsgi.input"]
+        consumed = []
+
+        def chunks():
+            remaining = length
+            while remaining > 0:
+                chunk = stream.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                consumed.append(chunk)
+                yield chunk
+
+        try:
+            if mimetype == URLENCODED:
+                method = self._urlencoded_method(chunks())
+            else:
+                method = self._multipart_method(chunks(), boundary)
+        except ValueError:
+            method = None
+
+        if consumed:
+            environ["wsgi.input"] = ReplayStream(b"".join(consumed), stream)
+        return method
+
+    def _urlencoded_method(self, chunks):
+        marker = b"&" + self.override_param.encode() + b"="
+        buffer = b"&"
+        start = -1
+        for chunk in chunks:
+            buffer += chunk
+            if start < 0:
+                start = buffer.find(marker)
+                if start < 0:
+                    # Keep what may be the beginning of the field
+                    buffer = buffer[1 - len(marker) :]
+                    continue
+                start += len(marker)
+
+            end = buffer.find(b"&", start)
+            if end >= 0:
+                return _method(unquote_plus(buffer[start:end].decode("latin-1")))
+
+        if start >= 0:
+            return _method(unquote_plus(buffer[start:].decode("latin-1")))
+        return None
+
+    def _multipart_method(self, chunks, boundary):
+        decoder = MultipartDecoder(boundary)
+        in_field = False
+        value = b""
+        for chunk in chunks:
+            decoder.receive_data(chunk)
+            event = decoder.next_event()
+            while event is not NEED_DATA:
+                if isinstance(event, (File, Epilogue)):
+                    return None
+                if isinstance(event, Field):
+                    in_field = event.name == self.override_param
+                elif isinstance(event, Data) and in_field:
+                    value += event.data
+                    if not event.more_data:
+                        return _method(value.decode("latin-1"))
+                event = decoder.next_event()
+        return None
+
+
+def _method(value):
+    return value.strip().upper()
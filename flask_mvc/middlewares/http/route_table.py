@@ -0,0 +1,109 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """
+    A route declared with the router.
+
+    Attributes:
+        methods (tuple): The HTTP methods accepted by the route.
+        path (str): URL path for the route.
+        controller (str): The name of the controller.
+        action (str): The name of the controller action.
+        endpoint (str): The Flask endpoint of the route, "controller.action".
+    """
+
+    methods: tuple
+    path: str
+    controller: str
+    action: str
+    endpoint: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "methods", tuple(self.methods))
+        object.__setattr__(self, "endpoint", f"{self.controller}.{self.action}")
+
+    @property
+    def method(self):
+        """list: The HTTP methods accepted by the route, as a list."""
+        return list(self.methods)
+
+
+class RouteTable:
+    """
+    Compiled, immutable table of the routes declared with the router.
+
+    The table groups the routes by controller and indexes them by (method, path)
+    and by endpoint, so lookups do not walk the declared routes.
+
+    Attributes:
+        routes (tuple): Every route, in declaration order.
+        controllers (Mapping): The routes of each controller, in declaration order.
+    """
+
+    __slots__ = ("routes", "controllers", "_by_method_path", "_by_endpoint")
+
+    def __init__(self, routes):
+        """
+        Compiles the table.
+
+        Args:
+            routes (iterable): The routes declared with the router.
+        """
+        routes = tuple(routes)
+        controllers = {}
+        by_method_path = {}
+        by_endpoint = {}
+
+        for route in routes:
+            controllers.setdefault(route.controller, []).append(route)
+            by_endpoint.setdefault(route.endpoint, route)
+            for method in route.methods:
+                by_method_path.setdefault((method, route.path), route)
+
+        object.__setattr__(self, "routes", routes)
+        object.__setattr__(
+            self,
+            "controllers",
+            MappingProxyType(
+                {name: tuple(group) for name, group in controllers.items()}
+            ),
+        )
+        object.__setattr__(self, "_by_method_path", MappingProxyType(by_method_path))
+        object.__setattr__(self, "_by_endpoint", MappingProxyType(by_endpoint))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RouteTable is immutable")
+
+    def __iter__(self):
+        return iter(self.routes)
+
+    def __len__(self):
+        return len(self.routes)
+
+    def find(self, method, path):
+        """
+        Finds the route declared for an HTTP method and a path.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The URL path, as declared (e.g. "/messages/<id>").
+
+        Returns:
+            Route or None: The route, or None when it is not declared.
+        """
+        return self._by_method_path.get((method, path))
+
+    def endpoint(self, endpoint):
+        """
+        Finds the route of an endpoint.
+
+        Args:
+            endpoint (str): The endpoint, in the "controller.action" format.
+
+        Returns:
+            Route or None: The route, or None when it is not declared.
+        """
+        return self._by_endpoint.get(endpoint)
@@ -1,8 +1,46 @@
-from collections import namedtuple
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib import import_module, reload
 
 from .namespace_middleware import NamespaceMiddleware
+from .route_table import Route, RouteTable
 
-Model = namedtuple("Model", "method path controller action")
+# Kept for backwards compatibility, routes used to be "Model" namedtuples
+Model = Route
+
+# The router receiving the routes declared through the class, see RouterMiddleware.activate
+_active_router = ContextVar("flask_mvc_router", default=None)
+
+# The routes declared by each routes module, evaluated once per process
+_module_routes = {}
+_module_routes_lock = threading.Lock()
+
+
+class _router_method:
+    """
+    Binds a router method to the active router when it is called on the class.
+
+    This keeps ``Router.get(...)`` in routes modules working as a facade, while each
+    application registers its routes in its own RouterMiddleware instance.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            instance = owner.active()
+        return self.function.__get__(instance, owner)
+
+
+class _active_routes:
+    """Returns the routes list of the active router when accessed on the class."""
+
+    def __get__(self, instance, owner):
+        return (owner.active() if instance is None else instance).routes
 
 
 class RouterMiddleware:
@@ -12,56 +50,142 @@ class RouterMiddleware:
     This class provides methods to define and manage different HTTP routes
     (GET, POST, PUT, DELETE) for the application's controllers and actions.
 
+    Each FlaskMVC instance owns a RouterMiddleware instance, so every application gets
+    its own isolated set of routes. Calling the methods on the class (the ``Router``
+    facade used in routes modules) registers the routes in the active router: the one
+    importing a routes module, or a process-wide default router otherwise.
+
     Attributes:
-        ROUTES (list): A class-level list that stores all the routes registered
-                       with their respective HTTP methods, paths, controllers,
-                       and actions.
+        ROUTES (list): The routes registered in the active router with their respective
+                       HTTP methods, paths, controllers, and actions.
 
     Methods:
-        _method_route(): Private method that organizes routes by HTTP method.
+        activate(): Context manager making the router receive the facade calls.
 
-        namespace(name: str): Static method to create a namespace for routes.
+        include(module_name: str): Method to add the routes declared by a routes module.
 
-        get(path: str, resource: str): Static method to define a GET route.
+        compile(): Method to compile the registered routes into a RouteTable.
 
-        post(path: str, resource: str): Static method to define a POST route.
+        _method_route(): Private method that organizes routes by controller.
 
-        put(path: str, resource: str): Static method to define a PUT route.
+        namespace(name: str): Method to create a namespace for routes.
 
-        delete(path: str, resource: str): Static method to define a DELETE route.
+        get(path: str, resource: str): Method to define a GET route.
 
-        all(resource: str, only=None, base_path=""): Static method to define routes for all
+        post(path: str, resource: str): Method to define a POST route.
+
+        put(path: str, resource: str): Method to define a PUT route.
+
+        delete(path: str, resource: str): Method to define a DELETE route.
+
+        all(resource: str, only=None, base_path=""): Method to define routes for all
                                                      standard RESTful actions for a resource.
 
         _add_routes(name, actions, base_path): Private method to add routes for specified
                                                actions under a given name and base path.
     """
 
-    ROUTES = []
+    ROUTES = _active_routes()
+    _default = None
+
+    def __init__(self):
+        self.routes = []
+
+    @classmethod
+    def active(cls):
+        """
+        Returns the router receiving the routes declared through the class.
+
+        Returns:
+            RouterMiddleware: The active router, or the process-wide default router.
+        """
+
+        router = _active_router.get()
+        if router is None:
+            if cls._default is None:
+                cls._default = cls()
+            router = cls._default
+        return router
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this router receive the routes declared through the class.
+        """
+
+        token = _active_router.set(self)
+        try:
+            yield self
+        finally:
+            _active_router.reset(token)
+
+    def include(self, module_name: str):
+        """
+        Adds the routes declared by a routes module.
+
+        Args:
+            module_name (str): The dotted name of the routes module.
+        """
+
+        self.routes.extend(RouterMiddleware.module_routes(module_name))
 
     @staticmethod
-    def _method_route():
+    def module_routes(module_name: str):
         """
-        Organizes routes by HTTP method.
+        Returns the routes declared by a routes module.
+
+        The module is evaluated once per process and the routes it declares are
+        recorded, so loading it again (e.g. in every ``create_app()`` call) costs a
+        constant amount and never duplicates routes. A module imported before, outside
+        of a router, is reloaded to record its routes.
+
+        Args:
+            module_name (str): The dotted name of the routes module.
 
         Returns:
-            dict: A dictionary where each key is an HTTP method and the value is a list
-                  of routes associated with that method.
+            tuple: The routes declared by the module.
         """
 
-        routes = {}
+        with _module_routes_lock:
+            routes = _module_routes.get(module_name)
+            if routes is None:
+                recorder = RouterMiddleware()
+                with recorder.activate():
+                    if module_name in sys.modules:
+                        reload(sys.modules[module_name])
+                    else:
+                        import_module(module_name)
+                routes = _module_routes[module_name] = tuple(recorder.routes)
 
-        for route in RouterMiddleware.ROUTES:
-            value = list(route.values())[0]
-            for key in route:
-                if key not in routes:
-                    routes[key] = [value]
-                else:
-                    routes[key].append(value)
         return routes
 
-    @staticmethod
-    def namespace(name: str):
+    @_router_method
+    def compile(self):
+        """
+        Compiles the registered routes into an immutable route table.
+
+        Returns:
+            RouteTable: The de-duplicated routes grouped by controller and indexed by
+                        (method, path) and by endpoint. Routes registered afterwards
+                        are not included.
+        """
+
+        return RouteTable(dict.fromkeys(self.routes))
+
+    @_router_method
+    def _method_route(self):
+        """
+        Organizes routes by controller.
+
+        Returns:
+            Mapping: A mapping where each key is a controller name and the value is a
+                     tuple of routes associated with that controller.
+        """
+
+        return self.compile().controllers
+
+    @_router_method
+    def namespace(self, name: str):
         """
         Creates a namespace middleware for routes.
 
@@ -72,10 +196,10 @@ class RouterMiddleware:
             NamespaceMiddleware: An instance of NamespaceMiddleware associated with the given name.
         """
 
-        return NamespaceMiddleware(name, RouterMiddleware)
+        return NamespaceMiddleware(name, self)
 
-    @staticmethod
-    def get(path: str, resource: str):
+    @_router_method
+    def get(self, path: str, resource: str):
         """
         Defines a GET route.
 
@@ -84,13 +208,10 @@ class RouterMiddleware:
             resource (str): The 'controller#action' string specifying the controller and action.
         """
 
-        controller, action = resource.split("#")
-        RouterMiddleware.ROUTES.append(
-            {controller: Model(["GET"], path, controller, action)}
-        )
+        self._add(("GET",), path, resource)
 
-    @staticmethod
-    def post(path: str, resource: str):
+    @_router_method
+    def post(self, path: str, resource: str):
         """
         Defines a POST route.
 
@@ -99,13 +220,10 @@ class RouterMiddleware:
             resource (str): The 'controller#action' string specifying the controller and action.
         """
 
-        controller, action = resource.split("#")
-        RouterMiddleware.ROUTES.append(
-            {controller: Model(["POST"], path, controller, action)}
-        )
+        self._add(("POST",), path, resource)
 
-    @staticmethod
-    def put(path: str, resource: str):
+    @_router_method
+    def put(self, path: str, resource: str):
         """
         Defines a PUT route.
 
@@ -114,13 +232,10 @@ class RouterMiddleware:
             resource (str): The 'controller#action' string specifying the controller and action.
         """
 
-        controller, action = resource.split("#")
-        RouterMiddleware.ROUTES.append(
-            {controller: Model(["PUT", "PATCH"], path, controller, action)},
-        )
+        self._add(("PUT", "PATCH"), path, resource)
 
-    @staticmethod
-    def delete(path: str, resource: str):
+    @_router_method
+    def delete(self, path: str, resource: str):
         """
         Defines a DELETE route.
 
@@ -129,13 +244,24 @@ class RouterMiddleware:
             resource (str): The 'controller#action' string specifying the controller and action.
         """
 
+        self._add(("DELETE",), path, resource)
+
+    @_router_method
+    def _add(self, methods, path, resource):
+        """
+        Registers a route.
+
+        Args:
+            methods (tuple): The HTTP methods accepted by the route.
+            path (str): URL path for the route.
+            resource (str): The 'controller#action' string specifying the controller and action.
+        """
+
         controller, action = resource.split("#")
-        RouterMiddleware.ROUTES.append(
-            {controller: Model(["DELETE"], path, controller, action)}
-        )
+        self.routes.append(Route(methods, path, controller, action))
 
-    @staticmethod
-    def all(resource: str, only=None, base_path=""):
+    @_router_method
+    def all(self, resource: str, only=None, base_path=""):
         """
         Defines routes for all standard RESTful actions for a resource.
 
@@ -155,10 +281,10 @@ class RouterMiddleware:
             "delete",
         ]
         actions = only.split() if isinstance(only, str) else only
-        RouterMiddleware._add_routes(resource, actions if actions else group, base_path)
+        self._add_routes(resource, actions if actions else group, base_path)
 
-    @staticmethod
-    def _add_routes(name, actions, base_path):
+    @_router_method
+    def _add_routes(self, name, actions, base_path):
         """
         Adds routes for specified actions under a given name and base path.
 
@@ -191,7 +317,7 @@ class RouterMiddleware:
             path = f"{base_path}/{name}{urls.get(action, '')}"
 
             if action in parameters:
-                getattr(RouterMiddleware, parameters[action])(path, f"{name}#{action}")
+                getattr(self, parameters[action])(path, f"{name}#{action}")
                 continue
 
-            getattr(RouterMiddleware, groups[action])(path, f"{name}#{action}")
+            getattr(self, groups[action])(path, f"{name}#{action}")
@@ -0,0 +1,89 @@
+from functools import update_wrapper
+
+from flask import Flask
+
+from ..core.view_result import pack, unpack
+from ..core.view_templates import get_view_templates
+
+
+class ImplicitRenderMiddleware:
+    """
+    Renders the conventional template of actions that return data instead of a
+    response.
+
+    When an action returns a dict, optionally with a status and headers, the
+    ``<controller>/<action>.html`` template of the views folder is rendered with its
+    keys. When it returns None, the template is rendered with the public attributes
+    the controller instance holds, for controllers with a ``per_request`` or ``pool``
+    lifecycle (a shared singleton instance holds no per-request state, so its
+    templates get no variables). Actions without a template behave as before, dicts
+    being sent as JSON. The template of each endpoint is resolved once and kept.
+    """
+
+    def __init__(self, app: Flask, controller_name: str, controller_class, lifecycle):
+        """
+        Initializes the ImplicitRenderMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the actions are being registered.
+        controller_name (str): The name of the controller that owns the actions.
+        controller_class (type): The controller class, whose ``implicit_render``
+            attribute overrides the FLASK_MVC_IMPLICIT_RENDER option.
+        lifecycle (ControllerLifecycle): Provides the instance whose attributes are
+            rendered when an action returns None.
+        """
+        self.app = app
+        self.controller_name = controller_name
+        self.lifecycle = lifecycle
+        self.enabled = bool(
+            getattr(
+                controller_class,
+                "implicit_render",
+                app.config["FLASK_MVC_IMPLICIT_RENDER"],
+            )
+        )
+
+    def wrap(self, action, view):
+        """
+        Wraps the view function of an action.
+
+        Parameters:
+        action (str): The name of the action.
+        view (function): The view function of the action.
+
+        Returns:
+        function: A view rendering the template of the action when it returns data,
+            or the view itself when implicit rendering is off.
+        """
+        if not self.enabled:
+            return view
+        return self._rendered(view, f"{self.controller_name}.{action}")
+
+    def _rendered(self, view, endpoint):
+        templates = get_view_templates(self.app)
+        lifecycle = self.lifecycle
+
+        def rendered(**kwargs):
+            result = view(**kwargs)
+            data, status, headers = unpack(result)
+            if isinstance(data, dict):
+                context = dict(data)
+            elif data is None:
+                context = {} if lifecycle.shared else _public_attributes(lifecycle)
+            else:
+                return result
+
+            template = templates.get(endpoint)
+            if template is None:
+                return result
+            return pack(templates.render(template, context), status, headers)
+
+        return update_wrapper(rendered, view)
+
+
+def _public_attributes(lifecycle):
+    return {
+        name: value
+        for name, value in vars(lifecycle.instance()).items()
+        if not name.startswith("_")
+    }
@@ -0,0 +1,129 @@
+from time import perf_counter
+
+from flask import Flask, Response, before_render_template, g, request, template_rendered
+
+from ..core import server_timing
+from ..core.metrics import MetricsRegistry
+from ..core.timeline import TIMELINE_ATTRIBUTE, RequestTimeline, is_instrumented
+
+
+class InstrumentationMiddleware:
+    """
+    Times the requests served by controller actions.
+
+    A timeline is started before any other hook of the request, the callbacks and the
+    action add their own time to it, and the request is recorded once torn down. With
+    Server-Timing enabled, the timeline also gets the time spent rewriting the method
+    override and rendering templates, and is sent in a Server-Timing header.
+    """
+
+    METRICS_ENDPOINT = "flask_mvc_metrics"
+
+    def __init__(self, app: Flask, routes) -> None:
+        """
+        Initializes the InstrumentationMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application being instrumented.
+        routes (RouteTable): The routes of the application, whose endpoints are timed.
+        """
+        self.app = app
+        self.endpoints = {
+            route.endpoint: (route.controller, route.action) for route in routes
+        }
+        self.metrics = None
+        self.server_timing = False
+
+    def register(self):
+        """
+        Registers the request hooks and the metrics endpoint, when instrumentation is
+        enabled. Nothing is registered otherwise.
+        """
+        config = self.app.config
+        if not is_instrumented(config):
+            return
+
+        if config["FLASK_MVC_METRICS"]:
+            self.metrics = MetricsRegistry(
+                directory=config["FLASK_MVC_METRICS_DIR"],
+                flush_interval=config["FLASK_MVC_METRICS_FLUSH_INTERVAL"],
+            )
+            if config["FLASK_MVC_METRICS_ENDPOINT"]:
+                self.app.add_url_rule(
+                    config["FLASK_MVC_METRICS_ENDPOINT"],
+                    self.METRICS_ENDPOINT,
+                    self.metrics_view,
+                )
+
+        if server_timing.is_enabled(self.app):
+            self.server_timing = True
+            before_render_template.connect(self.render_started, self.app)
+            template_rendered.connect(self.render_finished, self.app)
+
+        # Start the timeline before the hooks registered by the application itself
+        self.app.before_request_funcs.setdefault(None, []).insert(0, self.before_request)
+        self.app.after_request(self.after_request)
+        self.app.teardown_request(self.teardown_request)
+
+    def before_request(self):
+        """Starts the timeline of requests to controller actions."""
+        names = self.endpoints.get(request.endpoint)
+        if names is None:
+            return
+
+        timeline = RequestTimeline(*names)
+        setattr(g, TIMELINE_ATTRIBUTE, timeline)
+        if self.server_timing:
+            method_override = request.environ.get(
+                f"{server_timing.ENVIRON_PREFIX}method_override"
+            )
+            if method_override is not None:
+                timeline.add("method_override", method_override)
+        if self.metrics is not None:
+            self.metrics.started(timeline.controller, timeline.action)
+
+    def after_request(self, response):
+        """Records the status of the response, and adds the Server-Timing header."""
+        timeline = g.get(TIMELINE_ATTRIBUTE)
+        if timeline is None:
+            return response
+
+        timeline.status = response.status_code
+        if self.server_timing:
+            response.headers.add("Server-Timing", server_timing.header(timeline))
+        return response
+
+    def teardown_request(self, exc):
+        """Records the request, including requests that failed."""
+        timeline = g.pop(TIMELINE_ATTRIBUTE, None)
+        if timeline is None:
+            return
+
+        status = timeline.status if timeline.status is not None else 500
+        if self.metrics is not None:
+            self.metrics.finished(
+                timeline.controller,
+                timeline.action,
+                status,
+                timeline.elapsed(),
+                timeline.phases,
+            )
+
+    def render_started(self, sender, template, context, **extra):
+        """Starts timing the rendering of a template."""
+        if TIMELINE_ATTRIBUTE in g:
+            g.setdefault("_mvc_render_started", []).append(perf_counter())
+
+    def render_finished(self, sender, template, context, **extra):
+        """Adds the rendering time of a template to the timeline."""
+        timeline = g.get(TIMELINE_ATTRIBUTE)
+        started = g.get("_mvc_render_started")
+        if timeline is not None and started:
+            timeline.add("render", perf_counter() - started.pop())
+
+    def metrics_view(self):
+        """Serves the metrics in the Prometheus text exposition format."""
+        return Response(
+            self.metrics.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
@@ -0,0 +1,161 @@
+from functools import update_wrapper
+
+from flask import Flask, current_app, request
+from jinja2 import TemplateNotFound
+from werkzeug.exceptions import NotAcceptable
+from werkzeug.wrappers import Response
+
+from ..core.exceptions import ConfigurationError
+from ..core.json_provider import FastJSONProvider
+from ..core.view_result import pack, unpack
+from ..core.view_templates import get_view_templates, template_name
+
+
+class NegotiationMiddleware:
+    """
+    Responds to the actions declared by a controller's ``respond_to`` attribute in
+    the format the request accepts.
+
+    The action returns its data once, a dict, a list or a model, optionally with a
+    status and headers. Requests accepting HTML get the ``<controller>/<action>.html``
+    template of the views folder, rendered with the keys of a dict or with the data as
+    ``data``. Requests accepting JSON get the data serialized by the JSON provider of
+    the application, models being converted with their ``to_dict()`` method. The first
+    declared format answers requests without an Accept header, and requests accepting
+    none of them get a 406 Not Acceptable. HTML is only chosen when the action has a
+    template, the next acceptable format answering otherwise. Strings and responses
+    returned by the action are left alone.
+    """
+
+    FORMATS = {"html": "text/html", "json": "application/json"}
+
+    DEFAULT_FORMATS = "html json"
+
+    def __init__(self, app: Flask, controller_name: str, controller_class) -> None:
+        """
+        Initializes the NegotiationMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the actions are being registered.
+        controller_name (str): The name of the controller that owns the actions.
+        controller_class (type): The controller class, which may declare
+            ``respond_to = True`` or ``respond_to = dict(actions="index show",
+            formats="json html")``. Every action is negotiated unless actions are
+            given.
+        """
+        self.app = app
+        self.controller_name = controller_name
+        self.controller_class = controller_class
+
+        declaration = getattr(controller_class, "respond_to", None)
+        if declaration is True:
+            declaration = {}
+        self.declaration = declaration if isinstance(declaration, dict) else None
+
+        if self.declaration is not None:
+            formats = self.declaration.get("formats", self.DEFAULT_FORMATS).split()
+            unknown = [name for name in formats if name not in self.FORMATS]
+            if unknown or not formats:
+                raise ConfigurationError(
+                    f"Invalid respond_to formats {unknown or formats} for the "
+                    f"{controller_name} controller, expected {', '.join(self.FORMATS)}"
+                )
+            self.mimetypes = [self.FORMATS[name] for name in formats]
+
+    def wrap(self, action, view):
+        """
+        Wraps the view function of an action.
+
+        Parameters:
+        action (str): The name of the action.
+        view (function): The view function of the action.
+
+        Returns:
+        function: A view rendering the data of declared actions in the negotiated
+            format, or the view itself.
+        """
+        if not negotiates(self.controller_class, action):
+            return view
+        return self._negotiated(view, f"{self.controller_name}.{action}")
+
+    def _negotiated(self, view, endpoint):
+        mimetypes = self.mimetypes
+        templates = get_view_templates(self.app)
+
+        def negotiated(**kwargs):
+            data, status, headers = unpack(view(**kwargs))
+            if data is None or isinstance(data, (str, bytes, Response)):
+                return pack(data, status, headers)
+
+            template = templates.get(endpoint) if "text/html" in mimetypes else None
+            available = mimetypes
+            if template is None:
+                available = [name for name in mimetypes if name != "text/html"]
+
+            mimetype = _best_match(available)
+            if mimetype is None:
+                if _best_match(mimetypes) == "text/html":
+                    raise TemplateNotFound(template_name(endpoint))
+                raise NotAcceptable()
+
+            if mimetype == "application/json":
+                provider = current_app.json
+                if not isinstance(provider, FastJSONProvider):
+                    data = _serializable(data)
+                body = provider.response(data)
+            else:
+                context = dict(data) if isinstance(data, dict) else {"data": data}
+                body = templates.render(template, context)
+
+            response = current_app.make_response(pack(body, status, headers))
+            response.vary.add("Accept")
+            return response
+
+        return update_wrapper(negotiated, view)
+
+
+def negotiates(controller_class, action):
+    """
+    Tells whether an action is declared by a controller's ``respond_to`` attribute,
+    its responses then depending on the Accept header of the request.
+
+    Parameters:
+    controller_class (type): The controller class.
+    action (str): The name of the action.
+
+    Returns:
+    bool: Whether the responses of the action are negotiated.
+    """
+    declaration = getattr(controller_class, "respond_to", None)
+    if declaration is True:
+        return True
+    if not isinstance(declaration, dict):
+        return False
+    actions = declaration.get("actions")
+    return actions is None or action in actions.split()
+
+
+def _best_match(mimetypes):
+    """
+    Returns the mimetype the request prefers among the given ones, the first of them
+    for requests without an Accept header, or None.
+    """
+    accept = request.accept_mimetypes
+    if not accept:
+        return mimetypes[0] if mimetypes else None
+    return accept.best_match(mimetypes)
+
+
+def _serializable(data):
+    """
+    Converts models with a ``to_dict()`` method, inside dicts and lists too, for JSON
+    providers that do not (the fast providers convert them while serializing).
+    """
+    if isinstance(data, dict):
+        return {key: _serializable(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_serializable(item) for item in data]
+    to_dict = getattr(data, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return data
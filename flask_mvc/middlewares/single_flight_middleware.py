@@ -0,0 +1,109 @@
+import threading
+from functools import update_wrapper
+
+from flask import Flask, current_app, request
+
+from ..core.cache import request_digest
+from .cache_middleware import vary_headers
+
+
+class Flight:
+    """An action execution shared by identical concurrent requests."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+
+
+class SingleFlightMiddleware:
+    """
+    Coalesces identical concurrent GET requests to the actions declared by a
+    controller's ``single_flight`` attribute.
+
+    The first request runs the action while identical requests (same endpoint, view
+    arguments, query string and vary headers, Accept included for actions negotiated
+    with ``respond_to``) wait for it, up to the timeout, and get a copy of its response.
+    Requests waiting longer, or following an execution that raised, streamed or set a
+    cookie, run the action themselves. Waiting relies on ``threading.Event``, which
+    gevent and eventlet make cooperative once they patch the threading module.
+    """
+
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, app: Flask, controller_name: str, controller_class) -> None:
+        """
+        Initializes the SingleFlightMiddleware instance.
+
+        Parameters:
+        app (Flask): The Flask application where the actions are being registered.
+        controller_name (str): The name of the controller that owns the actions.
+        controller_class (type): The controller class, which may declare
+            ``single_flight = dict(actions="show", timeout=5, vary="Accept")``.
+        """
+        self.app = app
+        self.controller_name = controller_name
+        self.controller_class = controller_class
+        declaration = getattr(controller_class, "single_flight", None)
+        self.declaration = declaration if isinstance(declaration, dict) else None
+        self.flights = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, action, view):
+        """
+        Wraps the view function of an action.
+
+        Parameters:
+        action (str): The name of the action.
+        view (function): The view function of the action.
+
+        Returns:
+        function: A view coalescing identical concurrent requests for declared
+            actions, or the view itself.
+        """
+        if self.declaration is None:
+            return view
+        if action not in self.declaration["actions"].split():
+            return view
+        return self._coalesced(
+            view, vary_headers(self.declaration, self.controller_class, action)
+        )
+
+    def _coalesced(self, view, vary):
+        timeout = self.declaration.get("timeout", self.DEFAULT_TIMEOUT)
+
+        def coalesced(**kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(**kwargs)
+
+            key = (request.endpoint, request_digest(kwargs, vary))
+            with self._lock:
+                flight = self.flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self.flights[key] = Flight()
+
+            if not leader:
+                if flight.done.wait(timeout) and flight.result is not None:
+                    status, headers, body = flight.result
+                    return current_app.response_class(
+                        body, status=status, headers=headers
+                    )
+                return view(**kwargs)
+
+            try:
+                response = current_app.make_response(view(**kwargs))
+                if not response.is_streamed and "Set-Cookie" not in response.headers:
+                    flight.result = (
+                        response.status_code,
+                        list(response.headers),
+                        response.get_data(),
+                    )
+                return response
+            finally:
+                with self._lock:
+                    self.flights.pop(key, None)
+                flight.done.set()
+
+        return update_wrapper(coalesced, view)
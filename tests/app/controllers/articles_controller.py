@@ -0,0 +1,35 @@
+from flask import request
+
+
+class ArticlesController:
+    cache = dict(actions="index show", ttl=30, vary="Accept-Language")
+
+    articles = {"1": "First article"}
+    calls = []
+
+    def index(self):
+        self.calls.append("index")
+        return {"articles": sorted(self.articles.values())}
+
+    def show(self, id):
+        self.calls.append("show")
+        if id not in self.articles:
+            return {"error": "not found"}, 404
+        return {
+            "title": self.articles[id],
+            "lang": request.headers.get("Accept-Language"),
+        }
+
+    def create(self):
+        self.articles[str(len(self.articles) + 1)] = request.json["title"]
+        return {}, 201
+
+    def update(self, id):
+        if id not in self.articles:
+            return {"error": "not found"}, 404
+        self.articles[id] = request.json["title"]
+        return {}, 200
+
+    def delete(self, id):
+        self.articles.pop(id, None)
+        return {}, 204
@@ -0,0 +1,23 @@
+import asyncio
+
+from flask import g, request
+
+
+class AsyncController:
+    before_request = dict(callback="load_user", actions="index")
+    after_request = dict(callback="tag_response", actions="index")
+
+    async def load_user(self):
+        await asyncio.sleep(0)
+        g.user = request.args.get("user", "anonymous")
+
+    async def tag_response(self, response):
+        response.headers["X-Async"] = "yes"
+
+    async def index(self):
+        names = await asyncio.gather(self.fetch("a"), self.fetch("b"))
+        return f"{g.user}: {' '.join(names)}"
+
+    async def fetch(self, name):
+        await asyncio.sleep(0.01)
+        return name
@@ -0,0 +1,13 @@
+class CounterController:
+    before_request = dict(callback="load", actions="index")
+    instances = 0
+
+    def __init__(self):
+        CounterController.instances += 1
+        self.connection = "open"
+
+    def load(self):
+        self.page = getattr(self, "page", 0) + 1
+
+    def index(self):
+        return f"{self.page} {self.connection}"
@@ -0,0 +1,12 @@
+class FeedsController:
+    etag = True
+
+    calls = []
+
+    def index(self):
+        self.calls.append("index")
+        return {"items": ["one", "two"]}
+
+    def show(self, id):
+        self.calls.append("show")
+        return {"id": id}
@@ -0,0 +1,15 @@
+import threading
+
+
+class HotController:
+    single_flight = dict(actions="show", timeout=5)
+
+    calls = []
+    release = threading.Event()
+
+    def show(self, id):
+        self.calls.append(id)
+        self.release.wait(5)
+        if id == "error":
+            raise RuntimeError("boom")
+        return {"id": id, "call": len(self.calls)}
@@ -0,0 +1,16 @@
+class PagesController:
+    implicit_render = True
+    lifecycle = "per_request"
+
+    def index(self):
+        return {"title": "Pages"}, {"X-Pages": "1"}
+
+    def show(self, id):
+        self.page = id
+        self._draft = True
+
+    def create(self):
+        return {"created": True}, 201
+
+    def edit(self, id):
+        return f"editing {id}"
@@ -0,0 +1,25 @@
+class Product:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+    def to_dict(self):
+        return {"id": self.id, "name": self.name}
+
+
+class ProductsController:
+    respond_to = dict(actions="index show create")
+
+    products = [Product(1, "Lamp"), Product(2, "Desk")]
+
+    def index(self):
+        return {"products": self.products}
+
+    def show(self, id):
+        return self.products[int(id) - 1], {"X-Product": id}
+
+    def create(self):
+        return "created", 201
+
+    def delete(self, id):
+        return {"deleted": id}
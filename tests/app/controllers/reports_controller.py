@@ -0,0 +1,18 @@
+from flask import request
+
+from flask_mvc import stream_render
+
+
+class ReportsController:
+    after_request = dict(callback="after_add_header", actions="index")
+
+    def index(self):
+        return stream_render(
+            ["reports/missing.html", "reports/index.html"],
+            chunk_size=request.args.get("chunk_size", type=int),
+            rows=range(request.args.get("rows", 3, type=int)),
+        )
+
+    def after_add_header(self, response):
+        response.headers["X-Report"] = "streamed"
+        return response
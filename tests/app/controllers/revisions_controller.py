@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from flask import render_template_string
+
+
+class RevisionsController:
+    etag = dict(actions="index show", version="version")
+
+    revisions = {"1": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+    calls = []
+
+    def index(self):
+        self.calls.append("index")
+        return render_template_string("{{ count }} revisions", count=len(self.revisions))
+
+    def show(self, id):
+        self.calls.append("show")
+        return render_template_string("revision {{ id }}", id=id)
+
+    def version(self, id=None):
+        if id is None:
+            return len(self.revisions)
+        return self.revisions[id]
@@ -0,0 +1,16 @@
+from flask import request
+
+
+class UploadsController:
+    def create(self):
+        return self.echo()
+
+    def update(self, id):
+        return self.echo()
+
+    def delete(self, id):
+        return self.echo()
+
+    def echo(self):
+        files = {name: file.read().decode() for name, file in request.files.items()}
+        return {"method": request.method, "form": request.form, "files": files}
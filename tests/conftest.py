@@ -6,8 +6,10 @@ import os
 import tempfile
 
 import pytest
+from flask import Flask
 from splinter import Browser
 
+from flask_mvc import FlaskMVC
 from tests.app import create_app, db
 from tests.app.models.message import Message
 
@@ -31,6 +33,55 @@ def app():
     return app
 
 
+@pytest.fixture
+def mvc_config():
+    """Config of the mvc_app fixture, overridden by parametrizing mvc_config."""
+    return {}
+
+
+@pytest.fixture
+def mvc_routes():
+    """Routes added to those of mvc_app, a callable receiving the router, or None."""
+    return None
+
+
+@pytest.fixture
+def create_mvc_app():
+    """Factory of applications booted by FlaskMVC from the tests.app package."""
+
+    def create(root_path=None, manifest=None, routes=None, converters=None, **config):
+        """Boot an application.
+
+        routes is called with the router of the extension, to add routes to those
+        of tests/app/routes.py, and converters are added to the URL map first.
+        """
+        app = Flask("tests.app", root_path=root_path)
+        app.config.update(config)
+        app.url_map.converters.update(converters or {})
+        mvc = FlaskMVC(manifest=manifest)
+        if routes is not None:
+            routes(mvc.router)
+        mvc.init_app(app, path="tests.app")
+
+        return app, mvc
+
+    return create
+
+
+@pytest.fixture
+def mvc_app(create_mvc_app, mvc_config, mvc_routes):
+    """Application booted by FlaskMVC from tests.app with mvc_config and mvc_routes."""
+    app, _ = create_mvc_app(routes=mvc_routes, **mvc_config)
+
+    return app
+
+
+@pytest.fixture
+def mvc(mvc_app):
+    """The FlaskMVC extension of mvc_app."""
+    return mvc_app.extensions["flask_mvc"]
+
+
 @pytest.fixture
 def client(app):
     """Create test client with database setup."""
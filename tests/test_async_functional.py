@@ -0,0 +1,119 @@
+"""
+Tests for async controller actions and callbacks.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from flask import Flask
+
+from flask_mvc.core.config import MVCConfig
+from flask_mvc.core.event_loop import SharedEventLoop, ensure_sync
+from flask_mvc.core.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def mvc_routes():
+    return lambda router: router.get("/async", "async#index")
+
+
+@pytest.mark.parametrize(
+    "mvc_config",
+    [
+        dict(FLASK_MVC_ASYNC_MODE="shared_loop"),
+        dict(
+            FLASK_MVC_ASYNC_MODE="shared_loop",
+            FLASK_MVC_CONTROLLER_LIFECYCLE="per_request",
+        ),
+    ],
+)
+def test_shared_loop_runs_async_actions_and_callbacks(mvc_app):
+    """Test async actions and callbacks on the shared event loop."""
+    client = mvc_app.test_client()
+
+    response = client.get("/async?user=marcus")
+
+    assert response.text == "marcus: a b"
+    assert response.headers["X-Async"] == "yes"
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_ASYNC_MODE="flask")])
+def test_flask_mode_runs_async_actions_and_callbacks(mvc_app):
+    """Test async actions and callbacks through Flask's async support."""
+    pytest.importorskip("asgiref")
+    client = mvc_app.test_client()
+
+    response = client.get("/async?user=marcus")
+
+    assert response.text == "marcus: a b"
+    assert response.headers["X-Async"] == "yes"
+
+
+def test_shared_loop_is_reused_between_calls():
+    """Test that one event loop serves every call of the process."""
+    loop = SharedEventLoop.get()
+
+    async def running_loop():
+        return asyncio.get_running_loop()
+
+    assert loop.run(running_loop()) is loop.loop
+    assert SharedEventLoop.get() is loop
+    assert loop.run(running_loop()) is loop.loop
+
+
+def test_shared_loop_propagates_exceptions():
+    """Test that exceptions raised by coroutines reach the caller."""
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        SharedEventLoop.get().run(fail())
+
+
+def test_shared_loop_serves_concurrent_threads():
+    """Test that several threads can wait on the shared loop at once."""
+    results = []
+
+    async def work(number):
+        await asyncio.sleep(0.01)
+        return number
+
+    threads = [
+        threading.Thread(
+            target=lambda number=number: results.append(
+                SharedEventLoop.get().run(work(number))
+            )
+        )
+        for number in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [0, 1, 2, 3, 4]
+
+
+def test_sync_functions_are_not_wrapped():
+    """Test that synchronous functions are returned untouched."""
+    app = Flask(__name__)
+    MVCConfig.init_app(app)
+
+    def index():
+        return "sync"
+
+    assert ensure_sync(app, index) is index
+
+
+def test_unknown_async_mode_raises_error():
+    """Test that unknown async modes are rejected."""
+    app = Flask(__name__)
+    app.config["FLASK_MVC_ASYNC_MODE"] = "gevent"
+
+    async def index():
+        return "async"
+
+    with pytest.raises(ConfigurationError):
+        ensure_sync(app, index)
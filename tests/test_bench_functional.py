@@ -0,0 +1,166 @@
+"""
+Tests for the load test of the routes and the 'flask mvc bench' command.
+"""
+
+import json
+
+import pytest
+
+from flask_mvc.core import load_test
+from flask_mvc.middlewares.http.route_table import Route
+
+
+def bench(app, *args):
+    return app.test_cli_runner().invoke(args=["mvc", "bench", *args])
+
+
+def test_fill_path_with_defaults_and_fixtures():
+    """Test that parameters are filled from the fixtures, else with defaults."""
+    route = Route(("GET",), "/items/<int:id>/<path:slug>/<uuid:key>", "items", "show")
+
+    assert load_test.fill_path(route) == (
+        "/items/1/1/00000000-0000-0000-0000-000000000001"
+    )
+    assert load_test.fill_path(route, {"id": 42, "slug": "a b/c"}).startswith(
+        "/items/42/a%20b/c/"
+    )
+    assert load_test.fill_path(
+        route, lambda route, name: f"{route.action}-{name}" if name == "id" else None
+    ).startswith("/items/show-id/1/")
+
+
+def test_targets_filter_methods_and_endpoints():
+    """Test that only the given methods and endpoints are targeted."""
+    routes = [
+        Route(("GET",), "/messages", "messages", "index"),
+        Route(("GET",), "/messages/<id>", "messages", "show"),
+        Route(("PUT", "PATCH"), "/messages/<id>", "messages", "update"),
+        Route(("GET",), "/health", "health", "index"),
+    ]
+
+    assert load_test.targets(routes, endpoints=["messages.*"]) == [
+        load_test.Target("messages.index", "GET", "/messages"),
+        load_test.Target("messages.show", "GET", "/messages/1"),
+    ]
+    assert load_test.targets(routes, methods=["patch"], fixtures={"id": 3}) == [
+        load_test.Target("messages.update", "PATCH", "/messages/3")
+    ]
+
+
+def test_percentile():
+    """Test the nearest-rank percentiles."""
+    latencies = [float(value) for value in range(1, 101)]
+
+    assert load_test.percentile(latencies, 0.5) == 50.0
+    assert load_test.percentile(latencies, 0.99) == 99.0
+    assert load_test.percentile([3.0], 0.95) == 3.0
+    assert load_test.percentile([], 0.95) == 0.0
+
+
+def test_bench_command_in_process(mvc_app):
+    """Test the report of each endpoint sent through the test client."""
+    result = bench(
+        mvc_app,
+        "-n",
+        "20",
+        "-c",
+        "4",
+        "-e",
+        "callbacks.*",
+        "-e",
+        "health.index",
+        "--json",
+    )
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert [(item["endpoint"], item["path"]) for item in report] == [
+        ("callbacks.index", "/callbacks"),
+        ("callbacks.show", "/callbacks/1"),
+        ("health.index", "/api/v1/health"),
+    ]
+    for item in report:
+        assert item["requests"] == 20
+        assert item["errors"] == 0
+        assert item["statuses"] == {"200": 20}
+        assert item["throughput"] > 0
+        assert 0 < item["p50_ms"] <= item["p95_ms"] <= item["p99_ms"]
+
+
+def test_bench_command_table(mvc_app):
+    """Test the table printed without --json."""
+    result = bench(mvc_app, "-n", "5", "-e", "callbacks.show")
+
+    assert result.exit_code == 0, result.output
+    assert "p99" in result.output
+    assert "callbacks.show" in result.output
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_BENCH_FIXTURES={"id": "7"})])
+def test_bench_command_fixtures(mvc_app):
+    """Test that --param takes precedence over FLASK_MVC_BENCH_FIXTURES."""
+
+    result = bench(mvc_app, "-n", "1", "-e", "callbacks.show", "--json")
+    assert json.loads(result.output)[0]["path"] == "/callbacks/7"
+
+    result = bench(mvc_app, "-n", "1", "-e", "callbacks.show", "-p", "id=8", "--json")
+    assert json.loads(result.output)[0]["path"] == "/callbacks/8"
+
+    result = bench(mvc_app, "-p", "id")
+    assert result.exit_code == 2
+    assert "name=value" in result.output
+
+
+def test_bench_command_spawned_server(mvc_app):
+    """Test that --server sends the requests over HTTP."""
+    result = bench(
+        mvc_app, "-n", "5", "-c", "2", "-e", "health.index", "--server", "--json"
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)[0]["statuses"] == {"200": 5}
+
+
+def test_http_client_against_a_running_server(mvc_app):
+    """Test the client used with --url, error statuses included."""
+
+    with load_test.serve(mvc_app) as url:
+        client = load_test.HTTPClient(url + "/")
+        assert client.request("GET", "/api/v1/health") == 200
+        assert client.request("GET", "/missing") == 404
+
+        result = bench(mvc_app, "-n", "3", "-e", "health.index", "--url", url, "--json")
+    assert json.loads(result.output)[0]["statuses"] == {"200": 3}
+
+
+def test_bench_command_fails_on_server_errors(mvc_app):
+    """Test that server errors and failed requests fail the command."""
+    # Without a database, the messages actions raise
+    result = bench(mvc_app, "-n", "3", "-e", "messages.index")
+
+    assert result.exit_code == 1
+    assert "3 request(s) failed" in result.output
+
+    report = load_test.run(
+        load_test.HTTPClient("http://127.0.0.1:9", timeout=1),
+        [load_test.Target("health.index", "GET", "/api/v1/health")],
+        requests=2,
+        warmup=0,
+    )
+    assert report[0]["errors"] == 2
+    assert report[0]["statuses"] == {"0": 2}
+
+
+def test_bench_command_usage_errors(mvc_app):
+    """Test the options that cannot be satisfied."""
+
+    result = bench(mvc_app, "-e", "missing.*")
+    assert result.exit_code == 1
+    assert "no route matches" in result.output
+
+    result = bench(mvc_app, "--server", "--url", "http://127.0.0.1:5000")
+    assert result.exit_code == 2
+
+    result = bench(mvc_app, "--url", "file:///etc/passwd")
+    assert result.exit_code == 2
+    assert "http or https URL" in result.output
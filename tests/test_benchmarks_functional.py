@@ -0,0 +1,68 @@
+"""
+Smoke tests for the benchmark suite of the repository (python -m benchmarks).
+"""
+
+import json
+
+from benchmarks import suite
+
+
+def test_suite_reports_each_size(tmp_path, capsys):
+    """Test the shape of the report of a small run."""
+    output = tmp_path / "results.json"
+
+    code = suite.main(
+        ["--sizes", "10", "--requests", "20", "--repeat", "1", "--output", str(output)]
+    )
+
+    assert code == 0
+    report = json.loads(output.read_text())
+    assert set(report["environment"]) == {"python", "platform", "flask", "flask_mvc"}
+    assert isinstance(report["environment"]["flask_mvc"], str)
+    assert report["settings"] == {"sizes": [10], "requests": 20, "repeat": 1}
+
+    [result] = report["results"]
+    assert result["size"] == 10
+    assert result["routes"] >= 10
+    assert set(result["boot"]) == {
+        "cold_seconds",
+        "warm_seconds",
+        "peak_traced_bytes",
+        "max_rss_kib",
+        "phases",
+    }
+    assert set(result["dispatch"]) == {
+        "flask_us",
+        "plain_us",
+        "callbacks_us",
+        "overhead_us",
+    }
+    assert set(result["method_override"]) == {
+        "put_us",
+        "urlencoded_us",
+        "multipart_us",
+        "header_us",
+    }
+    assert all(result["dispatch"][name] > 0 for name in ("flask_us", "plain_us"))
+    assert "10 routes" in capsys.readouterr().err
+
+
+def test_compare_reports_regressions():
+    """Test that only slowdowns beyond the tolerance are reported."""
+    baseline = {"results": [{"size": 10, "boot": {"cold_seconds": 1.0}}]}
+    current = {
+        "results": [
+            {
+                "size": 10,
+                "boot": {"cold_seconds": 1.5, "phases": {}},
+                "dispatch": {"plain_us": 10.0},
+                "method_override": {},
+            },
+            {"size": 100, "boot": {}, "dispatch": {}, "method_override": {}},
+        ]
+    }
+
+    assert suite.compare(current, baseline, 0.2) == [
+        "10 routes: boot.cold_seconds 1 -> 1.5 (+50%)"
+    ]
+    assert suite.compare(current, baseline, 0.6) == []
@@ -0,0 +1,132 @@
+"""
+Tests for the boot profiler and the 'flask mvc profile-boot' command.
+"""
+
+import json
+
+import pytest
+
+from flask_mvc import cli as mvc_cli
+from flask_mvc.core.boot_profiler import PROFILE_BOOT_ENV, BootProfiler
+
+PHASES = [
+    "configure_template_folder",
+    "configure_json_provider",
+    "load_routes",
+    "configure_method_override_middleware",
+    "register_controllers",
+    "configure_instrumentation",
+    "inject_template_helpers",
+    "configure_cli_commands",
+    "total",
+]
+
+
+profiled = pytest.mark.parametrize("mvc_config", [{"FLASK_MVC_PROFILE_BOOT": True}])
+
+
+def test_boot_profile_is_off_by_default(monkeypatch, create_mvc_app):
+    """Test that nothing is recorded unless profiling is enabled."""
+    monkeypatch.delenv(PROFILE_BOOT_ENV, raising=False)
+    _, mvc = create_mvc_app()
+
+    assert mvc.boot_profile is None
+
+
+@profiled
+def test_boot_profile_records_phases_and_controllers(mvc):
+    """Test the layout of the boot profile."""
+    profile = mvc.boot_profile
+
+    assert list(profile["phases"]) == PHASES
+    assert profile["phases"]["total"] >= profile["phases"]["register_controllers"]
+
+    messages = profile["controllers"]["messages"]
+    assert {"import", "instantiate", "callbacks", "actions", "total", "memory"} <= set(
+        messages
+    )
+    assert messages["total"] >= messages["import"]
+
+
+def test_boot_profile_enabled_from_environment(monkeypatch, create_mvc_app):
+    """Test that the environment variable enables profiling."""
+    monkeypatch.setenv(PROFILE_BOOT_ENV, "1")
+    _, mvc = create_mvc_app()
+
+    assert set(mvc.boot_profile["controllers"]) >= {"messages", "callbacks"}
+
+
+@pytest.mark.parametrize(
+    "mvc_config", [{"FLASK_MVC_PROFILE_BOOT": True, "FLASK_MVC_LAZY_CONTROLLERS": True}]
+)
+def test_lazy_controllers_are_profiled_when_loaded(mvc):
+    """Test that lazy controllers show up once they are loaded."""
+    assert mvc.boot_profile["controllers"] == {}
+
+    mvc.warmup(controllers=["health"], templates=False)
+    assert list(mvc.boot_profile["controllers"]) == ["health"]
+
+
+def test_disabled_profiler_records_nothing():
+    """Test that a disabled profiler ignores every timing."""
+    profiler = BootProfiler()
+    profiler.start()
+    with profiler.phase("phase"), profiler.controller("messages", "import"):
+        pass
+    profiler.stop()
+
+    assert profiler.report() == {"phases": {}, "controllers": {}}
+
+
+@profiled
+def test_profile_boot_command(mvc_app):
+    """Test the table printed by the CLI command."""
+    result = mvc_app.test_cli_runner().invoke(args=["mvc", "profile-boot"])
+
+    assert result.exit_code == 0
+    assert "Boot profile (total" in result.output
+    assert "register_controllers" in result.output
+    assert "messages" in result.output
+    assert "KiB" in result.output
+
+
+@profiled
+def test_profile_boot_command_json(mvc_app):
+    """Test the JSON printed by the CLI command."""
+    result = mvc_app.test_cli_runner().invoke(args=["mvc", "profile-boot", "--json"])
+
+    assert result.exit_code == 0
+    assert list(json.loads(result.output)["phases"]) == PHASES
+
+
+def test_profile_boot_command_reruns_without_profile(monkeypatch, create_mvc_app):
+    """Test that the command boots a fresh interpreter with profiling enabled."""
+    monkeypatch.delenv(PROFILE_BOOT_ENV, raising=False)
+    calls = []
+
+    class Completed:
+        returncode = 0
+
+    def run(command, env):
+        calls.append((command, env))
+        return Completed()
+
+    monkeypatch.setattr(mvc_cli.subprocess, "run", run)
+    app, _ = create_mvc_app()
+
+    result = app.test_cli_runner().invoke(args=["mvc", "profile-boot"])
+
+    assert result.exit_code == 0
+    command, env = calls[0]
+    assert command[1:3] == ["-m", "flask"]
+    assert env[PROFILE_BOOT_ENV] == "1"
+
+
+def test_profile_boot_command_fails_when_profiling_does_not_start(monkeypatch, mvc_app):
+    """Test that the command does not rerun itself forever."""
+    monkeypatch.setenv(PROFILE_BOOT_ENV, "1")
+
+    result = mvc_app.test_cli_runner().invoke(args=["mvc", "profile-boot"])
+
+    assert result.exit_code != 0
+    assert "did not record a boot profile" in result.output
@@ -0,0 +1,202 @@
+"""
+Tests for the response cache declared by controllers.
+"""
+
+import time
+
+import pytest
+from flask_mvc.core.cache import ClientCache, MemoryCache, get_cache
+from tests.app.controllers.articles_controller import ArticlesController
+
+
+class FakeRedis:
+    """A local stand-in for a redis-py client."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode()
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1).encode()
+        return int(self.values[key])
+
+
+@pytest.fixture(autouse=True)
+def articles():
+    ArticlesController.articles = {"1": "First article"}
+    ArticlesController.calls = []
+
+
+def routes(router):
+    router.all("articles", only="index show create update delete")
+
+
+@pytest.fixture
+def mvc_routes():
+    return routes
+
+
+def test_cached_actions_are_served_without_running_the_action(mvc_app):
+    """Test that a cached response replaces the action."""
+    client = mvc_app.test_client()
+
+    first = client.get("/articles/1")
+    second = client.get("/articles/1")
+
+    assert first.json == second.json == {"title": "First article", "lang": None}
+    assert second.headers["Vary"] == "Accept-Language"
+    assert ArticlesController.calls == ["show"]
+
+
+def test_cache_keys_include_view_args_query_string_and_vary_headers(mvc_app):
+    """Test that different requests get different cache entries."""
+    client = mvc_app.test_client()
+
+    client.get("/articles/1")
+    client.get("/articles/1", headers={"Accept-Language": "pt"})
+    client.get("/articles/1?page=2")
+    client.get("/articles")
+    client.get("/articles/1", headers={"Accept-Language": "pt"})
+
+    assert ArticlesController.calls == ["show", "show", "show", "index"]
+
+
+def test_error_responses_are_not_cached(mvc_app):
+    """Test that only successful responses are cached."""
+    client = mvc_app.test_client()
+
+    client.get("/articles/2")
+    client.get("/articles/2")
+
+    assert ArticlesController.calls == ["show", "show"]
+
+
+@pytest.mark.parametrize(
+    "method, path, json",
+    [
+        ("post", "/articles", {"title": "Second article"}),
+        ("put", "/articles/1", {"title": "Edited"}),
+        ("delete", "/articles/1", None),
+    ],
+)
+def test_write_actions_invalidate_the_controller_cache(mvc_app, method, path, json):
+    """Test that create, update and delete invalidate cached responses."""
+    client = mvc_app.test_client()
+
+    client.get("/articles")
+    getattr(client, method)(path, json=json)
+    client.get("/articles")
+
+    assert ArticlesController.calls == ["index", "index"]
+
+
+def test_failed_write_actions_keep_the_cache(mvc_app):
+    """Test that failed writes do not invalidate the cache."""
+    client = mvc_app.test_client()
+
+    client.get("/articles")
+    client.put("/articles/9", json={"title": "Missing"})
+    client.get("/articles")
+
+    assert ArticlesController.calls == ["index"]
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_CACHE_SIZE=3)])
+def test_invalidation_survives_cache_pressure(mvc_app):
+    """Test that evicting responses never brings back an invalidated one."""
+    client = mvc_app.test_client()
+    cache = get_cache(mvc_app)
+
+    for version in range(4):
+        client.put("/articles/1", json={"title": f"v{version}"})
+        assert client.get("/articles/1").json["title"] == f"v{version}"
+        client.put("/articles/1", json={"title": "draft"})
+        # Responses cached by other controllers
+        for other in range(2):
+            cache.set(f"flask_mvc:cache:other:{version}:{other}", "cached")
+
+
+def test_invalidate_cache_from_the_extension(mvc_app, mvc):
+    """Test invalidating a controller's cache from outside its actions."""
+    client = mvc_app.test_client()
+
+    client.get("/articles")
+    mvc.invalidate_cache("articles")
+    client.get("/articles")
+
+    assert ArticlesController.calls == ["index", "index"]
+
+
+def test_shared_backend_through_a_client(create_mvc_app):
+    """Test the shared backend with a local stand-in client."""
+    redis = FakeRedis()
+    app, _ = create_mvc_app(routes=routes, FLASK_MVC_CACHE_BACKEND=redis)
+    client = app.test_client()
+
+    assert isinstance(get_cache(app), ClientCache)
+
+    first = client.get("/articles/1")
+    second = client.get("/articles/1")
+    client.delete("/articles/1")
+    client.get("/articles")
+
+    assert first.json == second.json
+    assert second.headers["Content-Type"] == "application/json"
+    assert ArticlesController.calls == ["show", "index"]
+    assert redis.values["flask_mvc:generation:articles"] == b"1"
+
+
+def test_controllers_without_cache_use_no_backend(mvc_app, mvc):
+    """Test that controllers without a cache declaration are left alone."""
+    assert mvc.controllers["messages"].cache.backend is None
+    assert mvc.controllers["articles"].cache.backend is get_cache(mvc_app)
+
+
+def test_memory_cache_lru_eviction():
+    """Test that the least recently used values are evicted."""
+    cache = MemoryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_memory_cache_ttl_expiration():
+    """Test that expired values are dropped."""
+    cache = MemoryCache()
+    cache.set("a", 1, ttl=0.01)
+    cache.set("b", 2)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.delete("b")
+    assert cache.get("b") is None
+    assert cache.incr("counter") == 1
+    assert cache.incr("counter") == 2
+
+
+def test_memory_cache_never_evicts_counters():
+    """Test that counters are kept apart from the evicted values."""
+    cache = MemoryCache(max_size=1)
+    cache.incr("counter")
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert len(cache) == 1
+    assert cache.get("counter") == 1
+    assert cache.incr("counter") == 2
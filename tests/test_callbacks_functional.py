@@ -3,10 +3,14 @@ Comprehensive tests for Flask MVC callback middleware system.
 """
 
 import pytest
-from flask import Response, request, url_for
+from flask import Blueprint, Flask, Response, request, url_for
 
-from flask_mvc.middlewares.callback_middleware import CallbackMiddleware
+from flask_mvc.middlewares.callback_middleware import (
+    CallbackDispatcher,
+    CallbackMiddleware,
+)
 from tests.app.controllers.callbacks_controller import CallbacksController
+from tests.app.controllers.health_controller import HealthController
 
 # Callback Middleware Tests
 
@@ -75,44 +79,30 @@ def test_actions_parsing(app):
 
 def test_hook_execution_with_matching_endpoint(app):
     """Test hook execution when endpoint matches."""
-    controller = CallbacksController()
-    middleware = CallbackMiddleware(app, "callbacks", controller)
+    dispatcher = CallbackDispatcher(Blueprint("hooks", __name__))
+    executed = []
+    dispatcher.add(
+        "before_request", "callbacks.index", lambda: executed.append("called")
+    )
 
     with app.test_request_context("/callbacks"):
-        # Mock the request to simulate endpoint matching
-        from unittest.mock import patch
+        dispatcher.before_request()
 
-        with patch("flask.request") as mock_request:
-            mock_request.endpoint = "callbacks.index"
-
-            executed = []
-
-            def mock_hook():
-                executed.append("called")
-
-            middleware.execute_hook(mock_hook, ["index"])
-            assert len(executed) == 1
+    assert executed == ["called"]
 
 
 def test_hook_execution_without_matching_endpoint(app):
     """Test hook execution when endpoint doesn't match."""
-    controller = CallbacksController()
-    middleware = CallbackMiddleware(app, "callbacks", controller)
-
-    with app.test_request_context("/other"):
-        # Mock the request to simulate endpoint not matching
-        from unittest.mock import patch
-
-        with patch("flask.request") as mock_request:
-            mock_request.endpoint = "other.index"
-
-            executed = []
+    dispatcher = CallbackDispatcher(Blueprint("hooks", __name__))
+    executed = []
+    dispatcher.add(
+        "before_request", "callbacks.index", lambda: executed.append("called")
+    )
 
-            def mock_hook():
-                executed.append("called")
+    with app.test_request_context("/callbacks/1"):
+        dispatcher.before_request()
 
-            middleware.execute_hook(mock_hook, ["index"])
-            assert len(executed) == 0
+    assert executed == []
 
 
 # Callback Configuration Tests
@@ -277,3 +267,59 @@ def test_multiple_controllers_callback_isolation(client):
     messages_response = client.get(url_for("messages.index"))
     assert messages_response.status_code == 200
     assert "from_after_request" not in messages_response.headers
+
+
+# Callback Dispatcher Tests
+
+
+def test_hooks_are_registered_on_controller_blueprint():
+    """Test that callbacks are registered on the controller's blueprint only."""
+    app = Flask(__name__)
+    blueprint = Blueprint("callbacks", __name__)
+
+    middleware = CallbackMiddleware(app, "callbacks", CallbacksController(), blueprint)
+    middleware.register()
+    app.register_blueprint(blueprint)
+
+    assert None not in app.before_request_funcs
+    assert app.before_request_funcs["callbacks"] == [
+        middleware.dispatcher.before_request
+    ]
+    assert app.after_request_funcs["callbacks"] == [middleware.dispatcher.after_request]
+
+
+def test_controller_without_callbacks_registers_nothing():
+    """Test that controllers without callbacks add no hooks to their blueprint."""
+    app = Flask(__name__)
+    blueprint = Blueprint("health", __name__)
+
+    middleware = CallbackMiddleware(app, "health", HealthController(), blueprint)
+    middleware.register()
+    app.register_blueprint(blueprint)
+
+    assert middleware.dispatcher is None
+    assert "health" not in app.before_request_funcs
+    assert "health" not in app.after_request_funcs
+
+
+def test_dispatcher_indexes_hooks_by_endpoint():
+    """Test that hooks are bound to their endpoints at registration time."""
+    app = Flask(__name__)
+
+    middleware = CallbackMiddleware(app, "callbacks", CallbacksController())
+    middleware.register()
+
+    assert set(middleware.dispatcher.hooks["before_request"]) == {"callbacks.index"}
+    assert set(middleware.dispatcher.hooks["after_request"]) == {"callbacks.show"}
+
+
+def test_dispatcher_skips_hooks_of_other_endpoints(app):
+    """Test that a request only runs the hooks bound to its own endpoint."""
+    executed = []
+    dispatcher = CallbackDispatcher(Flask(__name__))
+    dispatcher.add("before_request", "callbacks.index", lambda: executed.append(1))
+
+    with app.test_request_context("/messages"):
+        dispatcher.before_request()
+
+    assert executed == []
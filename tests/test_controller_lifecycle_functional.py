@@ -0,0 +1,171 @@
+"""
+Tests for the controller lifecycles: singleton, per-request and pooled instances.
+"""
+
+import pytest
+from flask import Flask
+
+from flask_mvc.core.config import MVCConfig
+from flask_mvc.core.controller_lifecycle import (
+    PerRequestLifecycle,
+    PooledLifecycle,
+    SingletonLifecycle,
+    build_lifecycle,
+)
+from flask_mvc.core.exceptions import ConfigurationError
+from tests.app.controllers import counter_controller
+from tests.app.controllers.counter_controller import CounterController
+
+
+class ResettableController(CounterController):
+    def reset(self):
+        self.page = 100
+
+
+class PooledController(CounterController):
+    def reset(self):
+        vars(self).pop("page", None)
+
+
+class ItemsController:
+    before_request = dict(callback="load", actions="index")
+
+    def __init__(self):
+        self.items = []
+
+    def load(self):
+        self.items.append(f"request-{len(self.items) + 1}")
+
+    def index(self):
+        return ",".join(self.items)
+
+    def reset(self):
+        self.items = []
+
+
+@pytest.fixture
+def create_app(create_mvc_app, monkeypatch):
+    def create(lifecycle, controller_class=CounterController):
+        # Declared by the controller, so the controllers of tests.app keep theirs
+        controller_class = type(
+            controller_class.__name__, (controller_class,), {"lifecycle": lifecycle}
+        )
+        monkeypatch.setattr(counter_controller, "CounterController", controller_class)
+        app, _ = create_mvc_app(
+            routes=lambda router: router.get("/counter", "counter#index"),
+            FLASK_MVC_CONTROLLER_POOL_SIZE=1,
+        )
+
+        return app
+
+    return create
+
+
+# Lifecycle Selection Tests
+
+
+@pytest.mark.parametrize(
+    "mode, lifecycle_class",
+    [
+        ("singleton", SingletonLifecycle),
+        ("per_request", PerRequestLifecycle),
+        ("pool", PooledLifecycle),
+    ],
+)
+def test_build_lifecycle_from_config(mode, lifecycle_class):
+    """Test that the configured lifecycle mode is used."""
+    config = dict(MVCConfig.DEFAULTS, FLASK_MVC_CONTROLLER_LIFECYCLE=mode)
+
+    assert isinstance(
+        build_lifecycle("counter", PooledController, config), lifecycle_class
+    )
+
+
+def test_controller_lifecycle_attribute_overrides_config():
+    """Test that a controller can declare its own lifecycle."""
+
+    class PerRequestController(CounterController):
+        lifecycle = "per_request"
+
+    lifecycle = build_lifecycle("counter", PerRequestController, MVCConfig.DEFAULTS)
+
+    assert isinstance(lifecycle, PerRequestLifecycle)
+
+
+def test_unknown_lifecycle_raises_error():
+    """Test that unknown lifecycle modes are rejected."""
+    config = dict(MVCConfig.DEFAULTS, FLASK_MVC_CONTROLLER_LIFECYCLE="threaded")
+
+    with pytest.raises(ConfigurationError):
+        build_lifecycle("counter", CounterController, config)
+
+
+# Request Isolation Tests
+
+
+def test_singleton_shares_state_between_requests(create_app):
+    """Test that the singleton lifecycle keeps the historical shared instance."""
+    client = create_app("singleton").test_client()
+
+    assert client.get("/counter").text == "1 open"
+    assert client.get("/counter").text == "2 open"
+
+
+def test_per_request_isolates_state_between_requests(create_app):
+    """Test that each request gets a fresh controller instance."""
+    client = create_app("per_request").test_client()
+    controller_class = counter_controller.CounterController
+    created = controller_class.instances
+
+    assert client.get("/counter").text == "1 open"
+    assert client.get("/counter").text == "1 open"
+    assert controller_class.instances == created + 2
+
+
+def test_pool_reuses_and_resets_instances(create_app):
+    """Test that pooled instances are reused and reset on checkout."""
+    client = create_app("pool", PooledController).test_client()
+    controller_class = counter_controller.CounterController
+    created = controller_class.instances
+
+    assert client.get("/counter").text == "1 open"
+    assert client.get("/counter").text == "1 open"
+    assert controller_class.instances == created + 1
+
+
+def test_pool_does_not_leak_state_changed_in_place(create_app):
+    """Test that a list mutated by a request is not seen by the next one."""
+    client = create_app("pool", ItemsController).test_client()
+
+    assert client.get("/counter").text == "request-1"
+    assert client.get("/counter").text == "request-1"
+
+
+def test_pool_requires_controller_reset(create_app):
+    """Test that controllers without reset() cannot be pooled."""
+    with pytest.raises(ConfigurationError, match="reset"):
+        create_app("pool")
+
+
+def test_pool_calls_controller_reset(create_app):
+    """Test that pooled controllers defining reset() control their own reset."""
+    client = create_app("pool", ResettableController).test_client()
+
+    assert client.get("/counter").text == "1 open"
+    assert client.get("/counter").text == "101 open"
+
+
+def test_pool_discards_instances_when_full():
+    """Test that the pool never keeps more idle instances than its size."""
+    app = Flask(__name__)
+    lifecycle = PooledLifecycle("counter", PooledController, 1)
+
+    with app.app_context():
+        first = lifecycle.instance()
+        with app.app_context():
+            second = lifecycle.instance()
+            lifecycle.release()
+        lifecycle.release()
+
+    assert second is not first
+    assert lifecycle._pool.qsize() == 1
@@ -0,0 +1,103 @@
+"""
+Tests for automatic ETags and conditional GET requests.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from tests.app.controllers.feeds_controller import FeedsController
+from tests.app.controllers.revisions_controller import RevisionsController
+
+
+@pytest.fixture(autouse=True)
+def reset_controllers():
+    FeedsController.calls = []
+    RevisionsController.calls = []
+    RevisionsController.revisions = {"1": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+
+
+@pytest.fixture
+def mvc_routes():
+    def routes(router):
+        router.all("feeds", only="index show")
+        router.all("revisions", only="index show")
+
+    return routes
+
+
+def test_body_hash_etag(mvc_app):
+    """Test that responses get a weak ETag hashing their body."""
+    client = mvc_app.test_client()
+
+    first = client.get("/feeds")
+    second = client.get("/feeds/1")
+
+    assert first.headers["ETag"].startswith('W/"')
+    assert first.headers["ETag"] != second.headers["ETag"]
+    assert client.get("/feeds").headers["ETag"] == first.headers["ETag"]
+
+
+def test_body_hash_etag_answers_not_modified(mvc_app):
+    """Test that a matching If-None-Match gets an empty 304."""
+    client = mvc_app.test_client()
+    etag = client.get("/feeds").headers["ETag"]
+
+    response = client.get("/feeds", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert (
+        client.get("/feeds", headers={"If-None-Match": 'W/"other"'}).status_code == 200
+    )
+    assert FeedsController.calls == ["index", "index", "index"]
+
+
+def test_version_etag_skips_the_action(mvc_app):
+    """Test that a version method answers conditional requests without rendering."""
+    client = mvc_app.test_client()
+
+    first = client.get("/revisions")
+    response = client.get("/revisions", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.get_data(as_text=True) == "1 revisions"
+    assert response.status_code == 304
+    assert response.headers["ETag"] == first.headers["ETag"]
+    assert RevisionsController.calls == ["index"]
+
+
+def test_version_etag_changes_with_the_version(mvc_app):
+    """Test that a new version gets a full response."""
+    client = mvc_app.test_client()
+    etag = client.get("/revisions").headers["ETag"]
+    RevisionsController.revisions["2"] = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    response = client.get("/revisions", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == "2 revisions"
+    assert response.headers["ETag"] != etag
+
+
+def test_datetime_version_handles_if_modified_since(mvc_app):
+    """Test Last-Modified and If-Modified-Since with a datetime version."""
+    client = mvc_app.test_client()
+
+    first = client.get("/revisions/1")
+    not_modified = client.get(
+        "/revisions/1", headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+    modified = client.get(
+        "/revisions/1", headers={"If-Modified-Since": "Sun, 01 Jan 2023 00:00:00 GMT"}
+    )
+
+    assert first.headers["Last-Modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+    assert RevisionsController.calls == ["show", "show"]
+
+
+def test_controllers_without_etag_are_unchanged(mvc_app):
+    """Test that ETags are opt-in."""
+    client = mvc_app.test_client()
+
+    assert "ETag" not in client.get("/callbacks").headers
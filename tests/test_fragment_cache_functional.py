@@ -0,0 +1,144 @@
+"""
+Tests for the {% cache %} template fragment cache.
+"""
+
+import itertools
+
+import pytest
+from flask import Flask, render_template_string
+
+from flask_mvc import FlaskMVC
+from flask_mvc.core.cache import ClientCache, MemoryCache, get_cache
+from flask_mvc.helpers.html.fragment_cache_helper import FragmentCacheExtension
+
+TEMPLATE = "{% cache 'nav', ttl %}<nav>{{ count() }}</nav>{% endcache %}"
+
+
+def counting(app):
+    """Add a count() template global returning 1, 2, 3... to the application."""
+    counter = itertools.count(1)
+    app.jinja_env.globals["count"] = lambda: next(counter)
+
+    return app
+
+
+@pytest.fixture
+def app(mvc_app):
+    return counting(mvc_app)
+
+
+def render(app, path="/callbacks", template=TEMPLATE, ttl=60):
+    with app.test_request_context(path):
+        return render_template_string(template, ttl=ttl)
+
+
+def test_fragment_is_rendered_once(app):
+    """Test that a cached fragment is served without rendering it again."""
+    assert render(app) == "<nav>1</nav>"
+    assert render(app) == "<nav>1</nav>"
+
+
+def test_fragments_are_keyed_on_the_endpoint(app):
+    """Test that the same key in different actions caches different fragments."""
+    assert render(app, "/callbacks") == "<nav>1</nav>"
+    assert render(app, "/callbacks/1") == "<nav>2</nav>"
+    assert render(app, "/callbacks/2") == "<nav>2</nav>"
+
+
+def test_fragment_expires_after_its_ttl(app):
+    """Test that an expired fragment is rendered again."""
+    assert render(app, ttl=0) == "<nav>1</nav>"
+    assert render(app, ttl=0) == "<nav>2</nav>"
+
+
+def test_default_ttl_and_escaping(app):
+    """Test that the TTL is optional and escaped output is not escaped again."""
+    template = "{% cache 'name' %}{{ '<b>' }}{% endcache %}"
+
+    assert render(app, template=template) == "&lt;b&gt;"
+    assert render(app, template=template) == "&lt;b&gt;"
+
+
+def test_invalidating_the_controller_expires_its_fragments(app, mvc):
+    """Test that fragments follow the cache generation of the controller."""
+    render(app)
+
+    mvc.invalidate_cache("callbacks")
+
+    assert render(app) == "<nav>2</nav>"
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_CACHE_SIZE=3)])
+def test_invalidation_survives_cache_pressure(app, mvc):
+    """Test that evicting fragments never brings back an invalidated one."""
+    cache = get_cache(app)
+
+    for version in range(1, 4):
+        mvc.invalidate_cache("callbacks")
+        assert render(app) == f"<nav>{version}</nav>"
+        mvc.invalidate_cache("callbacks")
+        # Fragments cached by other controllers
+        for other in range(2):
+            cache.set(f"flask_mvc:fragment:other:{version}:{other}", "cached")
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_CACHE_SIZE=2)])
+def test_memory_backend_evicts_fragments(app):
+    """Test that the in-process backend keeps at most its size."""
+    template = "{% cache key %}{{ count() }}{% endcache %}"
+
+    with app.test_request_context("/callbacks"):
+        for key in ("a", "b", "c"):
+            render_template_string(template, key=key)
+        assert render_template_string(template, key="a") == "4"
+
+    assert len(app.extensions["flask_mvc.cache"]) == 2
+
+
+class FakeClient:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+def test_shared_backend_stores_fragments(create_mvc_app):
+    """Test that fragments are stored in the backend shared by the workers."""
+    client = FakeClient()
+    app = counting(create_mvc_app(FLASK_MVC_CACHE_BACKEND=client)[0])
+
+    render(app)
+    other = counting(create_mvc_app(FLASK_MVC_CACHE_BACKEND=client)[0])
+
+    assert isinstance(app.extensions["flask_mvc.cache"], ClientCache)
+    assert render(other) == "<nav>1</nav>"
+    assert list(client.values) == ["flask_mvc:fragment:callbacks.index:0:nav"]
+
+
+def test_extension_is_registered_on_an_existing_environment():
+    """Test that the extension is added when the environment already exists."""
+    app = Flask("tests.app")
+    app.jinja_env
+    FlaskMVC(app, path="tests.app")
+
+    assert FragmentCacheExtension.identifier in app.jinja_env.extensions
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_CACHE_BACKEND=MemoryCache())])
+def test_fragment_outside_a_request(app):
+    """Test that fragments also render outside requests, e.g. in emails."""
+
+    with app.app_context():
+        assert render_template_string(TEMPLATE, ttl=5) == "<nav>1</nav>"
+        assert render_template_string(TEMPLATE, ttl=5) == "<nav>1</nav>"
@@ -8,7 +8,11 @@ import markupsafe
 import pytest
 from flask import render_template_string, url_for
 
-from flask_mvc.helpers.html.input_method_helper import InputMethodHelper
+from flask_mvc.core.exceptions import InvalidMethodError
+from flask_mvc.helpers.html.input_method_helper import (
+    InputMethodHelper,
+    input_hidden_method,
+)
 from tests.app.models.message import Message
 
 # Input Method Helper Tests
@@ -82,6 +86,32 @@ def test_input_hidden_method_invalid_method():
         helper.input_hidden_method("INVALID")
 
 
+def test_input_hidden_method_patch():
+    """Test input_hidden_method with PATCH."""
+    result = input_hidden_method("patch")
+
+    assert isinstance(result, markupsafe.Markup)
+    assert str(result) == "<input type='hidden' name='_method' value=PATCH>"
+
+
+def test_input_hidden_method_unknown_method_error():
+    """Test that unknown methods raise an error naming the supported ones."""
+    with pytest.raises(InvalidMethodError) as error:
+        input_hidden_method("get")
+
+    assert str(error.value) == (
+        "Unknown method 'get' for a form method override, "
+        "expected one of PUT, PATCH, DELETE"
+    )
+    with pytest.raises(InvalidMethodError):
+        input_hidden_method(None)
+
+
+def test_input_hidden_method_is_precomputed():
+    """Test that every call returns the same Markup object."""
+    assert input_hidden_method("put") is InputMethodHelper().input_hidden_method("PUT")
+
+
 def test_markup_safety():
     """Test that returned markup is safe for template rendering."""
     helper = InputMethodHelper()
@@ -128,7 +158,9 @@ def test_method_override_template_function(client):
 
 def test_method_override_middleware_configuration(app):
     """Test that method override middleware is properly configured."""
-    from method_override.wsgi_method_override import MethodOverrideMiddleware
+    from flask_mvc.middlewares.http.method_override_middleware import (
+        MethodOverrideMiddleware,
+    )
 
     assert isinstance(app.wsgi_app, MethodOverrideMiddleware)
 
@@ -227,6 +259,7 @@ def test_helper_function_injection(app):
 
         assert "method" in context
         assert callable(context["method"])
+        assert context["method"] is input_hidden_method
 
 
 def test_helper_function_in_template_context(client):
@@ -0,0 +1,110 @@
+"""
+Tests for convention-based implicit template rendering.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from flask_mvc.core.view_templates import VIEW_TEMPLATES_EXTENSION
+from tests.app.controllers.pages_controller import PagesController
+
+VIEWS = Path(__file__).parent / "app" / "views"
+
+
+def views(root_path):
+    """Copy the views of tests.app to root_path, adding the pages templates."""
+    shutil.copytree(VIEWS, root_path / "views")
+    (root_path / "views" / "pages").mkdir()
+    (root_path / "views" / "pages" / "index.html").write_text("<h1>{{ title }}</h1>")
+    (root_path / "views" / "pages" / "show.html").write_text(
+        "{{ page }} {{ _draft is defined }}"
+    )
+
+    return str(root_path)
+
+
+def routes(router):
+    router.all("pages", only="index show create edit")
+
+
+@pytest.fixture
+def app(create_mvc_app, tmp_path):
+    return create_mvc_app(root_path=views(tmp_path), routes=routes)[0]
+
+
+def test_returned_dict_renders_the_action_template(app):
+    """Test that a dict renders views/<controller>/<action>.html with its keys."""
+    response = app.test_client().get("/pages")
+
+    assert response.get_data(as_text=True) == "<h1>Pages</h1>"
+    assert response.mimetype == "text/html"
+    assert response.headers["X-Pages"] == "1"
+
+
+def test_none_renders_the_controller_attributes(app):
+    """Test that returning None renders the public attributes of the instance."""
+    response = app.test_client().get("/pages/7")
+
+    assert response.get_data(as_text=True) == "7 False"
+
+
+def test_actions_without_template_are_unchanged(app):
+    """Test that dicts without a template are still sent as JSON."""
+    created = app.test_client().post("/pages")
+    edited = app.test_client().get("/pages/7/edit")
+
+    assert (created.status_code, created.json) == (201, {"created": True})
+    assert edited.get_data(as_text=True) == "editing 7"
+
+
+def test_template_is_resolved_once_per_endpoint(app, tmp_path):
+    """Test that later requests reuse the template without searching for it."""
+    client = app.test_client()
+    client.get("/pages")
+    (tmp_path / "views" / "pages" / "index.html").unlink()
+
+    assert client.get("/pages").get_data(as_text=True) == "<h1>Pages</h1>"
+    assert set(app.extensions[VIEW_TEMPLATES_EXTENSION]._templates) == {"pages.index"}
+
+
+def test_templates_are_reloaded_when_auto_reload_is_on(create_mvc_app, tmp_path):
+    """Test that edits are picked up with TEMPLATES_AUTO_RELOAD."""
+    app, _ = create_mvc_app(
+        root_path=views(tmp_path), routes=routes, TEMPLATES_AUTO_RELOAD=True
+    )
+    client = app.test_client()
+    client.get("/pages")
+    (tmp_path / "views" / "pages" / "index.html").write_text("<h2>{{ title }}</h2>")
+
+    assert client.get("/pages").get_data(as_text=True) == "<h2>Pages</h2>"
+
+
+def test_warmup_resolves_the_templates(create_mvc_app, tmp_path):
+    """Test that warmup resolves the template of every action ahead of time."""
+    app, mvc = create_mvc_app(root_path=views(tmp_path), routes=routes)
+
+    mvc.warmup(["pages"])
+
+    assert set(app.extensions[VIEW_TEMPLATES_EXTENSION]._templates) == {
+        "pages.index",
+        "pages.show",
+        "pages.create",
+        "pages.edit",
+    }
+
+
+def test_option_enables_every_controller(create_mvc_app, tmp_path, monkeypatch):
+    """Test the FLASK_MVC_IMPLICIT_RENDER option, and singleton controllers."""
+    monkeypatch.delattr(PagesController, "implicit_render")
+    monkeypatch.delattr(PagesController, "lifecycle")
+    disabled, _ = create_mvc_app(root_path=views(tmp_path / "off"), routes=routes)
+    enabled, _ = create_mvc_app(
+        root_path=views(tmp_path / "on"), routes=routes, FLASK_MVC_IMPLICIT_RENDER=True
+    )
+
+    assert disabled.test_client().get("/pages").json == {"title": "Pages"}
+    assert enabled.test_client().get("/pages").get_data(as_text=True) == (
+        "<h1>Pages</h1>"
+    )
+    assert enabled.test_client().get("/pages/7").get_data(as_text=True) == " False"
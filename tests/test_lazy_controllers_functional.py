@@ -0,0 +1,115 @@
+"""
+Tests for lazy controller loading and the warmup API.
+"""
+
+import threading
+
+from flask import Flask
+
+from flask_mvc import FlaskMVC
+from tests.app.controllers.callbacks_controller import CallbacksController
+
+
+def create_lazy_app(**config):
+    app = Flask(__name__)
+    app.config.update(FLASK_MVC_LAZY_CONTROLLERS=True, **config)
+    mvc = FlaskMVC(app, path="tests.app")
+
+    return app, mvc
+
+
+def test_controllers_are_not_loaded_at_boot():
+    """Test that lazy controllers are only registered as proxies."""
+    app, mvc = create_lazy_app()
+
+    assert not any(controller.loaded for controller in mvc.controllers.values())
+    assert "callbacks.index" in app.view_functions
+
+
+def test_controller_is_loaded_on_first_hit():
+    """Test that the first request loads only the controller it hits."""
+    app, mvc = create_lazy_app()
+    proxy = app.view_functions["health.index"]
+
+    response = app.test_client().get("/api/v1/health")
+
+    assert response.json == {"status": "OK"}
+    assert mvc.controllers["health"].loaded
+    assert not mvc.controllers["messages"].loaded
+    assert app.view_functions["health.index"] is not proxy
+
+
+def test_lazy_controller_runs_callbacks():
+    """Test that callbacks of lazy controllers run from the first request."""
+    app, _ = create_lazy_app()
+    client = app.test_client()
+
+    assert client.get("/callbacks").text == "before request message"
+    assert client.get("/callbacks/1").headers["from_after_request"] == "yes"
+
+
+def test_lazy_controller_with_pooled_lifecycle(monkeypatch):
+    """Test that lifecycle hooks of lazy controllers run on their blueprint."""
+    monkeypatch.setattr(
+        CallbacksController, "reset", lambda self: vars(self).clear(), raising=False
+    )
+    app, mvc = create_lazy_app(FLASK_MVC_CONTROLLER_LIFECYCLE="pool")
+    client = app.test_client()
+
+    assert client.get("/callbacks").text == "before request message"
+    assert client.get("/callbacks").text == "before request message"
+    assert mvc.controllers["callbacks"].lifecycle._pool.qsize() == 1
+
+
+def test_concurrent_first_hits_load_controller_once():
+    """Test that concurrent first requests import and bind the controller once."""
+    app, mvc = create_lazy_app()
+    controller = mvc.controllers["health"]
+    imports = []
+    original_import = controller._import
+
+    def counting_import():
+        imports.append(1)
+        return original_import()
+
+    controller._import = counting_import
+    barrier = threading.Barrier(8)
+    responses = []
+
+    def hit():
+        barrier.wait()
+        responses.append(app.test_client().get("/api/v1/health").status_code)
+
+    threads = [threading.Thread(target=hit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert imports == [1]
+    assert responses == [200] * 8
+
+
+def test_warmup_loads_selected_controllers():
+    """Test that warmup force-loads the given controllers."""
+    _, mvc = create_lazy_app()
+
+    assert mvc.warmup(["health"])["controllers"] == ["health"]
+    assert mvc.controllers["health"].loaded
+    assert not mvc.controllers["callbacks"].loaded
+
+
+def test_warmup_loads_every_controller():
+    """Test that warmup without arguments loads every controller."""
+    _, mvc = create_lazy_app()
+
+    mvc.warmup()
+
+    assert all(controller.loaded for controller in mvc.controllers.values())
+
+
+def test_eager_controllers_are_loaded_at_boot(app):
+    """Test that controllers are loaded at boot by default."""
+    mvc = app.extensions["flask_mvc"]
+
+    assert all(controller.loaded for controller in mvc.controllers.values())
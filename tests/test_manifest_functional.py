@@ -0,0 +1,165 @@
+"""
+Tests for the route manifest and the 'flask mvc routes compile' command.
+"""
+
+import json
+import sys
+
+import pytest
+
+from flask_mvc.core.manifest import RouteManifest
+from flask_mvc.middlewares.http.router_middleware import RouterMiddleware
+
+
+@pytest.fixture
+def manifest_file(tmp_path, mvc):
+    manifest_file = str(tmp_path / "routes.manifest.json")
+    mvc.compile_manifest(manifest_file)
+
+    return manifest_file
+
+
+def rewrite(manifest_file, change):
+    data = json.loads(open(manifest_file).read())
+    change(data)
+    open(manifest_file, "w").write(json.dumps(data))
+
+
+def test_routes_compile_command(tmp_path, mvc_app):
+    """Test that the CLI command writes the manifest."""
+    output = tmp_path / "manifest.json"
+
+    result = mvc_app.test_cli_runner().invoke(
+        args=["mvc", "routes", "compile", "--output", str(output)]
+    )
+
+    assert result.exit_code == 0
+    assert "Route manifest written" in result.output
+    assert output.exists()
+
+
+def test_manifest_records_routes_and_callbacks(manifest_file):
+    """Test the content of a compiled manifest."""
+    manifest = RouteManifest.load(manifest_file)
+
+    endpoints = {route["endpoint"] for route in manifest.routes}
+    assert {"messages.index", "health.index", "callbacks.show"} <= endpoints
+    assert manifest.controllers["callbacks"]["callbacks"] == {
+        "before_request": {"callback": "before_set_page", "actions": ["index"]},
+        "after_request": {"callback": "after_set_page", "actions": ["show"]},
+    }
+    assert manifest.controllers["health"]["callbacks"] == {}
+    assert any(source.endswith("routes.py") for source in manifest.data["sources"])
+
+
+def test_boot_from_fresh_manifest_skips_routes_module(
+    create_mvc_app, manifest_file, monkeypatch
+):
+    """Test that a fresh manifest replaces the evaluation of routes.py."""
+
+    def fail(module_name):
+        raise AssertionError("routes.py should not be evaluated")
+
+    monkeypatch.setattr(RouterMiddleware, "module_routes", staticmethod(fail))
+    app, mvc = create_mvc_app(manifest=manifest_file)
+
+    assert mvc.routes.endpoint("messages.update").methods == ("PUT", "PATCH")
+    assert app.test_client().get("/api/v1/health").json == {"status": "OK"}
+    assert app.test_client().get("/callbacks").text == "before request message"
+
+
+def test_boot_from_manifest_matches_routes_module(create_mvc_app, manifest_file):
+    """Test that booting from the manifest registers the same rules."""
+    from_manifest, _ = create_mvc_app(manifest=manifest_file)
+    from_routes, _ = create_mvc_app()
+
+    assert sorted(map(str, from_manifest.url_map.iter_rules())) == sorted(
+        map(str, from_routes.url_map.iter_rules())
+    )
+
+
+def test_changed_source_makes_manifest_stale(create_mvc_app, manifest_file, caplog):
+    """Test that a source whose content changed invalidates the manifest."""
+
+    def change_sources(data):
+        for signature in data["sources"].values():
+            signature["mtime_ns"] = 0
+            signature["sha256"] = "0" * 64
+
+    rewrite(manifest_file, change_sources)
+    manifest = RouteManifest.load(manifest_file)
+
+    assert not manifest.is_fresh("tests.app")
+
+    _, mvc = create_mvc_app(manifest=manifest_file)
+    assert "is stale" in caplog.text
+    assert mvc.bindings == {}
+    assert mvc.routes.endpoint("messages.index") is not None
+
+
+def test_touched_source_with_same_content_is_fresh(manifest_file):
+    """Test that a source with a new mtime but the same content is still fresh."""
+
+    def touch_sources(data):
+        for signature in data["sources"].values():
+            signature["mtime_ns"] = 0
+
+    rewrite(manifest_file, touch_sources)
+
+    assert RouteManifest.load(manifest_file).is_fresh("tests.app")
+
+
+def test_manifest_is_fresh_once_deployed_elsewhere(tmp_path, monkeypatch):
+    """Test that sources are recorded relative to the package of the application."""
+    build = tmp_path / "build" / "shipped_app"
+    build.mkdir(parents=True)
+    (build / "__init__.py").write_text("")
+    (build / "routes.py").write_text("ROUTES = []\n")
+    monkeypatch.syspath_prepend(str(build.parent))
+    manifest = RouteManifest.build("shipped_app", [], {})
+
+    assert list(manifest.data["sources"]) == ["routes.py"]
+
+    deployed = tmp_path / "deploy"
+    deployed.mkdir()
+    build.rename(deployed / "shipped_app")
+    monkeypatch.delitem(sys.modules, "shipped_app")
+    monkeypatch.setattr(sys, "path", [str(deployed), *sys.path[1:]])
+
+    assert manifest.is_fresh("shipped_app")
+    (deployed / "shipped_app" / "routes.py").write_text("ROUTES = [1]\n")
+    assert not manifest.is_fresh("shipped_app")
+
+
+def test_other_version_makes_manifest_stale(manifest_file):
+    """Test that manifests written by another format version are stale."""
+    rewrite(manifest_file, lambda data: data.update(version=0))
+
+    assert not RouteManifest.load(manifest_file).is_fresh("tests.app")
+
+
+def test_invalid_manifest_is_ignored(create_mvc_app, tmp_path, caplog):
+    """Test that an unreadable manifest falls back to routes.py."""
+    manifest_file = tmp_path / "routes.manifest.json"
+    manifest_file.write_text("not json")
+
+    _, mvc = create_mvc_app(manifest=str(manifest_file))
+
+    assert "Ignoring route manifest" in caplog.text
+    assert mvc.routes.endpoint("messages.index") is not None
+
+
+def test_missing_manifest_is_ignored(create_mvc_app, tmp_path):
+    """Test that a configured but missing manifest falls back to routes.py."""
+    _, mvc = create_mvc_app(manifest=str(tmp_path / "missing.json"))
+
+    assert mvc.routes.endpoint("messages.index") is not None
+
+
+def test_lazy_controllers_without_callbacks_skip_hooks(create_mvc_app, manifest_file):
+    """Test that the manifest lets lazy controllers skip their blueprint hooks."""
+    app, _ = create_mvc_app(manifest=manifest_file, FLASK_MVC_LAZY_CONTROLLERS=True)
+
+    assert "health" not in app.before_request_funcs
+    assert "callbacks" in app.before_request_funcs
+    assert app.test_client().get("/api/v1/health").json == {"status": "OK"}
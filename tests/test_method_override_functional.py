@@ -0,0 +1,188 @@
+"""
+Tests for the built-in method override middleware.
+"""
+
+import io
+
+import pytest
+from werkzeug.routing import BaseConverter
+
+from flask_mvc.middlewares.http.method_override_middleware import (
+    MethodOverrideMiddleware,
+    ReplayStream,
+)
+from flask_mvc.middlewares.http.route_table import Route
+
+
+class SlugConverter(BaseConverter):
+    regex = r"[a-z0-9-]+"
+
+
+@pytest.fixture
+def mvc_routes():
+    def routes(router):
+        router.all("uploads", only="create update delete")
+        router.post("/drafts", "uploads#create")
+
+    return routes
+
+
+@pytest.fixture
+def client(mvc_app):
+    return mvc_app.test_client()
+
+
+def multipart(*parts):
+    body = b""
+    for name, value, filename in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename:
+            disposition += f'; filename="{filename}"'
+        body += (
+            f"--boundary\r\nContent-Disposition: {disposition}\r\n\r\n{value}\r\n"
+        ).encode()
+    return body + b"--boundary--\r\n"
+
+
+def test_urlencoded_override_keeps_the_form(client):
+    """Test that the fields read looking for the method reach the action."""
+    response = client.post(
+        "/uploads/1", data={"title": "a & b", "_method": "put", "body": "text"}
+    )
+
+    assert response.json == {
+        "method": "PUT",
+        "form": {"title": "a & b", "_method": "put", "body": "text"},
+        "files": {},
+    }
+
+
+def test_multipart_override_keeps_files(client):
+    """Test that multipart forms are overridden and their files left readable."""
+    response = client.post(
+        "/uploads/1",
+        data={
+            "_method": "PATCH",
+            "title": "hello",
+            "file": (io.BytesIO(b"x"), "a.txt"),
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.json["method"] == "PATCH"
+    assert response.json["form"]["title"] == "hello"
+    assert response.json["files"] == {"file": "x"}
+
+
+def test_delete_override_drops_the_body(client):
+    """Test that DELETE overrides do not pass the form on."""
+    response = client.post("/uploads/1", data={"_method": "DELETE", "title": "a"})
+
+    assert response.json == {"method": "DELETE", "form": {}, "files": {}}
+
+
+def test_header_override(client):
+    """Test that the X-HTTP-Method-Override header is honored first."""
+    response = client.post(
+        "/uploads/1",
+        data={"_method": "DELETE", "title": "a"},
+        headers={"X-HTTP-Method-Override": "PUT"},
+    )
+
+    assert response.json["method"] == "PUT"
+    assert response.json["form"]["title"] == "a"
+
+
+def test_paths_without_override_routes_are_untouched(client):
+    """Test that only paths with a PUT, PATCH or DELETE route are rewritten."""
+    response = client.post("/drafts", data={"_method": "PUT"})
+
+    assert response.json["method"] == "POST"
+
+
+def test_methods_not_routed_are_ignored(client):
+    """Test that the method must be accepted by a route of the path."""
+    response = client.post("/uploads", data={"_method": "DELETE"})
+
+    assert response.json["method"] == "POST"
+
+
+def test_routes_with_custom_converters(create_mvc_app):
+    """Test that the URL converters of the application are used to match paths."""
+    app, _ = create_mvc_app(
+        routes=lambda router: router.put("/items/<slug:id>", "uploads#update"),
+        converters={"slug": SlugConverter},
+    )
+    client = app.test_client()
+
+    assert client.post("/items/a-b", data={"_method": "PUT"}).json["method"] == "PUT"
+    assert client.post("/items/A_B", data={"_method": "PUT"}).status_code == 404
+
+
+def scan(body, content_type, chunk_size=4096, length=True):
+    """Run the middleware over a raw body, returning the environ and the body."""
+    seen = {}
+
+    def app(environ, start_response):
+        seen.update(environ)
+        return []
+
+    middleware = MethodOverrideMiddleware(
+        app,
+        [Route(["PUT"], "/uploads/<id>", "uploads", "update")],
+        chunk_size=chunk_size,
+    )
+    stream = io.BytesIO(body)
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": "/uploads/1",
+        "CONTENT_TYPE": content_type,
+        "wsgi.input": stream,
+    }
+    if length:
+        environ["CONTENT_LENGTH"] = str(len(body))
+    middleware(environ, None)
+
+    return seen, stream.tell()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_urlencoded_body_is_read_until_the_field(chunk_size):
+    """Test that the field is found across chunks, without reading past it."""
+    body = b"title=" + b"a" * 20 + b"&_method=PUT&rest=" + b"b" * 1000
+
+    environ, position = scan(body, "application/x-www-form-urlencoded", chunk_size)
+
+    assert environ["REQUEST_METHOD"] == "PUT"
+    assert position < 50 + chunk_size
+    assert environ["wsgi.input"].read() == body
+
+
+def test_multipart_body_is_read_until_the_first_file():
+    """Test that multipart scanning stops at a file, keeping the method untouched."""
+    body = multipart(("file", "x" * 10000, "a.txt"), ("_method", "PUT", None))
+
+    environ, position = scan(body, "multipart/form-data; boundary=boundary", 64)
+
+    assert environ["REQUEST_METHOD"] == "POST"
+    assert position < 200
+    assert environ["wsgi.input"].read() == body
+
+
+def test_bodies_without_length_are_not_read():
+    """Test that streaming bodies are passed on as they are."""
+    body = b"_method=PUT"
+
+    environ, position = scan(body, "application/x-www-form-urlencoded", length=False)
+
+    assert environ["REQUEST_METHOD"] == "POST"
+    assert position == 0
+
+
+def test_replay_stream_reads_lines_across_the_boundary():
+    """Test that lines spanning the replayed bytes and the stream are joined."""
+    stream = ReplayStream(b"first\nsec", io.BytesIO(b"ond\nthird"))
+
+    assert list(stream) == [b"first\n", b"second\n", b"third"]
+    assert ReplayStream(b"abc", io.BytesIO(b"def")).read(4) == b"abcd"
+    assert ReplayStream(b"abcdef", io.BytesIO(b"")).readline(2) == b"ab"
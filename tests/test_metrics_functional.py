@@ -0,0 +1,162 @@
+"""
+Tests for the per-action request metrics and their Prometheus exposition.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from flask_mvc.core.metrics import MetricsRegistry, render_prometheus
+
+
+def test_metrics_are_off_by_default(mvc_app, mvc):
+    """Test that no hook nor endpoint is registered unless metrics are enabled."""
+    assert mvc.metrics is None
+    assert "flask_mvc_metrics" not in mvc_app.view_functions
+    assert mvc_app.test_client().get("/metrics").status_code == 404
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_METRICS=True)])
+def test_metrics_record_actions_statuses_and_callbacks(mvc_app, mvc):
+    """Test the metrics recorded for the requests to an action."""
+    client = mvc_app.test_client()
+
+    client.get("/callbacks")
+    client.get("/callbacks")
+    client.get("/api/v1/health")
+
+    actions = mvc.metrics.collect()["actions"]
+    index = actions["callbacks.index"]
+    assert index["statuses"] == {"2xx": 2}
+    assert index["in_flight"] == 0
+    assert sum(index["duration"][0]) == 2
+    assert index["duration"][1] >= index["action_duration"][1]
+    assert index["callbacks"]["before_request"] > 0
+    assert index["callbacks"]["after_request"] == 0
+    assert actions["health.index"]["statuses"] == {"2xx": 1}
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_METRICS=True)])
+def test_metrics_record_failed_requests(mvc_app, mvc):
+    """Test that requests raising an error are recorded as 5xx."""
+
+    def fail():
+        raise RuntimeError("boom")
+
+    mvc_app.view_functions["health.index"] = fail
+    assert mvc_app.test_client().get("/api/v1/health").status_code == 500
+
+    health = mvc.metrics.collect()["actions"]["health.index"]
+    assert health["statuses"] == {"5xx": 1}
+    assert health["in_flight"] == 0
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_METRICS=True)])
+def test_metrics_endpoint_serves_prometheus_text(mvc_app):
+    """Test the /metrics endpoint."""
+    client = mvc_app.test_client()
+    client.get("/callbacks")
+
+    response = client.get("/metrics")
+    body = response.get_data(as_text=True)
+
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert (
+        'flask_mvc_requests_total{controller="callbacks",action="index",status="2xx"} 1'
+        in body
+    )
+    assert (
+        'flask_mvc_request_duration_seconds_bucket{controller="callbacks",'
+        'action="index",le="+Inf"} 1' in body
+    )
+    assert (
+        'flask_mvc_requests_in_flight{controller="callbacks",action="index"} 0' in body
+    )
+    assert 'hook="before_request"' in body
+    assert "flask_mvc_metrics" not in body
+
+
+@pytest.mark.parametrize(
+    "mvc_config", [dict(FLASK_MVC_METRICS=True, FLASK_MVC_METRICS_ENDPOINT=None)]
+)
+def test_metrics_endpoint_can_be_disabled(mvc_app, mvc):
+    """Test that metrics can be recorded without being served."""
+    assert mvc_app.test_client().get("/metrics").status_code == 404
+    assert mvc.metrics is not None
+
+
+def test_metrics_shards_are_summed():
+    """Test that each thread records into its own shard, folded when it ends."""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    recorded = threading.Barrier(5)
+    done = threading.Event()
+
+    def serve():
+        registry.started("messages", "index")
+        registry.finished("messages", "index", 200, 0.5, {"action": 0.4})
+        recorded.wait()
+        done.wait()
+
+    threads = [threading.Thread(target=serve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    recorded.wait()
+    running = registry.collect()["actions"]["messages.index"]
+    assert len(registry._shards) == 4
+
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(registry._shards) == 0
+    messages = registry.collect()["actions"]["messages.index"]
+    assert messages == running
+    assert messages["duration"][0] == [0, 4, 0]
+    assert messages["action_duration"][0] == [0, 4, 0]
+    assert messages["statuses"] == {"2xx": 4}
+
+
+def test_metrics_shards_of_ended_threads_are_released():
+    """Test that a thread per request does not leave a shard per request."""
+    registry = MetricsRegistry(buckets=(1.0,))
+
+    for _ in range(50):
+        thread = threading.Thread(
+            target=registry.finished, args=("messages", "index", 200, 0.5, {})
+        )
+        thread.start()
+        thread.join()
+
+    assert len(registry._shards) == 0
+    assert registry.collect()["actions"]["messages.index"]["statuses"] == {"2xx": 50}
+
+
+def test_metrics_are_merged_across_processes(tmp_path):
+    """Test multiprocess aggregation through the shared directory."""
+    registry = MetricsRegistry(buckets=(1.0,), directory=str(tmp_path))
+    registry.started("messages", "index")
+    registry.finished("messages", "index", 404, 0.5, {})
+
+    # A snapshot written by another, no longer running, worker
+    worker = registry.snapshot()
+    worker["pid"] = 2**22 + 1
+    worker["actions"]["messages.index"]["in_flight"] = 3
+    (tmp_path / "metrics-other.json").write_text(json.dumps(worker))
+
+    actions = registry.collect()["actions"]
+
+    assert actions["messages.index"]["statuses"] == {"4xx": 2}
+    assert actions["messages.index"]["duration"][0] == [2, 0]
+    assert actions["messages.index"]["in_flight"] == 0
+    assert os.path.exists(tmp_path / f"metrics-{os.getpid()}.json")
+
+
+def test_render_prometheus_escapes_labels():
+    """Test that label values are escaped."""
+    registry = MetricsRegistry(buckets=(1.0,))
+    registry.started('a"b', "index")
+    registry.finished('a"b', "index", 200, 0.1, {})
+
+    assert 'controller="a\\"b"' in render_prometheus(registry.collect())
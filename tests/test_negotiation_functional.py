@@ -0,0 +1,268 @@
+"""
+Tests for respond_to content negotiation and the JSON providers.
+"""
+
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.datastructures import MultiDict
+
+from flask_mvc import FlaskMVC
+from flask_mvc.core.exceptions import ConfigurationError
+from flask_mvc.core.json_provider import (
+    MsgspecProvider,
+    OrjsonProvider,
+    json_provider_class,
+)
+from flask_mvc.middlewares.negotiation_middleware import NegotiationMiddleware
+from tests.app.controllers.products_controller import ProductsController
+
+VIEWS = Path(__file__).parent / "app" / "views"
+
+JSON = {"Accept": "application/json"}
+HTML = {"Accept": "text/html,application/xhtml+xml,*/*;q=0.8"}
+
+
+def routes(router):
+    router.all("products", only="index show create delete")
+
+
+@pytest.fixture
+def create_app(create_mvc_app, tmp_path):
+    """Boot applications whose views, in tmp_path, include the products templates."""
+    shutil.copytree(VIEWS, tmp_path / "views")
+    (tmp_path / "views" / "products").mkdir()
+    (tmp_path / "views" / "products" / "index.html").write_text(
+        "{% for product in products %}<li>{{ product.name }}</li>{% endfor %}"
+    )
+    (tmp_path / "views" / "products" / "show.html").write_text(
+        "<h1>{{ data.name }}</h1>"
+    )
+
+    def create(**config):
+        app, _ = create_mvc_app(root_path=str(tmp_path), routes=routes, **config)
+
+        return app
+
+    return create
+
+
+@pytest.fixture
+def client(create_app):
+    return create_app().test_client()
+
+
+def test_html_renders_the_action_template(client):
+    """Test that HTML requests render views/<controller>/<action>.html."""
+    response = client.get("/products", headers=HTML)
+
+    assert response.mimetype == "text/html"
+    assert response.get_data(as_text=True) == "<li>Lamp</li><li>Desk</li>"
+    assert response.vary.as_set() == {"accept"}
+
+
+def test_json_serializes_models(client):
+    """Test that JSON requests get the data, models converted with to_dict."""
+    response = client.get("/products", headers=JSON)
+
+    assert response.mimetype == "application/json"
+    assert response.json == {
+        "products": [{"id": 1, "name": "Lamp"}, {"id": 2, "name": "Desk"}]
+    }
+
+
+def test_status_and_headers_are_kept(client):
+    """Test that the status and headers returned with the data are applied."""
+    html = client.get("/products/2", headers=HTML)
+    json = client.get("/products/2", headers=JSON)
+
+    assert html.get_data(as_text=True) == "<h1>Desk</h1>"
+    assert json.json == {"id": 2, "name": "Desk"}
+    assert html.headers["X-Product"] == json.headers["X-Product"] == "2"
+
+
+def test_first_format_answers_requests_without_accept(client):
+    """Test that the first declared format is the default."""
+    assert client.get("/products").mimetype == "text/html"
+
+
+@pytest.mark.parametrize("headers", [{}, {"Accept": "*/*"}])
+def test_json_answers_when_the_template_is_missing(create_app, tmp_path, headers):
+    """Test that HTML is skipped for actions without a template."""
+    client = create_app().test_client()
+    (tmp_path / "views" / "products" / "index.html").unlink()
+
+    response = client.get("/products", headers=headers)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.json["products"][0] == {"id": 1, "name": "Lamp"}
+
+
+def test_html_only_requests_need_the_template(create_app, tmp_path):
+    """Test that a missing template still fails requests accepting only HTML."""
+    app = create_app()
+    (tmp_path / "views" / "products" / "index.html").unlink()
+    app.testing = False
+
+    response = app.test_client().get("/products", headers={"Accept": "text/html"})
+
+    assert response.status_code == 500
+
+
+def test_unacceptable_formats_get_406(client):
+    """Test that requests accepting none of the formats are refused."""
+    assert client.get("/products", headers={"Accept": "text/csv"}).status_code == 406
+
+
+def test_cached_responses_vary_on_the_accept_header(create_app, monkeypatch):
+    """Test that the cache of a negotiated action keeps one response per format."""
+    monkeypatch.setattr(ProductsController, "cache", dict(actions="index"), False)
+    client = create_app().test_client()
+
+    assert client.get("/products", headers=HTML).mimetype == "text/html"
+    assert client.get("/products", headers=JSON).mimetype == "application/json"
+    assert client.get("/products", headers=HTML).mimetype == "text/html"
+
+
+def test_strings_and_undeclared_actions_are_untouched(client):
+    """Test that only data returned by declared actions is negotiated."""
+    created = client.post("/products", headers=JSON)
+    deleted = client.delete("/products/1", headers=HTML)
+
+    assert (created.status_code, created.get_data(as_text=True)) == (201, "created")
+    assert deleted.mimetype == "application/json"
+    assert "Vary" not in deleted.headers
+
+
+@pytest.mark.parametrize("provider", ["default", None])
+def test_models_are_converted_with_other_providers(create_app, provider):
+    """Test that models are converted for providers that do not know them."""
+    app = create_app(FLASK_MVC_JSON_PROVIDER=provider)
+
+    response = app.test_client().get("/products/1", headers=JSON)
+
+    assert type(app.json) is DefaultJSONProvider
+    assert response.json == {"id": 1, "name": "Lamp"}
+
+
+def test_invalid_formats_are_refused():
+    """Test that unknown formats fail when the controller is registered."""
+
+    class XmlController:
+        respond_to = dict(formats="xml")
+
+    with pytest.raises(ConfigurationError, match="xml"):
+        NegotiationMiddleware(Flask(__name__), "xml", XmlController)
+
+
+# JSON providers
+
+
+def test_auto_provider_prefers_orjson(mvc_app):
+    """Test that the fastest installed library is used by default."""
+    pytest.importorskip("orjson")
+
+    assert type(mvc_app.json) is OrjsonProvider
+
+
+def test_auto_provider_keeps_an_application_provider():
+    """Test that a provider chosen by the application is not replaced."""
+
+    class CustomProvider(DefaultJSONProvider):
+        pass
+
+    app = Flask("tests.app")
+    app.json = CustomProvider(app)
+    FlaskMVC(app, path="tests.app")
+
+    assert type(app.json) is CustomProvider
+
+
+def test_provider_options_are_carried_over():
+    """Test that options set on the previous provider are kept."""
+    pytest.importorskip("orjson")
+    app = Flask("tests.app")
+    app.json.sort_keys = False
+    app.config["FLASK_MVC_JSON_PROVIDER"] = "orjson"
+    FlaskMVC(app, path="tests.app")
+
+    assert app.json.sort_keys is False
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"b":1,"a":2}'
+
+
+def test_provider_class_option():
+    """Test that a JSONProvider subclass can be given."""
+    assert json_provider_class(DefaultJSONProvider) is DefaultJSONProvider
+    assert json_provider_class(None) is None
+
+
+def test_invalid_provider_option():
+    """Test that unknown providers are refused."""
+    with pytest.raises(ConfigurationError, match="simplejson"):
+        json_provider_class("simplejson")
+
+
+def test_missing_provider_library(monkeypatch):
+    """Test that a provider whose library is missing is refused."""
+    monkeypatch.setattr("flask_mvc.core.json_provider.msgspec", None)
+
+    with pytest.raises(ConfigurationError, match="not installed"):
+        json_provider_class("msgspec")
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("provider_class", [OrjsonProvider, MsgspecProvider])
+def test_fast_provider_matches_flask_output(provider_class, ensure_ascii):
+    """Test that responses are byte for byte those of Flask's provider."""
+    module = "orjson" if provider_class is OrjsonProvider else "msgspec"
+    pytest.importorskip(module)
+    app = Flask(__name__)
+    provider, default = provider_class(app), DefaultJSONProvider(app)
+    provider.ensure_ascii = default.ensure_ascii = ensure_ascii
+    data = {"b": {"key": "café ☕ 😀"}, "a": [1.5, None, True, 0.1, 2**40]}
+
+    with app.app_context():
+        body = provider.response(data).get_data()
+        assert body == default.response(data).get_data()
+    assert body.isascii() is ensure_ascii
+    assert provider.dumps(data) == default.dumps(data, separators=(",", ":"))
+    assert provider.loads('{"a": 1}', parse_int=str) == {"a": "1"}
+    assert provider.dumps([1], indent=2) == "[\n  1\n]"
+
+
+def test_orjson_falls_back_as_flask():
+    """Test that subclasses of builtin types and large integers are serialized."""
+    pytest.importorskip("orjson")
+    app = Flask(__name__)
+    data = {"b": MultiDict([("key", 1), ("key", 2)]), "big": 2**70}
+
+    assert OrjsonProvider(app).dumps(data) == DefaultJSONProvider(app).dumps(
+        data, separators=(",", ":")
+    )
+
+
+def test_orjson_keeps_http_dates():
+    """Test that datetimes keep the format of Flask's provider."""
+    pytest.importorskip("orjson")
+    app = Flask(__name__)
+
+    assert OrjsonProvider(app).dumps(datetime(2024, 1, 1)) == (
+        '"Mon, 01 Jan 2024 00:00:00 GMT"'
+    )
+
+
+def test_pretty_responses_in_debug_mode():
+    """Test that debug mode still indents JSON responses."""
+    pytest.importorskip("orjson")
+    app = Flask(__name__)
+    app.debug = True
+
+    with app.app_context():
+        response = OrjsonProvider(app).response({"a": 1})
+
+    assert response.get_data(as_text=True) == '{\n  "a": 1\n}\n'
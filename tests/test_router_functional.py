@@ -5,10 +5,11 @@ Comprehensive tests for the Flask MVC routing system.
 from collections import Counter
 
 import pytest
-from flask import url_for
+from flask import Flask, url_for
 
-from flask_mvc import Router
+from flask_mvc import FlaskMVC, Router
 from flask_mvc.middlewares.http.router_middleware import RouterMiddleware
+from tests.app import create_app
 
 # Router System Tests
 
@@ -235,3 +236,96 @@ def test_nested_namespace_paths():
 
     routes = RouterMiddleware._method_route()
     assert routes["test"][0].path == "/api/v1/test"
+
+
+# Route Table Tests
+
+
+def test_compile_freezes_registered_routes():
+    """Test that routes registered after compiling are not in the table."""
+    RouterMiddleware.ROUTES.clear()
+    Router.get("/users", "users#index")
+
+    table = Router.compile()
+    Router.post("/users", "users#create")
+
+    assert len(table) == 1
+    assert table.endpoint("users.create") is None
+
+
+def test_app_route_table(client):
+    """Test that the application keeps the route table compiled at init."""
+    table = client.application.extensions["flask_mvc"].routes
+
+    assert table.endpoint("messages.update").methods == ("PUT", "PATCH")
+    assert table.find("GET", "/api/v1/health").endpoint == "health.index"
+
+
+# Per-Application Router Tests
+
+
+def test_repeated_create_app_does_not_duplicate_routes(app):
+    """Test that each application gets its own, identical set of routes."""
+    first, second = create_app(), create_app()
+
+    first_rules = sorted(rule.rule for rule in first.url_map.iter_rules())
+    second_rules = sorted(rule.rule for rule in second.url_map.iter_rules())
+
+    assert first_rules == second_rules
+    assert len(first.extensions["flask_mvc"].routes) == len(
+        app.extensions["flask_mvc"].routes
+    )
+
+
+def test_facade_routes_do_not_leak_into_applications():
+    """Test that routes declared on the Router facade stay out of applications."""
+    RouterMiddleware.ROUTES.clear()
+    Router.get("/leaked", "leaked#index")
+
+    application = create_app()
+
+    assert application.extensions["flask_mvc"].routes.endpoint("leaked.index") is None
+
+
+def test_router_instances_are_isolated():
+    """Test that routes declared on a router instance stay in that instance."""
+    RouterMiddleware.ROUTES.clear()
+    router = RouterMiddleware()
+    router.all("products", only="index show")
+    router.namespace("/api").get("/health", "health#index")
+
+    assert len(router.ROUTES) == 3
+    assert RouterMiddleware.ROUTES == []
+    assert router.compile().endpoint("health.index").path == "/api/health"
+
+
+def test_activated_router_receives_facade_routes():
+    """Test that facade calls go to the router being activated."""
+    router = RouterMiddleware()
+
+    with router.activate():
+        Router.get("/users", "users#index")
+
+    assert [route.endpoint for route in router.ROUTES] == ["users.index"]
+
+
+def test_compile_removes_duplicated_routes():
+    """Test that routes declared twice appear once in the route table."""
+    router = RouterMiddleware()
+    router.all("products")
+    router.all("products")
+
+    assert len(router.compile()) == 7
+
+
+def test_flask_mvc_router_routes_are_registered():
+    """Test that routes declared on a FlaskMVC router are added to its app."""
+    mvc = FlaskMVC()
+    mvc.router.get("/api/v1/status", "health#index")
+    application = Flask(__name__)
+    mvc.init_app(application, path="tests.app")
+
+    rules = {rule.rule for rule in application.url_map.iter_rules()}
+
+    assert "/api/v1/status" in rules
+    assert "/messages" in rules
@@ -0,0 +1,91 @@
+"""
+Tests for the Server-Timing header.
+"""
+
+import pytest
+from flask import render_template_string
+
+from flask_mvc.core.server_timing import MethodOverrideTimer, record, timing
+
+
+def names(header):
+    return [entry.split(";")[0] for entry in header.split(", ")]
+
+
+def test_server_timing_is_off_by_default(mvc_app):
+    """Test that the header and the method override timer are opt-in."""
+    assert not isinstance(mvc_app.wsgi_app, MethodOverrideTimer)
+    assert "Server-Timing" not in mvc_app.test_client().get("/callbacks").headers
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_SERVER_TIMING=True)])
+def test_server_timing_breaks_down_controller_phases(mvc_app):
+    """Test the phases sent for a request with callbacks."""
+    header = mvc_app.test_client().get("/callbacks").headers["Server-Timing"]
+
+    assert names(header) == ["method-override", "before-callbacks", "action", "total"]
+
+    header = mvc_app.test_client().get("/callbacks/1").headers["Server-Timing"]
+    assert names(header) == ["method-override", "action", "after-callbacks", "total"]
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_SERVER_TIMING=True)])
+def test_server_timing_only_for_controller_actions(mvc_app):
+    """Test that other endpoints are not timed."""
+
+    @mvc_app.route("/ping")
+    def ping():
+        return "pong"
+
+    assert "Server-Timing" not in mvc_app.test_client().get("/ping").headers
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_SERVER_TIMING=True)])
+def test_server_timing_template_rendering_and_custom_timings(mvc_app):
+    """Test template rendering and timings added by controllers."""
+
+    def index():
+        with timing("db", 'Load "health"'):
+            pass
+        record("cache", 0.002)
+        record("cache", 0.001)
+        record("bad name", 0.001)
+        return render_template_string("{{ status }}", status="ok")
+
+    mvc_app.view_functions["health.index"] = index
+    response = mvc_app.test_client().get("/api/v1/health")
+    header = response.headers["Server-Timing"]
+
+    assert response.get_data(as_text=True) == "ok"
+    assert names(header) == [
+        "method-override",
+        "render",
+        "db",
+        "cache",
+        "bad-name",
+        "total",
+    ]
+    assert "db;dur=" in header
+    assert 'desc="Load \\"health\\""' in header
+    assert "cache;dur=3.000" in header
+
+
+def test_timings_outside_requests_are_ignored(mvc_app):
+    """Test that custom timings are no-ops without a timeline."""
+    with mvc_app.test_request_context():
+        with timing("db"):
+            pass
+
+    record("db", 1.0)
+
+
+def test_method_override_is_still_applied(create_mvc_app):
+    """Test that the timed middleware still rewrites the method."""
+    app, _ = create_mvc_app(
+        routes=lambda router: router.put("/things", "health#index"),
+        FLASK_MVC_SERVER_TIMING=True,
+    )
+
+    response = app.test_client().post("/things", data={"_method": "PUT"})
+
+    assert response.json == {"status": "OK"}
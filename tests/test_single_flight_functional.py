@@ -0,0 +1,109 @@
+"""
+Tests for single-flight coalescing of identical concurrent requests.
+"""
+
+import threading
+import time
+
+import pytest
+from tests.app.controllers.hot_controller import HotController
+
+
+@pytest.fixture(autouse=True)
+def reset_controller():
+    HotController.calls = []
+    HotController.release = threading.Event()
+    yield
+    HotController.release.set()
+
+
+def routes(router):
+    router.all("hot", only="show")
+
+
+@pytest.fixture
+def mvc_routes():
+    # Tests declaring on HotController boot their application after patching it
+    return routes
+
+
+def concurrent_get(app, paths, headers=None):
+    """Send the requests concurrently, releasing the action once they all wait."""
+    responses = [None] * len(paths)
+    headers = headers or [{}] * len(paths)
+
+    def get(index, path):
+        responses[index] = app.test_client().get(path, headers=headers[index])
+
+    threads = [
+        threading.Thread(target=get, args=(index, path))
+        for index, path in enumerate(paths)
+    ]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + 5
+    while not HotController.calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)
+    HotController.release.set()
+
+    for thread in threads:
+        thread.join()
+    return responses
+
+
+def test_identical_requests_share_one_execution(mvc_app):
+    """Test that concurrent identical requests run the action once."""
+    responses = concurrent_get(mvc_app, ["/hot/1"] * 5)
+
+    assert HotController.calls == ["1"]
+    assert [response.json for response in responses] == [{"id": "1", "call": 1}] * 5
+
+
+def test_different_requests_are_not_coalesced(mvc_app):
+    """Test that view arguments and query strings tell requests apart."""
+    concurrent_get(mvc_app, ["/hot/1", "/hot/2", "/hot/1?page=2"])
+
+    assert sorted(HotController.calls) == ["1", "1", "2"]
+
+
+def test_negotiated_requests_are_coalesced_by_accept_header(create_mvc_app, monkeypatch):
+    """Test that actions negotiated with respond_to vary on the Accept header."""
+    monkeypatch.setattr(HotController, "respond_to", dict(formats="json"), False)
+    accept = ["application/json", "text/html", "application/json"]
+    app, _ = create_mvc_app(routes=routes)
+
+    responses = concurrent_get(
+        app, ["/hot/1"] * 3, [{"Accept": value} for value in accept]
+    )
+
+    assert HotController.calls == ["1", "1"]
+    assert [response.status_code for response in responses] == [200, 406, 200]
+
+
+def test_followers_run_the_action_after_the_timeout(create_mvc_app, monkeypatch):
+    """Test that waiting requests give up after the timeout."""
+    monkeypatch.setattr(
+        HotController, "single_flight", dict(actions="show", timeout=0.05)
+    )
+    app, _ = create_mvc_app(routes=routes)
+
+    responses = concurrent_get(app, ["/hot/1"] * 3)
+
+    assert HotController.calls == ["1"] * 3
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_followers_run_the_action_when_the_leader_fails(mvc_app):
+    """Test that an error of the first execution is not shared."""
+    responses = concurrent_get(mvc_app, ["/hot/error"] * 3)
+
+    assert HotController.calls == ["error"] * 3
+    assert all(response.status_code == 500 for response in responses)
+
+
+def test_single_flight_is_opt_in(mvc_app):
+    """Test that controllers without the declaration are not coalesced."""
+    assert mvc_app.test_client().get("/callbacks").status_code == 200
+    assert mvc_app.view_functions["callbacks.index"].__name__ == "index"
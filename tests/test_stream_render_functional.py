@@ -0,0 +1,88 @@
+"""
+Tests for streamed template rendering with stream_render.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+VIEWS = Path(__file__).parent / "app" / "views"
+
+REPORT = (
+    "<table>{% for row in rows %}<tr><td>{{ row }}</td>"
+    "<td>{{ request.path }}</td></tr>{% endfor %}</table>"
+)
+
+
+def routes(router):
+    router.all("reports", only="index")
+    router.put("/reports", "reports#index")
+
+
+@pytest.fixture
+def app(create_mvc_app, tmp_path):
+    shutil.copytree(VIEWS, tmp_path / "views")
+    (tmp_path / "views" / "reports").mkdir()
+    (tmp_path / "views" / "reports" / "index.html").write_text(REPORT)
+
+    app, _ = create_mvc_app(
+        root_path=str(tmp_path), routes=routes, FLASK_MVC_SERVER_TIMING=True
+    )
+
+    return app
+
+
+def test_response_is_streamed_from_the_views_folder(app):
+    """Test that the template is rendered while the response is sent."""
+    response = app.test_client().get("/reports?rows=2")
+
+    assert response.is_streamed
+    assert response.mimetype == "text/html"
+    assert response.get_data(as_text=True) == (
+        "<table><tr><td>0</td><td>/reports</td></tr>"
+        "<tr><td>1</td><td>/reports</td></tr></table>"
+    )
+
+
+def test_after_callbacks_run_on_the_headers(app):
+    """Test that after_request callbacks and middlewares see streamed responses."""
+    response = app.test_client().get("/reports")
+
+    assert response.headers["X-Report"] == "streamed"
+    assert "Server-Timing" in response.headers
+
+
+@pytest.mark.parametrize("chunk_size, chunks", [(0, 5 * 100 + 2), (1000, 4), (10**6, 1)])
+def test_chunk_size(app, chunk_size, chunks):
+    """Test that the rendered pieces are grouped into chunks of the chunk size."""
+    response = app.test_client().get(
+        f"/reports?rows=100&chunk_size={chunk_size}", buffered=False
+    )
+
+    body = list(response.response)
+
+    assert len(body) == chunks
+    assert all(len(chunk) >= chunk_size for chunk in body[:-1])
+    response.close()
+
+
+def test_default_chunk_size_is_configured(app):
+    """Test that the chunk size defaults to FLASK_MVC_STREAM_CHUNK_SIZE."""
+    app.config["FLASK_MVC_STREAM_CHUNK_SIZE"] = 50
+
+    response = app.test_client().get("/reports?rows=10", buffered=False)
+
+    chunks = list(response.response)
+
+    assert len(chunks) > 1
+    assert all(50 <= len(chunk) < 70 for chunk in chunks[:-1])
+    response.close()
+
+
+def test_method_override_reaches_streamed_actions(app):
+    """Test that overridden requests are streamed too."""
+    response = app.test_client().post("/reports?rows=1", data={"_method": "PUT"})
+
+    assert response.headers["X-Report"] == "streamed"
+    assert "<td>0</td>" in response.get_data(as_text=True)
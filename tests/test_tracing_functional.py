@@ -0,0 +1,119 @@
+"""
+Tests for the tracing of callbacks and actions.
+"""
+
+import pytest
+
+from flask_mvc.core.timeline import current_timeline
+from flask_mvc.core.tracing import Span, Tracer
+
+
+def test_tracing_is_off_by_default(mvc_app, mvc):
+    """Test that no tracer is used unless tracing is enabled."""
+    assert mvc.tracer is None
+    assert "Server-Timing" not in mvc_app.test_client().get("/callbacks").headers
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_TRACING=True)])
+def test_callbacks_and_actions_run_in_spans(mvc_app, mvc):
+    """Test the spans recorded for a request."""
+    spans = []
+    mvc.tracer.add_listener(spans.append)
+
+    mvc_app.test_client().get("/callbacks")
+
+    assert [span.name for span in spans] == [
+        "callbacks.before_set_page",
+        "callbacks.index",
+    ]
+    assert spans[0].attributes == {
+        "flask_mvc.controller": "callbacks",
+        "flask_mvc.hook": "before_request",
+        "flask_mvc.callback": "before_set_page",
+    }
+    assert spans[1].attributes["flask_mvc.action"] == "index"
+    assert all(not span.is_recording() for span in spans)
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_TRACING=True)])
+def test_request_summary_of_callbacks_and_action(mvc_app):
+    """Test the per-request summary and the spans kept on the timeline."""
+    summaries = []
+
+    @mvc_app.after_request
+    def keep_summary(response):
+        timeline = current_timeline()
+        summaries.append((timeline.summary(), [span.name for span in timeline.spans]))
+        return response
+
+    mvc_app.test_client().get("/callbacks/1")
+
+    summary, spans = summaries[0]
+    assert summary["callbacks"] > 0
+    assert summary["total"] >= summary["callbacks"] + summary["action"]
+    assert spans == ["callbacks.show", "callbacks.after_set_page"]
+
+
+@pytest.mark.parametrize("mvc_config", [dict(FLASK_MVC_TRACING=True, DEBUG=True)])
+def test_server_timing_header_in_debug_mode(mvc_app):
+    """Test that the summary is sent in debug mode."""
+    header = mvc_app.test_client().get("/callbacks").headers["Server-Timing"]
+
+    assert "before-callbacks;dur=" in header
+    assert ", action;dur=" in header
+
+
+def test_server_timing_header_can_be_forced(create_mvc_app):
+    """Test the FLASK_MVC_TRACING_HEADERS option."""
+    app, _ = create_mvc_app(FLASK_MVC_TRACING=True, FLASK_MVC_TRACING_HEADERS=True)
+    assert "Server-Timing" in app.test_client().get("/callbacks").headers
+
+    app, _ = create_mvc_app(FLASK_MVC_TRACING=True)
+    assert "Server-Timing" not in app.test_client().get("/callbacks").headers
+
+
+def test_custom_tracer_is_used(create_mvc_app):
+    """Test that an OpenTelemetry-like tracer can be configured."""
+    started = []
+
+    class OtelTracer(Tracer):
+        def start_as_current_span(self, name, attributes=None, **kwargs):
+            started.append(name)
+            return super().start_as_current_span(name, attributes, **kwargs)
+
+    tracer = OtelTracer()
+    app, mvc = create_mvc_app(FLASK_MVC_TRACING=True, FLASK_MVC_TRACER=tracer)
+    app.test_client().get("/messages")
+
+    assert mvc.tracer is tracer
+    assert started == ["messages.index"]
+
+
+def test_spans_are_nested_and_record_exceptions():
+    """Test span nesting and failure recording."""
+    tracer = Tracer()
+    spans = []
+    tracer.add_listener(spans.append)
+
+    with pytest.raises(ValueError):
+        with tracer.start_as_current_span("outer"):
+            with tracer.start_as_current_span("inner", attributes={"key": 1}) as span:
+                span.set_attribute("other", 2)
+                raise ValueError("boom")
+
+    inner, outer = spans
+    assert inner.parent is outer
+    assert inner.attributes == {"key": 1, "other": 2}
+    assert inner.status == outer.status == "ERROR"
+    assert inner.events[0]["exception.type"] == "ValueError"
+    assert outer.duration >= inner.duration
+
+
+def test_span_duration_while_recording():
+    """Test that a running span reports its duration so far."""
+    span = Span("running")
+
+    assert span.is_recording()
+    assert span.duration >= 0
+    span.end()
+    assert not span.is_recording()
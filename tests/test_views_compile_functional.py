@@ -0,0 +1,89 @@
+"""
+Tests for the template bytecode cache and the 'flask mvc views compile' command.
+"""
+
+import shutil
+from pathlib import Path
+
+from flask import Flask, render_template
+from jinja2 import FileSystemBytecodeCache
+
+from flask_mvc import FlaskMVC
+
+VIEWS = Path(__file__).parent / "app" / "views"
+
+
+def copy_views(tmp_path):
+    shutil.copytree(VIEWS, tmp_path / "views")
+    return tmp_path
+
+
+def test_bytecode_cache_is_off_by_default(mvc_app):
+    """Test that templates are compiled by each worker unless configured."""
+    assert mvc_app.jinja_env.bytecode_cache is None
+
+
+def test_bytecode_cache_directory(tmp_path, create_mvc_app):
+    """Test that a directory relative to the application root is created and used."""
+    app, _ = create_mvc_app(
+        copy_views(tmp_path), FLASK_MVC_TEMPLATE_BYTECODE_CACHE="cache/jinja"
+    )
+
+    with app.test_request_context():
+        render_template("base.html")
+
+    cache = app.jinja_env.bytecode_cache
+    assert isinstance(cache, FileSystemBytecodeCache)
+    assert cache.directory == str(tmp_path / "cache" / "jinja")
+    assert len(list((tmp_path / "cache" / "jinja").iterdir())) == 1
+
+
+def test_bytecode_cache_instance_on_existing_environment(tmp_path):
+    """Test that a cache instance is also set on an already created environment."""
+    cache = FileSystemBytecodeCache(str(tmp_path))
+    app = Flask("tests.app")
+    app.jinja_env
+    app.config["FLASK_MVC_TEMPLATE_BYTECODE_CACHE"] = cache
+
+    FlaskMVC(app, path="tests.app")
+
+    assert app.jinja_env.bytecode_cache is cache
+
+
+def test_views_compile_command_fills_the_bytecode_cache(tmp_path, create_mvc_app):
+    """Test that the command compiles every template into the cache."""
+    app, _ = create_mvc_app(
+        copy_views(tmp_path), FLASK_MVC_TEMPLATE_BYTECODE_CACHE="cache"
+    )
+
+    result = app.test_cli_runner().invoke(args=["mvc", "views", "compile"])
+
+    assert result.exit_code == 0
+    assert "Compiled 4 template(s)" in result.output
+    assert len(list((tmp_path / "cache").iterdir())) == 4
+
+
+def test_views_compile_command_without_bytecode_cache(mvc_app):
+    """Test that templates are still checked without a cache."""
+    result = mvc_app.test_cli_runner().invoke(args=["mvc", "views", "compile"])
+
+    assert result.exit_code == 0
+    assert "Set FLASK_MVC_TEMPLATE_BYTECODE_CACHE" in result.output
+
+
+def test_views_compile_command_fails_on_broken_templates(tmp_path, create_mvc_app):
+    """Test that every broken template is reported and the command fails."""
+    root = copy_views(tmp_path)
+    (root / "views" / "broken.html").write_text("{% if %}\n")
+    (root / "views" / "messages" / "unclosed.html").write_text(
+        "\n{% for message in messages %}"
+    )
+    app, mvc = create_mvc_app(root)
+
+    result = app.test_cli_runner().invoke(args=["mvc", "views", "compile"])
+
+    assert result.exit_code == 1
+    assert "broken.html: line 1:" in result.output
+    assert "messages/unclosed.html: line 2:" in result.output
+    assert "2 template(s) failed to compile" in result.output
+    assert len(mvc.compile_views()["templates"]) == 4
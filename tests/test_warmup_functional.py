@@ -0,0 +1,63 @@
+"""
+Tests for FlaskMVC.warmup, used before forking workers.
+"""
+
+import gc
+
+import pytest
+from flask import Flask
+
+from flask_mvc import FlaskMVC
+
+
+@pytest.fixture
+def mvc_config():
+    return {"FLASK_MVC_LAZY_CONTROLLERS": True}
+
+
+def test_warmup_compiles_every_view_template(mvc_app, mvc):
+    """Test that every template under the views folder is compiled."""
+    report = mvc.warmup()
+
+    assert set(report["templates"]) == {
+        "base.html",
+        "messages/edit.html",
+        "messages/index.html",
+        "messages/show.html",
+    }
+    cached = {name for _, name in mvc_app.jinja_env.cache.keys()}
+    assert cached >= set(report["templates"])
+
+
+def test_warmup_grows_small_template_cache():
+    """Test that the Jinja cache is grown to hold every compiled template."""
+    app = Flask("tests.app")
+    app.jinja_options = {"cache_size": 2}
+    mvc = FlaskMVC(app, path="tests.app")
+
+    mvc.warmup()
+
+    assert app.jinja_env.cache.capacity == 4
+
+
+def test_warmup_without_templates(mvc):
+    """Test that template compilation can be skipped."""
+    assert mvc.warmup(templates=False)["templates"] == []
+
+
+def test_warmup_loads_controllers_and_builds_url_map(mvc_app, mvc):
+    """Test that controllers are loaded and the URL matcher is built."""
+    report = mvc.warmup(templates=False)
+
+    assert set(report["controllers"]) == {"messages", "callbacks", "health", "posts"}
+    assert all(controller.loaded for controller in mvc.controllers.values())
+    assert not mvc_app.url_map._remap
+
+
+def test_warmup_freezes_garbage_collector(mvc):
+    """Test that warmup can move every tracked object to the permanent generation."""
+    try:
+        mvc.warmup(templates=False, freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,86 @@
+"""Unit tests for the compiled route table."""
+
+import dataclasses
+
+import pytest
+
+from flask_mvc.middlewares.http.route_table import Route, RouteTable
+
+
+@pytest.fixture
+def table():
+    return RouteTable(
+        [
+            Route(("GET",), "/messages", "messages", "index"),
+            Route(("POST",), "/messages", "messages", "create"),
+            Route(("PUT", "PATCH"), "/messages/<id>", "messages", "update"),
+            Route(("GET",), "/api/v1/health", "health", "index"),
+        ]
+    )
+
+
+class TestRoute:
+    """Test cases for Route records."""
+
+    def test_endpoint(self):
+        """Test that the endpoint is derived from controller and action."""
+        route = Route(("GET",), "/messages", "messages", "index")
+
+        assert route.endpoint == "messages.index"
+
+    def test_methods_are_stored_as_tuple(self):
+        """Test that methods given as a list are frozen into a tuple."""
+        route = Route(["PUT", "PATCH"], "/messages/<id>", "messages", "update")
+
+        assert route.methods == ("PUT", "PATCH")
+        assert route.method == ["PUT", "PATCH"]
+
+    def test_route_is_immutable(self):
+        """Test that routes cannot be modified."""
+        route = Route(("GET",), "/messages", "messages", "index")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            route.path = "/other"
+
+    def test_route_is_slotted(self):
+        """Test that routes do not carry a per-instance __dict__."""
+        route = Route(("GET",), "/messages", "messages", "index")
+
+        assert not hasattr(route, "__dict__")
+
+
+class TestRouteTable:
+    """Test cases for RouteTable."""
+
+    def test_groups_routes_by_controller(self, table):
+        """Test that routes are grouped by controller in declaration order."""
+        assert list(table.controllers) == ["messages", "health"]
+        assert [route.action for route in table.controllers["messages"]] == [
+            "index",
+            "create",
+            "update",
+        ]
+
+    def test_find_by_method_and_path(self, table):
+        """Test lookups by HTTP method and path."""
+        assert table.find("POST", "/messages").action == "create"
+        assert table.find("PATCH", "/messages/<id>").action == "update"
+        assert table.find("DELETE", "/messages/<id>") is None
+
+    def test_find_by_endpoint(self, table):
+        """Test lookups by endpoint."""
+        assert table.endpoint("health.index").path == "/api/v1/health"
+        assert table.endpoint("health.show") is None
+
+    def test_iteration_and_length(self, table):
+        """Test that the table iterates over every route."""
+        assert len(table) == 4
+        assert [route.endpoint for route in table][0] == "messages.index"
+
+    def test_table_is_immutable(self, table):
+        """Test that the table cannot be modified once compiled."""
+        with pytest.raises(AttributeError):
+            table.routes = ()
+
+        with pytest.raises(TypeError):
+            table.controllers["posts"] = ()